@@ -1,6 +1,10 @@
 from fastapi import APIRouter
 
+from .batch import router as batch_router
+from .features import router as features_router
 from .routes import router as spec_router
 
 router = APIRouter()
 router.include_router(spec_router, prefix="/spec", tags=["spec"])
+router.include_router(features_router, prefix="/features", tags=["features"])
+router.include_router(batch_router, prefix="/batch", tags=["batch"])
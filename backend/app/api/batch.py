@@ -0,0 +1,36 @@
+"""Batch endpoint: several API calls in one round trip. All handlers typed; no untyped functions."""
+from fastapi import APIRouter, Depends, Request, Response
+
+from app.core import ApiResponse, fail
+from app.core.config import Settings, get_settings
+from app.schemas import BatchRequest, BatchResult
+from app.services import BATCH_PATH, run_batch
+
+router = APIRouter()
+
+
+@router.post("", response_model=ApiResponse[BatchResult])
+async def batch(
+    body: BatchRequest,
+    request: Request,
+    settings: Settings = Depends(get_settings),
+) -> Response | ApiResponse[None]:
+    """Run several API calls in this process and answer them in one envelope.
+
+    Each item is dispatched through the app as if sent on its own and gets its own status
+    and ok/data/error. Reads run concurrently; a write waits for the items before it and
+    holds back the items after it, so results match sending the items one by one.
+    Streaming endpoints (/spec/export, /spec/events) cannot be batched.
+    """
+    if len(body.requests) > settings.batch_max_items:
+        return fail(f"At most {settings.batch_max_items} requests per batch")
+    prefix = request.scope["path"].removesuffix(BATCH_PATH)
+    content = await run_batch(
+        request.app,
+        request.scope,
+        prefix,
+        body.requests,
+        concurrency=settings.batch_concurrency,
+        timeout=settings.batch_item_timeout_seconds,
+    )
+    return Response(content=content, media_type="application/json")
@@ -0,0 +1,97 @@
+"""Plan-auto feature progress endpoints. All handlers typed; no untyped functions."""
+from fastapi import APIRouter, Depends, Path, Query
+
+from app.core import ApiJSONResponse, ApiResponse, fail, success
+from app.core.deps import get_database
+from app.db import Database
+from app.schemas import (
+    FeatureImportResult,
+    FeatureList,
+    FeaturePassesUpdate,
+    FeatureProgress,
+    FeatureState,
+)
+from app.services import (
+    export_feature_list,
+    import_feature_list,
+    list_features,
+    project_progress,
+    set_passes,
+    set_passes_at,
+    spec_progress,
+)
+
+router = APIRouter()
+
+
+@router.get("", response_model=ApiResponse[list[FeatureState]])
+async def list_all(
+    project: str | None = Query(None, description="Only this project's features"),
+    spec_id: int | None = Query(None, description="Only features linked to this spec"),
+    db: Database = Depends(get_database),
+) -> ApiJSONResponse:
+    """Features in list order."""
+    return ApiJSONResponse(success(await list_features(db, project=project, spec_id=spec_id)))
+
+
+@router.patch("/{feature_id}", response_model=ApiResponse[FeatureState])
+async def update_feature(
+    body: FeaturePassesUpdate,
+    feature_id: int = Path(..., description="Row id in the features table"),
+    db: Database = Depends(get_database),
+) -> ApiResponse[FeatureState] | ApiResponse[None]:
+    """Record one feature's verification state. Safe to call concurrently for different features."""
+    feature = await set_passes(db, feature_id, body.passes)
+    return success(feature) if feature is not None else fail("Feature not found")
+
+
+@router.patch("/projects/{project}/{position}", response_model=ApiResponse[FeatureState])
+async def update_feature_at(
+    body: FeaturePassesUpdate,
+    project: str = Path(..., description="Plan-auto project"),
+    position: int = Path(..., ge=0, description="Index in the project's feature_list.json"),
+    db: Database = Depends(get_database),
+) -> ApiResponse[FeatureState] | ApiResponse[None]:
+    """Same as PATCH /{feature_id}, addressing the feature by its place in feature_list.json."""
+    feature = await set_passes_at(db, project, position, body.passes)
+    return success(feature) if feature is not None else fail("Feature not found")
+
+
+@router.get("/projects/{project}/progress", response_model=ApiResponse[FeatureProgress])
+async def get_project_progress(
+    project: str = Path(..., description="Plan-auto project"),
+    db: Database = Depends(get_database),
+) -> ApiResponse[FeatureProgress]:
+    """Completion counters of a project (one row lookup, independent of the number of features)."""
+    return success(await project_progress(db, project))
+
+
+@router.get("/specs/{spec_id}/progress", response_model=ApiResponse[FeatureProgress])
+async def get_spec_progress(
+    spec_id: int = Path(..., description="Row id in the specs table"),
+    db: Database = Depends(get_database),
+) -> ApiResponse[FeatureProgress]:
+    """Completion counters of the features linked to a spec."""
+    return success(await spec_progress(db, spec_id))
+
+
+@router.get("/projects/{project}/feature-list", response_model=ApiResponse[FeatureList])
+async def export_project(
+    project: str = Path(..., description="Plan-auto project"),
+    db: Database = Depends(get_database),
+) -> ApiJSONResponse | ApiResponse[None]:
+    """The project's features in feature_list.json form."""
+    feature_list = await export_feature_list(db, project)
+    if feature_list is None:
+        return fail("Project not found")
+    return ApiJSONResponse(success(feature_list))
+
+
+@router.put("/feature-list", response_model=ApiResponse[FeatureImportResult])
+async def import_project(
+    body: FeatureList,
+    replace: bool = Query(False, description="Take passes from the document even where stored passes is true"),
+    db: Database = Depends(get_database),
+) -> ApiResponse[FeatureImportResult]:
+    """Import a feature_list.json document (the project is named in the body)."""
+    return success(await import_feature_list(db, body, replace=replace))
@@ -1,13 +1,168 @@
 """Spec-related endpoints. All handlers typed; no untyped functions."""
-from fastapi import APIRouter, Depends
+from datetime import datetime
 
-from app.core import ApiResponse, success
-from app.core.deps import get_placeholder_dep
+from fastapi import APIRouter, Depends, Query, Request, Response
+from fastapi.responses import StreamingResponse
+
+from app.core import ApiJSONResponse, ApiResponse, Page, decode_cursor, fail, success
+from app.core.config import Settings, get_settings
+from app.core.deps import (
+    get_database,
+    get_list_cache,
+    get_spec_snapshot,
+    get_spec_sync,
+    get_spec_watcher,
+)
+from app.core.http_cache import ResponseCache, cache_key
+from app.db import Database
+from app.schemas import SpecChangeEvent, SpecExportRecord, SpecItem, SpecSearchHit
+from app.services import (
+    EVENT_STREAM_MEDIA_TYPE,
+    EXPORT_MEDIA_TYPE,
+    ExportQuery,
+    SearchQuery,
+    SnapshotView,
+    SpecQuery,
+    SpecSnapshot,
+    SpecSync,
+    SpecWatcher,
+    iter_events,
+    iter_export,
+    list_page,
+    search_specs,
+)
 
 router = APIRouter()
 
 
-@router.get("/list", response_model=ApiResponse[list[dict[str, str]]])
-def list_specs(dep: str = Depends(get_placeholder_dep)) -> ApiResponse[list[dict[str, str]]]:
-    """List active specs. Demonstrates dependency injection."""
-    return success([{"id": "1", "title": "Example", "status": "active"}])
+@router.get("/list", response_model=ApiResponse[Page[SpecItem]])
+async def list_specs(
+    request: Request,
+    status: str | None = Query(None, description="Only specs with this status"),
+    domain: str | None = Query(None, description="Only specs in this domain"),
+    updated_from: datetime | None = Query(None, description="Updated at or after (UTC if naive)"),
+    updated_to: datetime | None = Query(None, description="Updated before (UTC if naive)"),
+    cursor: str | None = Query(None, description="next_cursor from the previous page"),
+    limit: int = Query(50, ge=1, le=200, description="Page size"),
+    db: Database = Depends(get_database),
+    spec_sync: SpecSync = Depends(get_spec_sync),
+    cache: ResponseCache = Depends(get_list_cache),
+    snapshot: SpecSnapshot | None = Depends(get_spec_snapshot),
+) -> Response | ApiResponse[None]:
+    """List specs newest first, one keyset page at a time.
+
+    Pages are cut from the snapshot shared by all workers (SQL if it is disabled or
+    unavailable) and cached serialized until the data changes; clients revalidate with
+    If-None-Match / If-Modified-Since and get 304 when unchanged.
+    """
+    try:
+        after = decode_cursor(cursor) if cursor else None
+    except ValueError as e:
+        return fail(str(e))
+    await spec_sync.sync(db)
+    view: SnapshotView | None = None
+    if snapshot is not None:
+        try:
+            view = await snapshot.ensure(db)
+        except OSError:
+            view = None
+    key = cache_key(request)
+    # Read the version before querying: a concurrent sync then only makes the entry stale early.
+    # Snapshot generations are shared by all workers; negated, they never equal a sync version.
+    if view is not None:
+        version, last_modified = -view.generation, view.last_modified
+    else:
+        version, last_modified = spec_sync.version, spec_sync.last_modified
+    entry = cache.get(key, version)
+    if entry is not None:
+        return entry.respond(request)
+    query = SpecQuery(
+        limit=limit,
+        status=status,
+        domain=domain,
+        updated_from=updated_from,
+        updated_to=updated_to,
+        after=after,
+    )
+    if view is not None:
+        body = view.page_response(query)
+    else:
+        body = success(await list_page(db, query)).model_dump_json().encode()
+    return cache.put(key, version, body, last_modified).respond(request)
+
+
+@router.get("/search", response_model=ApiResponse[list[SpecSearchHit]])
+async def search(
+    q: str = Query(..., min_length=1, max_length=200, description="Terms separated by spaces; all must match"),
+    status: str | None = Query(None, description="Only specs with this status"),
+    domain: str | None = Query(None, description="Only specs in this domain"),
+    limit: int = Query(20, ge=1, le=100, description="Maximum number of hits"),
+    offset: int = Query(0, ge=0, le=1000, description="Hits to skip"),
+    db: Database = Depends(get_database),
+    spec_sync: SpecSync = Depends(get_spec_sync),
+) -> ApiJSONResponse | ApiResponse[None]:
+    """Full-text search over spec titles and content, best matches first, with highlighted snippets."""
+    query = SearchQuery(text=q, limit=limit, offset=offset, status=status, domain=domain)
+    if not query.terms():
+        return fail("Empty query")
+    await spec_sync.sync(db)
+    return ApiJSONResponse(success(await search_specs(db, query)))
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "content": {EXPORT_MEDIA_TYPE: {"schema": SpecExportRecord.model_json_schema()}},
+            "description": "One SpecExportRecord JSON object per line",
+        }
+    },
+)
+async def export_specs(
+    status: str | None = Query(None, description="Only specs with this status"),
+    domain: str | None = Query(None, description="Only specs in this domain"),
+    include_content: bool = Query(False, description="Include the full spec text"),
+    batch_size: int = Query(1000, ge=1, le=5000, description="Specs read and sent per chunk"),
+    db: Database = Depends(get_database),
+    spec_sync: SpecSync = Depends(get_spec_sync),
+) -> StreamingResponse:
+    """Stream all matching specs with their features as NDJSON (SpecExportRecord per line).
+
+    Bulk exports are the one exception to the ApiResponse envelope: wrapping would force the
+    whole result into memory before the first byte is sent.
+    """
+    await spec_sync.sync(db)
+    query = ExportQuery(batch_size=batch_size, include_content=include_content, status=status, domain=domain)
+    return StreamingResponse(
+        iter_export(db, query),
+        media_type=EXPORT_MEDIA_TYPE,
+        headers={"Content-Disposition": 'attachment; filename="specs.ndjson"'},
+    )
+
+
+@router.get(
+    "/events",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "content": {EVENT_STREAM_MEDIA_TYPE: {"schema": SpecChangeEvent.model_json_schema()}},
+            "description": "Server-sent `specs` events, each carrying one SpecChangeEvent",
+        }
+    },
+)
+async def spec_events(
+    watcher: SpecWatcher = Depends(get_spec_watcher),
+    settings: Settings = Depends(get_settings),
+) -> StreamingResponse:
+    """Push spec changes as they happen, instead of clients polling /list.
+
+    The first event has reset=true; after it, each event carries the specs written since
+    the previous one (coalesced if the client reads slowly). Like /export, the stream is
+    not wrapped in ApiResponse.
+    """
+    return StreamingResponse(
+        iter_events(watcher, settings.spec_events_heartbeat_seconds),
+        media_type=EVENT_STREAM_MEDIA_TYPE,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,165 @@
+"""Command line access to the backend database, for scripts and agents.
+
+    python -m app.cli features list [--project P] [--spec-id N]
+    python -m app.cli features pass P POSITION | --id N
+    python -m app.cli features fail P POSITION | --id N
+    python -m app.cli features progress (--project P | --spec-id N) [--check]
+    python -m app.cli features import [FILE] [--replace]
+    python -m app.cli features export P [--output FILE]
+
+Uses the same DATABASE_URL / SQLite settings as the API, so it can run next to a live
+server: writes go through the same transactions and counters as the HTTP endpoints.
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+from collections.abc import Awaitable, Callable, Sequence
+from pathlib import Path
+
+from pydantic import BaseModel, ValidationError
+
+from app.core.config import get_settings
+from app.db import Database, create_database
+from app.schemas import FeatureList
+from app.services import (
+    export_feature_list,
+    import_feature_list,
+    list_features,
+    project_progress,
+    set_passes,
+    set_passes_at,
+    spec_progress,
+)
+
+DEFAULT_FEATURE_LIST = Path("docs/plan_auto/feature_list.json")
+
+
+def _print(model: BaseModel | Sequence[BaseModel]) -> None:
+    if not isinstance(model, BaseModel):
+        print(json.dumps([m.model_dump(mode="json") for m in model], ensure_ascii=False, indent=2))
+    else:
+        print(model.model_dump_json(indent=2))
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
+
+
+async def _list(db: Database, args: argparse.Namespace) -> int:
+    _print(await list_features(db, project=args.project, spec_id=args.spec_id))
+    return 0
+
+
+async def _set(db: Database, args: argparse.Namespace) -> int:
+    passes = args.action == "pass"
+    if args.id is not None:
+        feature = await set_passes(db, args.id, passes)
+    elif args.project is not None and args.position is not None:
+        feature = await set_passes_at(db, args.project, args.position, passes)
+    else:
+        print("error: give PROJECT POSITION or --id", file=sys.stderr)
+        return 2
+    if feature is None:
+        print("error: feature not found", file=sys.stderr)
+        return 1
+    _print(feature)
+    return 0
+
+
+async def _progress(db: Database, args: argparse.Namespace) -> int:
+    if args.spec_id is not None:
+        progress = await spec_progress(db, args.spec_id)
+    elif args.project is not None:
+        progress = await project_progress(db, args.project)
+    else:
+        print("error: give --project or --spec-id", file=sys.stderr)
+        return 2
+    _print(progress)
+    return 0 if progress.complete or not args.check else 1
+
+
+async def _import(db: Database, args: argparse.Namespace) -> int:
+    path = Path(args.file)
+    try:
+        feature_list = FeatureList.model_validate_json(path.read_bytes())
+    except (OSError, ValidationError) as e:
+        print(f"error: cannot read {path}: {e}", file=sys.stderr)
+        return 1
+    _print(await import_feature_list(db, feature_list, replace=args.replace))
+    return 0
+
+
+async def _export(db: Database, args: argparse.Namespace) -> int:
+    feature_list = await export_feature_list(db, args.project)
+    if feature_list is None:
+        print(f"error: no features for project {args.project}", file=sys.stderr)
+        return 1
+    text = feature_list.model_dump_json(indent=2, exclude_none=True) + "\n"
+    if args.output:
+        _write_atomic(Path(args.output), text)
+    else:
+        sys.stdout.write(text)
+    return 0
+
+
+_ACTIONS: dict[str, Callable[[Database, argparse.Namespace], Awaitable[int]]] = {
+    "list": _list,
+    "pass": _set,
+    "fail": _set,
+    "progress": _progress,
+    "import": _import,
+    "export": _export,
+}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m app.cli", description="Backend database commands")
+    commands = parser.add_subparsers(dest="command", required=True)
+    features = commands.add_parser("features", help="Plan-auto feature progress")
+    actions = features.add_subparsers(dest="action", required=True)
+
+    list_p = actions.add_parser("list", help="List features as JSON")
+    list_p.add_argument("--project", default=None)
+    list_p.add_argument("--spec-id", type=int, default=None)
+
+    for name, help_text in (("pass", "Mark a feature as passing"), ("fail", "Mark a feature as not passing")):
+        set_p = actions.add_parser(name, help=help_text)
+        set_p.add_argument("project", nargs="?", default=None)
+        set_p.add_argument("position", nargs="?", type=int, default=None, help="Index in feature_list.json")
+        set_p.add_argument("--id", type=int, default=None, help="Row id instead of PROJECT POSITION")
+
+    progress_p = actions.add_parser("progress", help="Completion counters")
+    progress_p.add_argument("--project", default=None)
+    progress_p.add_argument("--spec-id", type=int, default=None)
+    progress_p.add_argument("--check", action="store_true", help="Exit with status 1 unless everything passes")
+
+    import_p = actions.add_parser("import", help="Import a feature_list.json")
+    import_p.add_argument("file", nargs="?", default=str(DEFAULT_FEATURE_LIST))
+    import_p.add_argument("--replace", action="store_true", help="Take passes from the file even where stored passes is true")
+
+    export_p = actions.add_parser("export", help="Export a project as feature_list.json")
+    export_p.add_argument("project")
+    export_p.add_argument("--output", default=None, help="Write here (atomically) instead of stdout")
+    return parser
+
+
+async def _run(args: argparse.Namespace) -> int:
+    db = create_database(get_settings())
+    await db.open()
+    try:
+        return await _ACTIONS[args.action](db, args)
+    finally:
+        await db.close()
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = build_parser().parse_args(argv)
+    sys.exit(asyncio.run(_run(args)))
+
+
+if __name__ == "__main__":
+    main()
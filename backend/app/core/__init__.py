@@ -1,4 +1,14 @@
-# Core: response schema, deps
-from .response import success, fail, ApiResponse, T
+# Core: response schema, pagination, deps
+from .pagination import Page, decode_cursor, encode_cursor
+from .response import ApiJSONResponse, ApiResponse, T, fail, success
 
-__all__ = ["success", "fail", "ApiResponse", "T"]
+__all__ = [
+    "success",
+    "fail",
+    "ApiJSONResponse",
+    "ApiResponse",
+    "T",
+    "Page",
+    "encode_cursor",
+    "decode_cursor",
+]
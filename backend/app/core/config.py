@@ -0,0 +1,62 @@
+"""Application settings, read from environment variables (or backend/.env)."""
+from functools import lru_cache
+from pathlib import Path
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+# backend/app/core/config.py -> repository root
+_REPO_ROOT = Path(__file__).resolve().parents[3]
+
+
+class Settings(BaseSettings):
+    """Typed settings. Field names map to upper-case environment variables."""
+
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore")
+
+    spec_root: Path = _REPO_ROOT / "docs" / "spec"
+    spec_index_refresh_seconds: float = 1.0
+    list_cache_entries: int = 256
+    # /api/spec/list pages are cut from a snapshot file shared by all workers (mmap)
+    spec_snapshot_enabled: bool = True
+    spec_snapshot_dir: Path = _REPO_ROOT / "data" / "snapshot"
+
+    # /api/spec/events: file changes are grouped until debounce_ms pass without another
+    # one (at most max_delay_ms); polling is used without watchfiles or when forced
+    spec_watch_debounce_ms: int = 200
+    spec_watch_max_delay_ms: int = 800
+    spec_watch_poll_seconds: float = 0.5
+    spec_watch_force_polling: bool = False
+    spec_events_max_items: int = 200
+    spec_events_heartbeat_seconds: float = 15.0
+
+    # POST /api/batch: sub-requests per batch, reads run at once, per-item time limit
+    batch_max_items: int = 20
+    batch_concurrency: int = 8
+    batch_item_timeout_seconds: float = 10.0
+
+    # GET /metrics and the request timing middleware
+    metrics_enabled: bool = True
+    # Slow-request profiler, off unless profile_slow_ms is set: requests slower than this
+    # leave a collapsed-stack profile in profile_dir
+    profile_slow_ms: float | None = None
+    profile_dir: Path = _REPO_ROOT / "data" / "profiles"
+    profile_interval_ms: float = 5.0
+    profile_window_seconds: float = 30.0
+    profile_cooldown_seconds: float = 10.0
+
+    # Storage: PostgreSQL when DATABASE_URL is postgresql://..., otherwise SQLite
+    database_url: str | None = None
+    sqlite_db_path: Path = _REPO_ROOT / "data" / "dev.db"
+    init_sql_path: Path = _REPO_ROOT / "data" / "init_db.sql"
+    postgres_init_sql_path: Path = _REPO_ROOT / "data" / "init_db_postgres.sql"
+    sqlite_read_pool_size: int = 4
+    sqlite_busy_timeout_ms: int = 5000
+    db_pool_min_size: int = 1
+    db_pool_max_size: int = 10
+    db_statement_cache_size: int = 256
+
+
+@lru_cache
+def get_settings() -> Settings:
+    """Settings are read once per process."""
+    return Settings()
@@ -1,5 +1,88 @@
 """Shared dependencies. All return types declared."""
+from functools import lru_cache
 
-def get_placeholder_dep() -> str:
-    """Example dependency for DI."""
-    return "injected"
+from app.core.config import get_settings
+from app.core.http_cache import ResponseCache
+from app.core.metrics import Metrics
+from app.core.profiler import SlowRequestProfiler
+from app.db import Database, create_database
+from app.services import SpecEvents, SpecIndex, SpecSnapshot, SpecSync, SpecWatcher
+
+
+@lru_cache
+def get_spec_index() -> SpecIndex:
+    """Process-wide spec index over docs/spec; parsed once, refreshed incrementally."""
+    settings = get_settings()
+    return SpecIndex(settings.spec_root, refresh_seconds=settings.spec_index_refresh_seconds)
+
+
+@lru_cache
+def get_spec_events() -> SpecEvents:
+    """Process-wide subscriptions of /api/spec/events clients."""
+    return SpecEvents(max_items=get_settings().spec_events_max_items)
+
+
+@lru_cache
+def get_spec_snapshot() -> SpecSnapshot | None:
+    """Listing snapshot shared by all workers, or None when disabled."""
+    settings = get_settings()
+    return SpecSnapshot(settings.spec_snapshot_dir) if settings.spec_snapshot_enabled else None
+
+
+@lru_cache
+def get_spec_sync() -> SpecSync:
+    """Process-wide mirror of the spec index into the specs table; rebuilds the snapshot on write."""
+    snapshot = get_spec_snapshot()
+    return SpecSync(
+        get_spec_index(),
+        events=get_spec_events(),
+        on_write=snapshot.rebuild if snapshot is not None else None,
+    )
+
+
+@lru_cache
+def get_database() -> Database:
+    """Process-wide connection pools. Opened and closed by the app lifespan in app/main.py."""
+    return create_database(get_settings())
+
+
+@lru_cache
+def get_list_cache() -> ResponseCache:
+    """Serialized /api/spec/list pages, invalidated when the spec sync writes new data."""
+    return ResponseCache(max_entries=get_settings().list_cache_entries)
+
+
+@lru_cache
+def get_spec_watcher() -> SpecWatcher:
+    """Watches docs/spec while /api/spec/events has listeners. Closed by the app lifespan."""
+    settings = get_settings()
+    return SpecWatcher(
+        get_spec_sync(),
+        get_database(),
+        get_spec_events(),
+        debounce_ms=settings.spec_watch_debounce_ms,
+        max_delay_ms=settings.spec_watch_max_delay_ms,
+        poll_seconds=settings.spec_watch_poll_seconds,
+        force_polling=settings.spec_watch_force_polling,
+    )
+
+
+@lru_cache
+def get_metrics() -> Metrics:
+    """Process-wide request metrics, filled by MetricsMiddleware and served at /metrics."""
+    return Metrics()
+
+
+@lru_cache
+def get_profiler() -> SlowRequestProfiler | None:
+    """Slow-request profiler, or None unless PROFILE_SLOW_MS is set. Started by the app lifespan."""
+    settings = get_settings()
+    if settings.profile_slow_ms is None:
+        return None
+    return SlowRequestProfiler(
+        settings.profile_dir,
+        settings.profile_slow_ms,
+        interval_ms=settings.profile_interval_ms,
+        window_seconds=settings.profile_window_seconds,
+        cooldown_seconds=settings.profile_cooldown_seconds,
+    )
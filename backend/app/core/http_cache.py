@@ -0,0 +1,95 @@
+"""Server-side cache of serialized responses with HTTP validators (ETag / Last-Modified).
+
+Entries are tagged with a data version supplied by the caller; an entry whose version
+differs from the current one is stale and is rebuilt on the next request.
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from email.utils import format_datetime, parsedate_to_datetime
+from urllib.parse import urlencode
+
+from fastapi import Request, Response
+
+
+@dataclass(frozen=True, slots=True)
+class CachedResponse:
+    """A serialized JSON body and its validators."""
+
+    version: int
+    body: bytes
+    etag: str
+    last_modified: datetime | None
+
+    def headers(self) -> dict[str, str]:
+        headers = {"ETag": self.etag, "Cache-Control": "no-cache"}
+        if self.last_modified is not None:
+            headers["Last-Modified"] = format_datetime(self.last_modified.astimezone(UTC), usegmt=True)
+        return headers
+
+    def not_modified(self, request: Request) -> bool:
+        """RFC 9110: If-None-Match wins; If-Modified-Since is only used without it."""
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None:
+            tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+            return "*" in tags or self.etag in tags
+        if_modified_since = request.headers.get("if-modified-since")
+        if if_modified_since is None or self.last_modified is None:
+            return False
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        # HTTP dates have one-second resolution
+        return self.last_modified.astimezone(UTC).replace(microsecond=0) <= since
+
+    def respond(self, request: Request) -> Response:
+        """304 when the client's validators match, otherwise the cached body."""
+        if self.not_modified(request):
+            return Response(status_code=304, headers=self.headers())
+        return Response(content=self.body, media_type="application/json", headers=self.headers())
+
+
+def cache_key(request: Request) -> str:
+    """Path plus query parameters in canonical order."""
+    return f"{request.url.path}?{urlencode(sorted(request.query_params.multi_items()))}"
+
+
+class ResponseCache:
+    """Bounded LRU of serialized responses, safe to share across requests."""
+
+    def __init__(self, max_entries: int = 256) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str, version: int) -> CachedResponse | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.version != version:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: str, version: int, body: bytes, last_modified: datetime | None = None) -> CachedResponse:
+        entry = CachedResponse(
+            version=version,
+            body=body,
+            etag=f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"',
+            last_modified=last_modified,
+        )
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
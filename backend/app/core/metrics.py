@@ -0,0 +1,190 @@
+"""Request metrics: ASGI timing middleware and Prometheus text exposition (GET /metrics).
+
+Per route template (`/api/features/{feature_id}`, not the raw path, so label cardinality
+stays bounded) the middleware records a latency histogram, a response size histogram and
+a request counter by status code, plus the number of requests in flight. Updates happen
+on the event loop thread only, so recording is a few dict lookups and integer additions
+with no locking. Counters are per process: with several uvicorn workers each scrape
+reads the worker that accepted it.
+"""
+import time
+from bisect import bisect_left
+from collections.abc import Iterator
+
+from starlette.routing import replace_params
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.profiler import SlowRequestProfiler
+
+PROMETHEUS_MEDIA_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (256.0, 1024.0, 4096.0, 16384.0, 65536.0, 262144.0, 1048576.0, 4194304.0, 16777216.0)
+
+# Label for requests that matched no route (404s for arbitrary paths)
+UNMATCHED = "<unmatched>"
+
+
+class Histogram:
+    """Fixed-bucket histogram; counts are kept per bucket and made cumulative when rendered."""
+
+    __slots__ = ("bounds", "counts", "count", "sum")
+
+    def __init__(self, bounds: tuple[float, ...]) -> None:
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        # Prometheus buckets are upper-inclusive (le)
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self) -> Iterator[tuple[str, int]]:
+        total = 0
+        for bound, n in zip(self.bounds, self.counts, strict=False):
+            total += n
+            yield f"{bound:g}", total
+        yield "+Inf", self.count
+
+
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: str) -> str:
+    return ",".join(f'{name}="{_label(value)}"' for name, value in labels.items())
+
+
+class Metrics:
+    """Process-wide request metrics."""
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.requests: dict[tuple[str, str, int], int] = {}
+        self.latency: dict[tuple[str, str], Histogram] = {}
+        self.size: dict[tuple[str, str], Histogram] = {}
+
+    def record(self, method: str, route: str, status: int, seconds: float | None, size: int) -> None:
+        """Count one finished request; seconds is None for event streams (open until the client leaves)."""
+        key = (method, route, status)
+        self.requests[key] = self.requests.get(key, 0) + 1
+        route_key = (method, route)
+        if seconds is not None:
+            latency = self.latency.get(route_key)
+            if latency is None:
+                latency = self.latency[route_key] = Histogram(LATENCY_BUCKETS)
+            latency.observe(seconds)
+        sizes = self.size.get(route_key)
+        if sizes is None:
+            sizes = self.size[route_key] = Histogram(SIZE_BUCKETS)
+        sizes.observe(size)
+
+    def render(self) -> str:
+        """Prometheus text exposition format 0.0.4."""
+        lines = [
+            "# HELP http_requests_in_flight Requests currently being handled.",
+            "# TYPE http_requests_in_flight gauge",
+            f"http_requests_in_flight {self.in_flight}",
+            "# HELP http_requests_total Finished requests by method, route template and status code.",
+            "# TYPE http_requests_total counter",
+        ]
+        for (method, route, status), n in sorted(self.requests.items()):
+            lines.append(f"http_requests_total{{{_labels(method=method, route=route, status=str(status))}}} {n}")
+        self._render_histograms(
+            lines,
+            "http_request_duration_seconds",
+            "Time from request start to the last response byte, by route template.",
+            self.latency,
+        )
+        self._render_histograms(
+            lines, "http_response_size_bytes", "Response body size by route template.", self.size
+        )
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _render_histograms(
+        lines: list[str], name: str, help_text: str, histograms: dict[tuple[str, str], Histogram]
+    ) -> None:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} histogram")
+        for (method, route), histogram in sorted(histograms.items()):
+            labels = _labels(method=method, route=route)
+            for le, n in histogram.cumulative():
+                lines.append(f'{name}_bucket{{{labels},le="{le}"}} {n}')
+            lines.append(f"{name}_sum{{{labels}}} {histogram.sum:.6f}")
+            lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+
+
+def _route(scope: Scope) -> str:
+    # The router stores the matched route and its path parameters in the (shared) scope
+    route = scope.get("route")
+    template = getattr(route, "path", None)
+    if not isinstance(template, str):
+        return UNMATCHED
+    # Routes of included routers may carry only their own part of the path (newer
+    # FastAPI). Format that part with the matched parameters, as url_path_for does; the
+    # router prefix is whatever precedes it in the request path. Counting segments instead
+    # would cut in the wrong place when a parameter holds an encoded slash (%2F).
+    path = str(scope.get("path", ""))
+    params = scope.get("path_params")
+    try:
+        tail, _ = replace_params(
+            getattr(route, "path_format", template),
+            getattr(route, "param_convertors", {}),
+            dict(params) if isinstance(params, dict) else {},
+        )
+    except (KeyError, TypeError, ValueError):
+        return template
+    if not path.endswith(tail):
+        return template
+    return path[: len(path) - len(tail)] + template
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware (no BaseHTTPMiddleware): streaming bodies pass through untouched."""
+
+    def __init__(self, app: ASGIApp, metrics: Metrics, profiler: SlowRequestProfiler | None = None) -> None:
+        self.app = app
+        self.metrics = metrics
+        self.profiler = profiler
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        status = 500
+        size = 0
+        streaming = False
+        profiler = self.profiler
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status, size, streaming
+            if message["type"] == "http.response.start":
+                status = int(message["status"])
+                for name, value in message.get("headers", ()):
+                    if name.lower() == b"content-type" and value.startswith(b"text/event-stream"):
+                        streaming = True
+                        if profiler is not None:
+                            profiler.request_detached()
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        metrics = self.metrics
+        metrics.in_flight += 1
+        if profiler is not None:
+            profiler.request_started()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            metrics.in_flight -= 1
+            method = str(scope["method"])
+            route = _route(scope)
+            metrics.record(method, route, status, None if streaming else elapsed, size)
+            if profiler is not None and not streaming:
+                profiler.request_finished(start, elapsed, method, route)
@@ -0,0 +1,43 @@
+"""Keyset pagination: page envelope and opaque cursors."""
+import base64
+import json
+from datetime import datetime
+from typing import Generic, TypeVar
+
+from pydantic import BaseModel, Field
+
+T = TypeVar("T")
+
+
+class Page(BaseModel, Generic[T]):
+    """One page of results. Pass next_cursor back as `cursor` to fetch the next page."""
+
+    items: list[T] = Field(..., description="Items on this page")
+    next_cursor: str | None = Field(None, description="Cursor for the next page; null on the last page")
+    limit: int = Field(..., description="Requested page size")
+
+
+def encode_cursor(updated_at: datetime, row_id: int) -> str:
+    """Opaque cursor for the keyset position (updated_at, id)."""
+    raw = json.dumps([updated_at.isoformat(), row_id], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """Inverse of encode_cursor. Raises ValueError on malformed input."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        value: object = json.loads(raw)
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
+    if (
+        not isinstance(value, list)
+        or len(value) != 2
+        or not isinstance(value[0], str)
+        or not isinstance(value[1], int)
+    ):
+        raise ValueError("Invalid cursor")
+    try:
+        return datetime.fromisoformat(value[0]), value[1]
+    except ValueError as e:
+        raise ValueError("Invalid cursor") from e
@@ -0,0 +1,144 @@
+"""Opt-in sampling profiler for slow requests (enabled by PROFILE_SLOW_MS).
+
+While requests are in flight a daemon thread samples the Python stack of every thread
+each interval_ms and keeps the last window_seconds of samples in a ring buffer. When a
+request takes longer than the threshold, the samples taken during it are written as a
+collapsed-stack file (`thread;frame;...;frame count` per line), which flamegraph.pl,
+inferno and speedscope render directly.
+
+Samples cover everything the process did while the request ran, including other
+requests sharing the event loop; for an async server that is usually the explanation
+of a slow request (something else held the loop). Files are written by the sampler
+thread, never on the event loop, and at most one per cooldown_seconds.
+"""
+import queue
+import re
+import sys
+import threading
+import time
+from collections import Counter, deque
+from pathlib import Path
+from types import CodeType, FrameType
+
+# Frames kept per sample, innermost last; deeper stacks are cut at the root side
+_MAX_DEPTH = 128
+
+_UNSAFE = re.compile(r"[^A-Za-z0-9_.-]+")
+
+
+def _stack(frame: FrameType | None) -> tuple[CodeType, ...]:
+    codes: list[CodeType] = []
+    while frame is not None and len(codes) < _MAX_DEPTH:
+        codes.append(frame.f_code)
+        frame = frame.f_back
+    codes.reverse()
+    return tuple(codes)
+
+
+def _frame_name(code: CodeType) -> str:
+    path = Path(code.co_filename)
+    return f"{code.co_qualname} ({path.parent.name}/{path.name}:{code.co_firstlineno})"
+
+
+class SlowRequestProfiler:
+    """Samples stacks while requests run and writes a profile for each slow one."""
+
+    def __init__(
+        self,
+        output_dir: Path,
+        threshold_ms: float,
+        interval_ms: float = 5.0,
+        window_seconds: float = 30.0,
+        cooldown_seconds: float = 10.0,
+    ) -> None:
+        self.output_dir = output_dir
+        self.threshold = threshold_ms / 1000
+        self.interval = interval_ms / 1000
+        self.cooldown = cooldown_seconds
+        self.written = 0
+        self._active = 0
+        self._samples: deque[tuple[float, int, tuple[CodeType, ...]]] = deque(
+            maxlen=max(1, int(window_seconds / self.interval))
+        )
+        self._reports: queue.SimpleQueue[tuple[float, float, str, str]] = queue.SimpleQueue()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._last_write = float("-inf")
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="slow-request-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        thread, self._thread = self._thread, None
+        if thread is None:
+            return
+        self._stop.set()
+        self._wake.set()
+        thread.join()
+
+    def request_started(self) -> None:
+        """Called on the event loop thread when a request begins."""
+        self._active += 1
+        if self._active == 1:
+            self._wake.set()
+
+    def request_finished(self, start: float, elapsed: float, method: str, route: str) -> None:
+        """Called on the event loop thread; start is a time.perf_counter() value."""
+        self._active -= 1
+        if elapsed >= self.threshold:
+            self._reports.put((start, start + elapsed, method, route))
+            self._wake.set()
+
+    def request_detached(self) -> None:
+        """The request became a long-lived stream: stop counting it as in flight."""
+        self._active -= 1
+
+    def _run(self) -> None:
+        me = threading.get_ident()
+        while not self._stop.is_set():
+            if self._active <= 0:
+                # Idle: sleep until a request starts or a report is queued
+                self._wake.wait(1.0)
+                self._wake.clear()
+            else:
+                now = time.perf_counter()
+                for ident, frame in sys._current_frames().items():
+                    if ident != me:
+                        self._samples.append((now, ident, _stack(frame)))
+                self._stop.wait(self.interval)
+            self._write_reports()
+
+    def _write_reports(self) -> None:
+        while True:
+            try:
+                start, end, method, route = self._reports.get_nowait()
+            except queue.Empty:
+                return
+            now = time.monotonic()
+            if now - self._last_write < self.cooldown:
+                continue
+            stacks = Counter(stack_key for ts, stack_key in self._collapsed(start, end))
+            if not stacks:
+                continue
+            self._last_write = now
+            name = f"{time.strftime('%Y%m%dT%H%M%S')}_{method}_{_UNSAFE.sub('_', route).strip('_')}"
+            path = self.output_dir / f"{name}_{round((end - start) * 1000)}ms.collapsed"
+            try:
+                self.output_dir.mkdir(parents=True, exist_ok=True)
+                path.write_text("".join(f"{stack} {n}\n" for stack, n in stacks.most_common()), encoding="utf-8")
+            except OSError:
+                continue
+            self.written += 1
+
+    def _collapsed(self, start: float, end: float) -> list[tuple[float, str]]:
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        return [
+            (ts, ";".join([names.get(ident, f"thread-{ident}"), *map(_frame_name, codes)]))
+            for ts, ident, codes in list(self._samples)
+            if start <= ts <= end
+        ]
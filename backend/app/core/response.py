@@ -1,6 +1,7 @@
 """Unified API response format. No Any."""
 from typing import Generic, TypeVar
 
+from fastapi import Response
 from pydantic import BaseModel, Field
 
 T = TypeVar("T")
@@ -22,3 +23,19 @@ def success(data: T) -> ApiResponse[T]:
 def fail(message: str) -> ApiResponse[None]:
     """Return error response."""
     return ApiResponse(ok=False, data=None, error=message)
+
+
+class ApiJSONResponse(Response):
+    """Fast path for an ApiResponse whose data is already typed.
+
+    Returning a Response skips FastAPI's response_model round-trip (dump, re-validate,
+    jsonable_encoder, json.dumps); pydantic-core serializes the model to JSON in one step.
+    Keep response_model on the route so the OpenAPI schema is unchanged.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: object) -> bytes | memoryview:
+        if isinstance(content, BaseModel):
+            return content.model_dump_json().encode()
+        return super().render(content)
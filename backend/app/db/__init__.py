@@ -0,0 +1,5 @@
+# DB: async connection pools behind one interface
+from .base import Connection, Database, Params, Row, SqlValue
+from .factory import create_database
+
+__all__ = ["Connection", "Database", "Params", "Row", "SqlValue", "create_database"]
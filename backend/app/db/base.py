@@ -0,0 +1,43 @@
+"""Storage interface shared by the SQLite and PostgreSQL backends.
+
+SQL is written once with `?` placeholders; each backend adapts it. Rows are plain dicts.
+"""
+from collections.abc import Sequence
+from contextlib import AbstractAsyncContextManager
+from datetime import datetime
+from typing import Protocol
+
+SqlValue = str | int | float | bytes | bool | datetime | None
+Params = Sequence[SqlValue]
+Row = dict[str, SqlValue]
+
+
+class Connection(Protocol):
+    """A pooled connection, held for the duration of a transaction."""
+
+    async def execute(self, sql: str, params: Params = ()) -> None: ...
+
+    async def execute_many(self, sql: str, rows: Sequence[Params]) -> None: ...
+
+    async def fetch_all(self, sql: str, params: Params = ()) -> list[Row]: ...
+
+
+class Database(Protocol):
+    """Process-wide connection pools. Opened on startup, closed on shutdown."""
+
+    # "sqlite" or "postgres", for the few queries (e.g. full-text search) that differ
+    dialect: str
+
+    async def open(self) -> None: ...
+
+    async def close(self) -> None: ...
+
+    async def fetch_all(self, sql: str, params: Params = ()) -> list[Row]:
+        """Run a read-only query on a read connection."""
+        ...
+
+    async def fetch_one(self, sql: str, params: Params = ()) -> Row | None: ...
+
+    def transaction(self) -> AbstractAsyncContextManager[Connection]:
+        """Hold a write connection inside a transaction; commits on success, rolls back on error."""
+        ...
@@ -0,0 +1,36 @@
+"""Pick the storage backend from settings."""
+from pathlib import Path
+
+from app.core.config import Settings
+from app.db.base import Database
+
+
+def create_database(settings: Settings) -> Database:
+    """PostgreSQL when DATABASE_URL is postgres(ql)://, otherwise SQLite.
+
+    `sqlite:///path` in DATABASE_URL overrides SQLITE_DB_PATH. The asyncpg import is
+    deferred so that SQLite-only installs do not need it.
+    """
+    url = settings.database_url or ""
+    if url.startswith(("postgresql://", "postgres://")):
+        from app.db.postgres import PostgresDatabase
+
+        return PostgresDatabase(
+            url,
+            init_sql=settings.postgres_init_sql_path,
+            min_size=settings.db_pool_min_size,
+            max_size=settings.db_pool_max_size,
+            statement_cache_size=settings.db_statement_cache_size,
+        )
+
+    from app.db.sqlite import SQLiteDatabase
+
+    path = settings.sqlite_db_path
+    if url.startswith("sqlite:///"):
+        path = Path(url.removeprefix("sqlite:///"))
+    return SQLiteDatabase(
+        path,
+        init_sql=settings.init_sql_path,
+        read_pool_size=settings.sqlite_read_pool_size,
+        busy_timeout_ms=settings.sqlite_busy_timeout_ms,
+    )
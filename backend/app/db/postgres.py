@@ -0,0 +1,97 @@
+"""PostgreSQL backend on asyncpg (optional dependency: `pip install spec-backend[postgres]`).
+
+asyncpg prepares every statement and keeps a per-connection LRU of prepared statements;
+since the pool keeps connections alive, repeated queries skip parsing and planning.
+"""
+import re
+from collections.abc import AsyncIterator, Sequence
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from pathlib import Path
+
+import asyncpg
+from asyncpg.pool import PoolConnectionProxy
+
+from app.db.base import Connection, Params, Row
+
+_PLACEHOLDER = re.compile(r"\?")
+
+
+@lru_cache(maxsize=512)
+def to_numbered(sql: str) -> str:
+    """`?` placeholders -> `$1, $2, ...`. Shared SQL must not contain `?` inside literals."""
+    counter = iter(range(1, sql.count("?") + 1))
+    return _PLACEHOLDER.sub(lambda _: f"${next(counter)}", sql)
+
+
+class PostgresConnection:
+    def __init__(self, conn: asyncpg.Connection | PoolConnectionProxy) -> None:
+        self.raw = conn
+
+    async def execute(self, sql: str, params: Params = ()) -> None:
+        await self.raw.execute(to_numbered(sql), *params)
+
+    async def execute_many(self, sql: str, rows: Sequence[Params]) -> None:
+        await self.raw.executemany(to_numbered(sql), rows)
+
+    async def fetch_all(self, sql: str, params: Params = ()) -> list[Row]:
+        return [dict(record) for record in await self.raw.fetch(to_numbered(sql), *params)]
+
+
+class PostgresDatabase:
+    """asyncpg connection pool; reads and transactions draw from the same pool."""
+
+    dialect = "postgres"
+
+    def __init__(
+        self,
+        dsn: str,
+        init_sql: Path,
+        min_size: int = 1,
+        max_size: int = 10,
+        statement_cache_size: int = 256,
+    ) -> None:
+        self.dsn = dsn
+        self.init_sql = init_sql
+        self.min_size = min_size
+        self.max_size = max_size
+        self.statement_cache_size = statement_cache_size
+        self._pool: asyncpg.Pool | None = None
+
+    async def open(self) -> None:
+        self._pool = await asyncpg.create_pool(
+            self.dsn,
+            min_size=self.min_size,
+            max_size=self.max_size,
+            statement_cache_size=self.statement_cache_size,
+        )
+        await self._ensure_schema()
+
+    async def close(self) -> None:
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
+
+    def _require_pool(self) -> asyncpg.Pool:
+        if self._pool is None:
+            raise RuntimeError("Database is not open")
+        return self._pool
+
+    async def _ensure_schema(self) -> None:
+        """Run the (idempotent) schema script: creates what is missing, leaves the rest alone."""
+        script = self.init_sql.read_text(encoding="utf-8")
+        async with self._require_pool().acquire() as conn:
+            await conn.execute(script)
+
+    async def fetch_all(self, sql: str, params: Params = ()) -> list[Row]:
+        records = await self._require_pool().fetch(to_numbered(sql), *params)
+        return [dict(record) for record in records]
+
+    async def fetch_one(self, sql: str, params: Params = ()) -> Row | None:
+        record = await self._require_pool().fetchrow(to_numbered(sql), *params)
+        return dict(record) if record is not None else None
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[Connection]:
+        async with self._require_pool().acquire() as conn, conn.transaction():
+            yield PostgresConnection(conn)
@@ -0,0 +1,229 @@
+"""SQLite backend: WAL mode, one writer connection and a separate pool of read connections.
+
+sqlite3 is blocking, so every call runs on a dedicated thread pool; a connection is used by
+one task at a time. The schema comes from data/init_db.sql.
+"""
+import asyncio
+import re
+import sqlite3
+from collections.abc import AsyncIterator, Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import TypeVar
+
+from app.db.base import Connection, Params, Row, SqlValue
+
+R = TypeVar("R")
+
+# Columns added after the first version of init_db.sql; existing dev databases get
+# them via ALTER TABLE (which only accepts constant defaults).
+_ADDED_COLUMNS = {
+    "specs": {
+        "title": "TEXT",
+        "domain": "TEXT",
+        "location": "TEXT",
+        "path": "TEXT",
+        "tasks_total": "INTEGER DEFAULT 0",
+        "tasks_done": "INTEGER DEFAULT 0",
+        "file_size": "INTEGER",
+    },
+    "features": {
+        "project": "TEXT NOT NULL DEFAULT ''",
+        "position": "INTEGER",
+        "steps": "TEXT",
+        "updated_at": "TIMESTAMP",
+    },
+}
+
+# Fills the progress counters from existing features when their tables are first created;
+# from then on the triggers in init_db.sql keep them up to date.
+_BACKFILL_PROGRESS = (
+    "INSERT INTO feature_project_progress (project, total, passed)"
+    " SELECT project, count(*), sum(COALESCE(passes, 0) <> 0) FROM features GROUP BY project",
+    "INSERT INTO feature_spec_progress (spec_id, total, passed)"
+    " SELECT spec_id, count(*), sum(COALESCE(passes, 0) <> 0) FROM features"
+    " WHERE spec_id IS NOT NULL GROUP BY spec_id",
+)
+
+_CREATE = re.compile(r"^\s*CREATE\b", re.IGNORECASE)
+
+
+def _statements(script: str) -> list[str]:
+    """Split an SQL script into complete statements (trigger bodies stay whole)."""
+    statements: list[str] = []
+    buffer = ""
+    for line in script.splitlines(keepends=True):
+        if not buffer and (not line.strip() or line.lstrip().startswith("--")):
+            continue
+        buffer += line
+        if sqlite3.complete_statement(buffer):
+            statements.append(buffer.strip())
+            buffer = ""
+    return statements
+
+
+def ensure_schema(conn: sqlite3.Connection, init_sql: Path) -> None:
+    """Create the schema on a fresh database; on an existing one add missing columns and objects.
+
+    Every CREATE in init_db.sql uses IF NOT EXISTS, so re-running them is safe; the seed
+    INSERTs only run on a fresh database. A newly created FTS index is filled from specs,
+    and newly created progress counters from features.
+    """
+    script = init_sql.read_text(encoding="utf-8")
+
+    def exists(name: str) -> bool:
+        row = conn.execute("SELECT 1 FROM sqlite_master WHERE name = ?", (name,)).fetchone()
+        return row is not None
+
+    if not exists("specs"):
+        conn.executescript(script)
+        return
+    had_fts = exists("specs_fts")
+    had_progress = exists("feature_project_progress")
+    conn.execute("BEGIN")
+    try:
+        for table, added in _ADDED_COLUMNS.items():
+            if not exists(table):
+                continue
+            columns = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+            for name, decl in added.items():
+                if name not in columns:
+                    conn.execute(f"ALTER TABLE {table} ADD COLUMN {name} {decl}")
+        for stmt in _statements(script):
+            if _CREATE.match(stmt):
+                conn.execute(stmt)
+        if not had_fts:
+            conn.execute("INSERT INTO specs_fts (specs_fts) VALUES ('rebuild')")
+        if not had_progress:
+            for stmt in _BACKFILL_PROGRESS:
+                conn.execute(stmt)
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+
+
+def _adapt(value: SqlValue) -> str | int | float | bytes | None:
+    # Timestamps are stored as text in CURRENT_TIMESTAMP form ("YYYY-MM-DD HH:MM:SS[.ffffff]", UTC),
+    # so that text order is time order
+    if isinstance(value, datetime):
+        return value.isoformat(sep=" ")
+    return value
+
+
+def _params(params: Params) -> tuple[str | int | float | bytes | None, ...]:
+    return tuple(_adapt(value) for value in params)
+
+
+def _open(path: Path, busy_timeout_ms: int, read_only: bool) -> sqlite3.Connection:
+    # isolation_level=None: autocommit; transactions are begun explicitly
+    conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    conn.execute(f"PRAGMA busy_timeout = {int(busy_timeout_ms)}")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    if read_only:
+        conn.execute("PRAGMA query_only = ON")
+    return conn
+
+
+class SQLiteConnection:
+    """Async wrapper running one sqlite3 connection's calls on the backend's thread pool."""
+
+    def __init__(self, conn: sqlite3.Connection, executor: ThreadPoolExecutor) -> None:
+        self.raw = conn
+        self._executor = executor
+
+    async def run(self, fn: Callable[[sqlite3.Connection], R]) -> R:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, fn, self.raw)
+
+    async def execute(self, sql: str, params: Params = ()) -> None:
+        args = _params(params)
+        await self.run(lambda c: c.execute(sql, args))
+
+    async def execute_many(self, sql: str, rows: Sequence[Params]) -> None:
+        args = [_params(row) for row in rows]
+        await self.run(lambda c: c.executemany(sql, args))
+
+    async def fetch_all(self, sql: str, params: Params = ()) -> list[Row]:
+        args = _params(params)
+        return await self.run(lambda c: [dict(row) for row in c.execute(sql, args)])
+
+
+class SQLiteDatabase:
+    """SQLite in WAL mode: readers never block the single writer, and vice versa."""
+
+    dialect = "sqlite"
+
+    def __init__(self, path: Path, init_sql: Path, read_pool_size: int = 4, busy_timeout_ms: int = 5000) -> None:
+        self.path = path
+        self.init_sql = init_sql
+        self.read_pool_size = max(1, read_pool_size)
+        self.busy_timeout_ms = busy_timeout_ms
+        self._executor: ThreadPoolExecutor | None = None
+        self._writer: SQLiteConnection | None = None
+        self._write_lock = asyncio.Lock()
+        self._readers: asyncio.Queue[SQLiteConnection] = asyncio.Queue()
+        self._all: list[SQLiteConnection] = []
+
+    async def open(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        executor = ThreadPoolExecutor(max_workers=self.read_pool_size + 1, thread_name_prefix="sqlite")
+        self._executor = executor
+
+        def open_writer() -> sqlite3.Connection:
+            conn = _open(self.path, self.busy_timeout_ms, read_only=False)
+            conn.execute("PRAGMA journal_mode = WAL")
+            ensure_schema(conn, self.init_sql)
+            return conn
+
+        loop = asyncio.get_running_loop()
+        self._writer = SQLiteConnection(await loop.run_in_executor(executor, open_writer), executor)
+        self._all = [self._writer]
+        for _ in range(self.read_pool_size):
+            raw = await loop.run_in_executor(executor, _open, self.path, self.busy_timeout_ms, True)
+            reader = SQLiteConnection(raw, executor)
+            self._all.append(reader)
+            self._readers.put_nowait(reader)
+
+    async def close(self) -> None:
+        for conn in self._all:
+            await conn.run(lambda c: c.close())
+        self._all = []
+        self._writer = None
+        self._readers = asyncio.Queue()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    @asynccontextmanager
+    async def _reader(self) -> AsyncIterator[SQLiteConnection]:
+        conn = await self._readers.get()
+        try:
+            yield conn
+        finally:
+            self._readers.put_nowait(conn)
+
+    async def fetch_all(self, sql: str, params: Params = ()) -> list[Row]:
+        async with self._reader() as conn:
+            return await conn.fetch_all(sql, params)
+
+    async def fetch_one(self, sql: str, params: Params = ()) -> Row | None:
+        rows = await self.fetch_all(sql, params)
+        return rows[0] if rows else None
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[Connection]:
+        if self._writer is None:
+            raise RuntimeError("Database is not open")
+        writer = self._writer
+        async with self._write_lock:
+            await writer.execute("BEGIN IMMEDIATE")
+            try:
+                yield writer
+            except BaseException:
+                await writer.execute("ROLLBACK")
+                raise
+            await writer.execute("COMMIT")
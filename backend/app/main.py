@@ -1,14 +1,47 @@
 """FastAPI entry. All routes use dependency injection and typed handlers."""
-from fastapi import FastAPI
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from fastapi import Depends, FastAPI
+from fastapi.responses import PlainTextResponse
 
 from app.api import router as api_router
 from app.core import ApiResponse
+from app.core.config import get_settings
+from app.core.deps import get_database, get_metrics, get_profiler, get_spec_watcher
+from app.core.metrics import PROMETHEUS_MEDIA_TYPE, Metrics, MetricsMiddleware
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Open the connection pools once at startup; stop the spec watcher and close them at shutdown."""
+    db = get_database()
+    await db.open()
+    profiler = get_profiler()
+    if profiler is not None:
+        profiler.start()
+    try:
+        yield
+    finally:
+        await get_spec_watcher().close()
+        await db.close()
+        if profiler is not None:
+            profiler.stop()
 
-app = FastAPI(title="Spec API", version="0.1.0")
+
+app = FastAPI(title="Spec API", version="0.1.0", lifespan=lifespan)
 app.include_router(api_router, prefix="/api")
+if get_settings().metrics_enabled:
+    app.add_middleware(MetricsMiddleware, metrics=get_metrics(), profiler=get_profiler())
 
 
 @app.get("/health")
 def health() -> dict[str, str]:
     """Health check. Return type required."""
     return {"status": "ok"}
+
+
+@app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def metrics(collected: Metrics = Depends(get_metrics)) -> PlainTextResponse:
+    """Prometheus scrape endpoint (text format, not wrapped in ApiResponse)."""
+    return PlainTextResponse(collected.render(), media_type=PROMETHEUS_MEDIA_TYPE)
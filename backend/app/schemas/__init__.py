@@ -0,0 +1,29 @@
+# Schemas: request/response models
+from .batch import BatchItemResult, BatchRequest, BatchRequestItem, BatchResult
+from .feature import (
+    FeatureImportResult,
+    FeatureList,
+    FeatureListEntry,
+    FeaturePassesUpdate,
+    FeatureProgress,
+    FeatureState,
+)
+from .spec import FeatureItem, SpecChangeEvent, SpecExportRecord, SpecItem, SpecSearchHit
+
+__all__ = [
+    "BatchItemResult",
+    "BatchRequest",
+    "BatchRequestItem",
+    "BatchResult",
+    "FeatureImportResult",
+    "FeatureList",
+    "FeatureListEntry",
+    "FeaturePassesUpdate",
+    "FeatureProgress",
+    "FeatureState",
+    "FeatureItem",
+    "SpecChangeEvent",
+    "SpecExportRecord",
+    "SpecItem",
+    "SpecSearchHit",
+]
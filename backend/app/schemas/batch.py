@@ -0,0 +1,42 @@
+"""Batch request models: several API calls in one round trip (POST /api/batch)."""
+from typing import Literal
+
+from pydantic import BaseModel, Field, JsonValue
+
+BatchMethod = Literal["GET", "POST", "PUT", "PATCH", "DELETE"]
+
+
+class BatchRequestItem(BaseModel):
+    """One sub-request, dispatched in-process as if it had been sent on its own."""
+
+    id: str | None = Field(None, max_length=100, description="Key echoed in the result; defaults to the item's index")
+    method: BatchMethod = Field("GET", description="HTTP method; reads run concurrently, writes one at a time")
+    path: str = Field(
+        ...,
+        min_length=1,
+        max_length=2000,
+        description="Path relative to /api with query string, e.g. /spec/list?limit=20",
+    )
+    body: JsonValue = Field(None, description="JSON request body for writes")
+
+
+class BatchRequest(BaseModel):
+    """Sub-requests in order; each sees the effects of the writes listed before it."""
+
+    requests: list[BatchRequestItem] = Field(..., min_length=1, description="Sub-requests to run")
+
+
+class BatchItemResult(BaseModel):
+    """One sub-request's outcome: its status code and its response envelope, flattened."""
+
+    id: str = Field(..., description="The item's id, or its index in the request")
+    status: int = Field(..., description="HTTP status the sub-request returned")
+    ok: bool = Field(..., description="Sub-request succeeded")
+    data: JsonValue = Field(None, description="Payload when ok=True")
+    error: str | None = Field(None, description="Error message when ok=False")
+
+
+class BatchResult(BaseModel):
+    """Results in request order."""
+
+    results: list[BatchItemResult] = Field(default_factory=list, description="One result per sub-request")
@@ -0,0 +1,59 @@
+"""Plan-auto feature progress models (features table and feature_list.json)."""
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+
+class FeatureState(BaseModel):
+    """One feature with its verification state."""
+
+    id: int = Field(..., description="Row id in the features table")
+    project: str = Field(..., description="Plan-auto project the feature belongs to")
+    position: int | None = Field(None, description="Index in the project's feature_list.json")
+    spec_id: int | None = Field(None, description="Linked spec, if any")
+    description: str = Field(..., description="What the feature does")
+    category: str | None = Field(None, description="Free-form category, e.g. functional")
+    steps: list[str] = Field(default_factory=list, description="Acceptance steps")
+    passes: bool = Field(False, description="Whether the feature passed acceptance")
+    updated_at: datetime | None = Field(None, description="Last change (UTC)")
+
+
+class FeaturePassesUpdate(BaseModel):
+    """Body of a per-feature progress update."""
+
+    passes: bool = Field(..., description="New verification state")
+
+
+class FeatureProgress(BaseModel):
+    """Completion counters of a project or a spec."""
+
+    project: str | None = Field(None, description="Project, for project progress")
+    spec_id: int | None = Field(None, description="Spec id, for spec progress")
+    total: int = Field(0, description="Number of features")
+    passed: int = Field(0, description="Number of features with passes=true")
+    complete: bool = Field(False, description="True when every feature passes (and there is at least one)")
+
+
+class FeatureListEntry(BaseModel):
+    """One entry of feature_list.json."""
+
+    category: str | None = Field(None, description="Free-form category, e.g. functional")
+    description: str = Field(..., description="What the feature does")
+    steps: list[str] = Field(default_factory=list, description="Acceptance steps")
+    passes: bool = Field(False, description="Whether the feature passed acceptance")
+
+
+class FeatureList(BaseModel):
+    """The feature_list.json document: import body and export result."""
+
+    project: str = Field(..., min_length=1, description="Plan-auto project name")
+    spec: str | None = Field(None, description="Spec name or path (relative to docs/spec) the features belong to")
+    features: list[FeatureListEntry] = Field(default_factory=list, description="Features in list order")
+
+
+class FeatureImportResult(BaseModel):
+    """Outcome of importing a feature_list.json."""
+
+    imported: int = Field(..., description="Features inserted or updated")
+    removed: int = Field(..., description="Stored features beyond the end of the imported list")
+    progress: FeatureProgress = Field(..., description="Project progress after the import")
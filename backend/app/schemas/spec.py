@@ -0,0 +1,52 @@
+"""Spec models exposed by the API."""
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+
+class SpecItem(BaseModel):
+    """One spec as listed by /api/spec/list (a row of the `specs` table)."""
+
+    id: int = Field(..., description="Row id in the specs table")
+    name: str = Field(..., description="Spec name, e.g. user_login")
+    title: str | None = Field(None, description="First level-1 heading")
+    status: str | None = Field(None, description="Front-matter status (proposal/implementation/...)")
+    domain: str | None = Field(None, description="Front-matter domain, or the specs/<domain> directory")
+    location: str | None = Field(None, description="active, archive or specs; null for rows not synced from docs/spec")
+    path: str | None = Field(None, description="File path relative to docs/spec")
+    tasks_total: int = Field(0, description="Number of task checkboxes")
+    tasks_done: int = Field(0, description="Number of checked task checkboxes")
+    updated_at: datetime = Field(..., description="Last modification time (UTC)")
+
+
+class SpecSearchHit(SpecItem):
+    """A search result: the listed spec plus its rank and a highlighted excerpt."""
+
+    snippet: str = Field(..., description="Excerpt with matches wrapped in <mark>...</mark>; other text is not escaped")
+    rank: float = Field(..., description="Relevance, higher is better")
+
+
+class FeatureItem(BaseModel):
+    """One row of the features table."""
+
+    id: int = Field(..., description="Row id in the features table")
+    description: str = Field(..., description="What the feature does")
+    category: str | None = Field(None, description="Free-form category")
+    passes: bool = Field(False, description="Whether the feature is verified")
+    created_at: datetime | None = Field(None, description="Creation time (UTC)")
+
+
+class SpecExportRecord(SpecItem):
+    """One NDJSON line of /api/spec/export: a spec with its features."""
+
+    content: str | None = Field(None, description="Full spec text; only when include_content=true")
+    features: list[FeatureItem] = Field(default_factory=list, description="Features linked to this spec")
+
+
+class SpecChangeEvent(BaseModel):
+    """One server-sent event of /api/spec/events: specs written since the previous event."""
+
+    version: int = Field(..., description="Data version after the change (also the SSE event id)")
+    reset: bool = Field(False, description="Too much changed (or the stream just opened): reload the list")
+    upserted: list[SpecItem] = Field(default_factory=list, description="New or changed specs")
+    removed: list[int] = Field(default_factory=list, description="Ids of specs whose file is gone")
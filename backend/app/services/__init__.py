@@ -0,0 +1,48 @@
+# Services: in-process state and business logic shared by routes
+from .batch import BATCH_PATH, run_batch
+from .feature_progress import (
+    export_feature_list,
+    import_feature_list,
+    list_features,
+    project_progress,
+    set_passes,
+    set_passes_at,
+    spec_progress,
+)
+from .spec_events import SpecEvents, Subscription
+from .spec_export import EXPORT_MEDIA_TYPE, ExportQuery, iter_export, iter_records
+from .spec_index import SpecIndex, SpecRecord
+from .spec_search import SearchQuery, search_specs
+from .spec_snapshot import SnapshotView, SpecSnapshot
+from .spec_store import SpecQuery, SpecSync, list_page
+from .spec_watch import EVENT_STREAM_MEDIA_TYPE, SpecWatcher, iter_events
+
+__all__ = [
+    "BATCH_PATH",
+    "run_batch",
+    "export_feature_list",
+    "import_feature_list",
+    "list_features",
+    "project_progress",
+    "set_passes",
+    "set_passes_at",
+    "spec_progress",
+    "SpecEvents",
+    "Subscription",
+    "EXPORT_MEDIA_TYPE",
+    "ExportQuery",
+    "iter_export",
+    "iter_records",
+    "SpecIndex",
+    "SpecRecord",
+    "SearchQuery",
+    "search_specs",
+    "SnapshotView",
+    "SpecSnapshot",
+    "SpecQuery",
+    "SpecSync",
+    "list_page",
+    "EVENT_STREAM_MEDIA_TYPE",
+    "SpecWatcher",
+    "iter_events",
+]
@@ -0,0 +1,191 @@
+"""In-process dispatch of batched API calls (POST /api/batch).
+
+Each sub-request goes through the whole ASGI app (middleware, routing, dependencies,
+validation and exception handlers) exactly as if it had arrived on its own connection,
+so every JSON endpoint can be batched without batch-specific code, and shares the
+process's caches, snapshot and connection pools. Consecutive reads run concurrently; a
+write runs alone, after the items before it and before the items after it. The
+sub-responses are spliced into one ApiResponse body without being parsed again.
+"""
+import asyncio
+import json
+import logging
+from http import HTTPStatus
+from urllib.parse import unquote, urlsplit
+
+from starlette.types import ASGIApp, Message, Scope
+
+from app.schemas import BatchRequestItem
+
+logger = logging.getLogger(__name__)
+
+BATCH_PATH = "/batch"
+
+_READ_METHODS = frozenset({"GET"})
+# ApiResponse serializes its fields in declaration order
+_ENVELOPE = b'{"ok":'
+
+
+class _NotBatchable(Exception):
+    """The sub-request started a successful response that is not JSON (an export or event stream)."""
+
+
+def _json(value: object) -> bytes:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def _failed(message: str) -> bytes:
+    """Envelope members of a failed item."""
+    return b'"ok":false,"data":null,"error":' + _json(message)
+
+
+def _validation_error(error: object) -> str:
+    if not isinstance(error, dict):
+        return str(error)
+    loc = error.get("loc")
+    where = ".".join(str(part) for part in loc) if isinstance(loc, list) else ""
+    return f"{where}: {error.get('msg')}" if where else str(error.get("msg"))
+
+
+def _error_message(raw: bytes, status: int) -> str:
+    """The message of an error response: ApiResponse.error, FastAPI's detail, or the body text."""
+    try:
+        payload: object = json.loads(raw)
+    except ValueError:
+        payload = None
+    if isinstance(payload, dict):
+        detail = payload.get("error") or payload.get("detail")
+        if isinstance(detail, str):
+            return detail
+        if isinstance(detail, list) and detail:
+            return "; ".join(_validation_error(error) for error in detail)
+    text = raw.decode(errors="replace").strip()
+    if text:
+        return text
+    try:
+        return HTTPStatus(status).phrase
+    except ValueError:
+        return f"HTTP {status}"
+
+
+def _sub_scope(parent: Scope, prefix: str, item: BatchRequestItem, path: str, query: str, body: bytes) -> Scope:
+    host = next((value for name, value in parent.get("headers", ()) if name == b"host"), b"localhost")
+    headers = [(b"host", host), (b"accept", b"application/json")]
+    if item.body is not None:
+        headers += [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())]
+    full_path = prefix + path
+    return {
+        "type": "http",
+        # 2.4: streaming responses do not listen for a disconnect on receive()
+        "asgi": {"version": "3.0", "spec_version": "2.4"},
+        "http_version": parent.get("http_version", "1.1"),
+        "method": item.method,
+        "scheme": parent.get("scheme", "http"),
+        "server": parent.get("server"),
+        "client": parent.get("client"),
+        "root_path": parent.get("root_path", ""),
+        "path": unquote(full_path),
+        "raw_path": full_path.encode(),
+        "query_string": query.encode(),
+        "headers": headers,
+        # Lifespan state is shallow-copied per request, as the server does
+        "state": dict(parent.get("state", {})),
+        "extensions": {},
+    }
+
+
+async def _dispatch(
+    app: ASGIApp, parent: Scope, prefix: str, item: BatchRequestItem, timeout: float
+) -> tuple[int, bytes]:
+    """Run one sub-request; returns its status and the members of its flattened envelope."""
+    target = urlsplit(item.path)
+    if target.scheme or target.netloc or not target.path.startswith("/"):
+        return 400, _failed("path must be relative to /api, e.g. /spec/list?limit=20")
+    if target.path.rstrip("/") == BATCH_PATH or target.path.startswith(BATCH_PATH + "/"):
+        return 400, _failed("Batches cannot be nested")
+
+    body = b"" if item.body is None else _json(item.body)
+    scope = _sub_scope(parent, prefix, item, target.path, target.query, body)
+    request_sent = False
+    finished = asyncio.Event()
+    status = 500
+    chunks: list[bytes] = []
+
+    async def receive() -> Message:
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        await finished.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: Message) -> None:
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = int(message["status"])
+            content_type = next(
+                (value for name, value in message.get("headers", ()) if name.lower() == b"content-type"), b""
+            )
+            if status < 400 and content_type and not content_type.startswith(b"application/json"):
+                raise _NotBatchable
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    try:
+        async with asyncio.timeout(timeout):
+            await app(scope, receive, send)
+    except _NotBatchable:
+        return 400, _failed(f"{target.path} does not return JSON and cannot be batched")
+    except TimeoutError:
+        return 504, _failed("Sub-request timed out")
+    except Exception:
+        # The app's error middleware has already answered 500; the server would log this
+        logger.exception("Batched %s %s failed", item.method, target.path)
+        return 500, _failed(HTTPStatus.INTERNAL_SERVER_ERROR.phrase)
+    finally:
+        finished.set()
+
+    raw = b"".join(chunks)
+    if status >= 400:
+        return status, _failed(_error_message(raw, status))
+    if not raw:
+        return status, b'"ok":true,"data":null,"error":null'
+    if raw.startswith(_ENVELOPE) and raw.endswith(b"}"):
+        return status, raw[1:-1]
+    return status, b'"ok":true,"data":' + raw + b',"error":null'
+
+
+async def run_batch(
+    app: ASGIApp,
+    parent: Scope,
+    prefix: str,
+    items: list[BatchRequestItem],
+    concurrency: int,
+    timeout: float,
+) -> bytes:
+    """Run the items against app and return the ApiResponse[BatchResult] JSON body.
+
+    prefix is the path the API router is mounted at (/api); item paths are relative to it.
+    At most `concurrency` reads run at once, and each item gets `timeout` seconds.
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    outcomes: list[tuple[int, bytes]] = [(500, b"")] * len(items)
+
+    async def run_one(i: int) -> None:
+        async with semaphore:
+            outcomes[i] = await _dispatch(app, parent, prefix, items[i], timeout)
+
+    i = 0
+    while i < len(items):
+        end = i + 1
+        if items[i].method in _READ_METHODS:
+            while end < len(items) and items[end].method in _READ_METHODS:
+                end += 1
+        await asyncio.gather(*(run_one(k) for k in range(i, end)))
+        i = end
+
+    results = [
+        b'{"id":' + _json(item.id if item.id is not None else str(n)) + b',"status":%d,' % status + members + b"}"
+        for n, (item, (status, members)) in enumerate(zip(items, outcomes, strict=True))
+    ]
+    return b'{"ok":true,"data":{"results":[' + b",".join(results) + b']},"error":null}'
@@ -0,0 +1,198 @@
+"""Plan-auto feature progress backed by the `features` table.
+
+A feature is keyed by (project, position), its index in feature_list.json. Completion
+counters per project and per spec live in feature_project_progress / feature_spec_progress
+and are adjusted by triggers in the same transaction as the feature write (see
+data/init_db.sql), so "is everything done" reads one row instead of counting features.
+
+Concurrent writers (API requests, CLI runs, agents working in parallel) do not lose
+updates: a progress change is a single UPDATE of one feature row, and the counters are
+adjusted relatively (passed = passed + 1) rather than recomputed from an earlier read.
+"""
+import json
+from datetime import UTC, datetime
+
+from app.db import Connection, Database, Params, Row, SqlValue
+from app.schemas import (
+    FeatureImportResult,
+    FeatureList,
+    FeatureListEntry,
+    FeatureProgress,
+    FeatureState,
+)
+
+_COLUMNS = (
+    "id, project, position, spec_id, description, category, steps,"
+    " COALESCE(passes, FALSE) AS passes, updated_at"
+)
+
+_UPSERT = """
+    INSERT INTO features (project, position, spec_id, description, category, steps, passes, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT (project, position) DO UPDATE SET
+        spec_id = COALESCE(excluded.spec_id, features.spec_id),
+        description = excluded.description, category = excluded.category, steps = excluded.steps,
+        passes = {passes}, updated_at = excluded.updated_at
+"""
+
+# Merge import: a feature already recorded as passing stays passing, so re-importing a
+# stale feature_list.json cannot undo progress recorded in the meantime.
+_MERGE_PASSES = "(COALESCE(features.passes, FALSE) OR COALESCE(excluded.passes, FALSE))"
+
+
+def _now() -> datetime:
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+def _steps(value: SqlValue) -> list[str]:
+    if not isinstance(value, str) or not value:
+        return []
+    try:
+        steps = json.loads(value)
+    except json.JSONDecodeError:
+        return [value]
+    if steps is None:
+        return []
+    return [str(step) for step in steps] if isinstance(steps, list) else [str(steps)]
+
+
+def _feature(row: Row) -> FeatureState:
+    return FeatureState.model_validate({**row, "steps": _steps(row["steps"])})
+
+
+def _count(row: Row | None, key: str) -> int:
+    value = row.get(key) if row is not None else None
+    return value if isinstance(value, int) else 0
+
+
+def _progress(row: Row | None, project: str | None = None, spec_id: int | None = None) -> FeatureProgress:
+    total = _count(row, "total")
+    passed = _count(row, "passed")
+    return FeatureProgress(
+        project=project, spec_id=spec_id, total=total, passed=passed, complete=total > 0 and passed == total
+    )
+
+
+async def list_features(db: Database, project: str | None = None, spec_id: int | None = None) -> list[FeatureState]:
+    """Features in list order, optionally only one project's or one spec's."""
+    clauses: list[str] = []
+    params: list[SqlValue] = []
+    if project is not None:
+        clauses.append("project = ?")
+        params.append(project)
+    if spec_id is not None:
+        clauses.append("spec_id = ?")
+        params.append(spec_id)
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+    rows = await db.fetch_all(f"SELECT {_COLUMNS} FROM features {where} ORDER BY project, position, id", params)
+    return [_feature(row) for row in rows]
+
+
+async def _set_passes(db: Database, where: str, params: Params, passes: bool) -> FeatureState | None:
+    async with db.transaction() as conn:
+        # No-op when unchanged: updated_at and the counters are left alone
+        await conn.execute(
+            f"UPDATE features SET passes = ?, updated_at = ? WHERE {where} AND COALESCE(passes, FALSE) <> ?",
+            (passes, _now(), *params, passes),
+        )
+        rows = await conn.fetch_all(f"SELECT {_COLUMNS} FROM features WHERE {where}", params)
+    return _feature(rows[0]) if rows else None
+
+
+async def set_passes(db: Database, feature_id: int, passes: bool) -> FeatureState | None:
+    """Record one feature's verification state; None if there is no such feature."""
+    return await _set_passes(db, "id = ?", (feature_id,), passes)
+
+
+async def set_passes_at(db: Database, project: str, position: int, passes: bool) -> FeatureState | None:
+    """Same as set_passes, addressing the feature by its place in feature_list.json."""
+    return await _set_passes(db, "project = ? AND position = ?", (project, position), passes)
+
+
+async def project_progress(db: Database, project: str) -> FeatureProgress:
+    """Counters of one project: a single primary-key lookup."""
+    row = await db.fetch_one("SELECT total, passed FROM feature_project_progress WHERE project = ?", (project,))
+    return _progress(row, project=project)
+
+
+async def spec_progress(db: Database, spec_id: int) -> FeatureProgress:
+    """Counters of the features linked to one spec: a single primary-key lookup."""
+    row = await db.fetch_one("SELECT total, passed FROM feature_spec_progress WHERE spec_id = ?", (spec_id,))
+    return _progress(row, spec_id=spec_id)
+
+
+async def _resolve_spec(conn: Connection, spec: str) -> int | None:
+    rows = await conn.fetch_all("SELECT id FROM specs WHERE path = ? OR name = ? ORDER BY id LIMIT 1", (spec, spec))
+    value = rows[0]["id"] if rows else None
+    return value if isinstance(value, int) else None
+
+
+async def import_feature_list(db: Database, feature_list: FeatureList, replace: bool = False) -> FeatureImportResult:
+    """Load a feature_list.json document into the table in one transaction.
+
+    Features are matched by (project, position): descriptions, categories and steps are
+    taken from the document, stored features past the end of the list are deleted. With
+    replace=False a stored passes=true is kept even if the document says false; with
+    replace=True the document's passes values win.
+    """
+    now = _now()
+    async with db.transaction() as conn:
+        spec_id = await _resolve_spec(conn, feature_list.spec) if feature_list.spec else None
+        rows: list[Params] = [
+            (
+                feature_list.project,
+                position,
+                spec_id,
+                entry.description,
+                entry.category,
+                json.dumps(entry.steps, ensure_ascii=False),
+                entry.passes,
+                now,
+            )
+            for position, entry in enumerate(feature_list.features)
+        ]
+        if rows:
+            passes = "excluded.passes" if replace else _MERGE_PASSES
+            await conn.execute_many(_UPSERT.format(passes=passes), rows)
+        stale = await conn.fetch_all(
+            "SELECT count(*) AS n FROM features WHERE project = ? AND position >= ?",
+            (feature_list.project, len(rows)),
+        )
+        removed = _count(stale[0] if stale else None, "n")
+        if removed:
+            await conn.execute(
+                "DELETE FROM features WHERE project = ? AND position >= ?", (feature_list.project, len(rows))
+            )
+        counters = await conn.fetch_all(
+            "SELECT total, passed FROM feature_project_progress WHERE project = ?", (feature_list.project,)
+        )
+    return FeatureImportResult(
+        imported=len(rows),
+        removed=removed,
+        progress=_progress(counters[0] if counters else None, project=feature_list.project),
+    )
+
+
+async def export_feature_list(db: Database, project: str) -> FeatureList | None:
+    """The project's features in feature_list.json form; None if the project has none."""
+    features = await list_features(db, project=project)
+    if not features:
+        return None
+    spec: str | None = None
+    spec_ids = {feature.spec_id for feature in features}
+    if len(spec_ids) == 1 and (spec_id := spec_ids.pop()) is not None:
+        row = await db.fetch_one("SELECT COALESCE(path, name) AS spec FROM specs WHERE id = ?", (spec_id,))
+        spec = row["spec"] if row is not None and isinstance(row["spec"], str) else None
+    return FeatureList(
+        project=project,
+        spec=spec,
+        features=[
+            FeatureListEntry(
+                category=feature.category,
+                description=feature.description,
+                steps=feature.steps,
+                passes=feature.passes,
+            )
+            for feature in features
+        ],
+    )
@@ -0,0 +1,89 @@
+"""Fan-out of spec changes to connected clients (the /api/spec/events stream).
+
+SpecSync publishes the specs whose files changed; every subscription keeps one pending
+change set that later publishes are merged into, so a client that reads slowly receives
+one coalesced event instead of a backlog, and memory per client is bounded by max_items.
+"""
+import asyncio
+
+from app.schemas import SpecChangeEvent, SpecItem
+
+
+class Subscription:
+    """Pending changes for one connected client."""
+
+    def __init__(self, version: int, max_items: int) -> None:
+        self.version = version
+        self._max_items = max_items
+        self._upserted: dict[int, SpecItem] = {}
+        self._removed: set[int] = set()
+        self._reset = False
+        self._ready = asyncio.Event()
+
+    def merge(self, version: int, upserted: list[SpecItem], removed: list[int], reset: bool) -> None:
+        """Fold a change into the pending set; later writes of the same spec win."""
+        self.version = version
+        if reset or self._reset:
+            self._reset = True
+        else:
+            for item in upserted:
+                self._removed.discard(item.id)
+                self._upserted[item.id] = item
+            for spec_id in removed:
+                self._upserted.pop(spec_id, None)
+                self._removed.add(spec_id)
+            if len(self._upserted) + len(self._removed) > self._max_items:
+                self._reset = True
+        if self._reset:
+            self._upserted.clear()
+            self._removed.clear()
+        self._ready.set()
+
+    async def next(self, timeout: float) -> SpecChangeEvent | None:
+        """Wait for pending changes and take them; None if nothing arrived within timeout."""
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout)
+        except TimeoutError:
+            return None
+        self._ready.clear()
+        event = SpecChangeEvent(
+            version=self.version,
+            reset=self._reset,
+            upserted=sorted(self._upserted.values(), key=lambda item: (item.updated_at, item.id), reverse=True),
+            removed=sorted(self._removed),
+        )
+        self._upserted = {}
+        self._removed = set()
+        self._reset = False
+        return event
+
+
+class SpecEvents:
+    """Process-wide set of subscriptions. Used from the event loop thread only."""
+
+    def __init__(self, max_items: int = 200) -> None:
+        self.max_items = max_items
+        self._subscriptions: set[Subscription] = set()
+
+    @property
+    def active(self) -> bool:
+        """Whether any client is listening (SpecSync skips building events otherwise)."""
+        return bool(self._subscriptions)
+
+    def subscribe(self, version: int) -> Subscription:
+        subscription = Subscription(version, self.max_items)
+        self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        self._subscriptions.discard(subscription)
+
+    def publish(
+        self,
+        version: int,
+        upserted: list[SpecItem] | None = None,
+        removed: list[int] | None = None,
+        reset: bool = False,
+    ) -> None:
+        for subscription in self._subscriptions:
+            subscription.merge(version, upserted or [], removed or [], reset)
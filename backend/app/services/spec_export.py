@@ -0,0 +1,73 @@
+"""Bulk export of specs with their features as NDJSON.
+
+Specs are read in keyset batches (by id) with one features query per batch, and each batch
+is serialized and yielded before the next is read: memory stays bounded by the batch size
+and the first bytes go out after the first batch.
+"""
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+
+from app.db import Database, Row, SqlValue
+from app.schemas import SpecExportRecord
+from app.services.spec_store import spec_columns
+
+EXPORT_MEDIA_TYPE = "application/x-ndjson"
+
+
+@dataclass(frozen=True, slots=True)
+class ExportQuery:
+    """Filters for an export; batch_size bounds how many specs are held at once."""
+
+    batch_size: int = 1000
+    include_content: bool = False
+    status: str | None = None
+    domain: str | None = None
+
+
+async def _features_by_spec(db: Database, spec_ids: list[SqlValue]) -> dict[SqlValue, list[Row]]:
+    placeholders = ", ".join("?" * len(spec_ids))
+    rows = await db.fetch_all(
+        "SELECT id, spec_id, description, category, COALESCE(passes, FALSE) AS passes, created_at"
+        f" FROM features WHERE spec_id IN ({placeholders}) ORDER BY spec_id, id",
+        spec_ids,
+    )
+    grouped: dict[SqlValue, list[Row]] = {}
+    for row in rows:
+        grouped.setdefault(row.pop("spec_id"), []).append(row)
+    return grouped
+
+
+async def iter_records(db: Database, query: ExportQuery) -> AsyncIterator[list[SpecExportRecord]]:
+    """Yield validated records one batch at a time, in id order."""
+    columns = spec_columns()
+    if query.include_content:
+        columns += ", content"
+    clauses = ["id > ?"]
+    filters: list[SqlValue] = []
+    if query.status is not None:
+        clauses.append("status = ?")
+        filters.append(query.status)
+    if query.domain is not None:
+        clauses.append("domain = ?")
+        filters.append(query.domain)
+    sql = f"SELECT {columns} FROM specs WHERE {' AND '.join(clauses)} ORDER BY id LIMIT ?"
+
+    last_id: SqlValue = 0
+    while True:
+        rows = await db.fetch_all(sql, (last_id, *filters, query.batch_size))
+        if not rows:
+            return
+        features = await _features_by_spec(db, [row["id"] for row in rows])
+        yield [
+            SpecExportRecord.model_validate({**row, "features": features.get(row["id"], [])})
+            for row in rows
+        ]
+        if len(rows) < query.batch_size:
+            return
+        last_id = rows[-1]["id"]
+
+
+async def iter_export(db: Database, query: ExportQuery) -> AsyncIterator[bytes]:
+    """Yield NDJSON chunks, one chunk per batch, one SpecExportRecord per line."""
+    async for records in iter_records(db, query):
+        yield b"".join(record.model_dump_json().encode() + b"\n" for record in records)
@@ -0,0 +1,167 @@
+"""In-process index of spec documents under docs/spec.
+
+Each spec file is parsed once (front-matter + task checkboxes) into a compact record.
+A refresh only stats the candidate files and re-parses those whose mtime or size
+changed; refreshes are throttled so that callers can ask for fresh records on every
+request without rescanning the disk.
+"""
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+LOCATIONS = ("active", "archive", "specs")
+
+# Status used when a spec has no `status:` line
+_DEFAULT_STATUS = {"active": "proposal", "archive": "archived", "specs": "current"}
+
+_FRONT_MATTER_LINE = re.compile(r"^([A-Za-z_][\w-]*):\s*(.*?)\s*$")
+_TASK = re.compile(rb"^[ \t]*[-*+][ \t]+\[([ xX])\]", re.MULTILINE)
+_HEADING = re.compile(rb"^#[ \t]+(.+?)[ \t#]*$", re.MULTILINE)
+
+
+@dataclass(slots=True, frozen=True)
+class SpecRecord:
+    """Compact parsed form of one spec file."""
+
+    id: str
+    title: str
+    status: str
+    domain: str | None
+    location: str
+    path: str
+    tasks_total: int
+    tasks_done: int
+    mtime_ns: int
+    size: int
+
+
+def parse_front_matter(text: str) -> dict[str, str]:
+    """Read leading `key: value` lines, optionally fenced by `---` lines.
+
+    Parsing stops at the first line that is not a key line, so a `status:` in the body
+    is not picked up.
+    """
+    fields: dict[str, str] = {}
+    lines = text.splitlines()
+    i = 0
+    while i < len(lines) and not lines[i].strip():
+        i += 1
+    fenced = i < len(lines) and lines[i].strip() == "---"
+    if fenced:
+        i += 1
+    for line in lines[i:]:
+        stripped = line.strip()
+        if fenced and stripped == "---":
+            break
+        match = _FRONT_MATTER_LINE.match(stripped)
+        if match is None:
+            if fenced and not stripped:
+                continue
+            break
+        fields.setdefault(match.group(1).lower(), match.group(2))
+    return fields
+
+
+def parse_spec(data: bytes, location: str, spec_id: str, rel_path: str) -> tuple[str, str, str | None, int, int]:
+    """Return (title, status, domain, tasks_total, tasks_done) for raw spec bytes."""
+    fields = parse_front_matter(data[:4096].decode("utf-8", errors="replace"))
+    heading = _HEADING.search(data)
+    title = heading.group(1).decode("utf-8", errors="replace") if heading else spec_id.rsplit("/", 1)[-1]
+    domain = fields.get("domain") or None
+    if domain is None and location == "specs":
+        # specs/<domain>/spec.md
+        parts = rel_path.split("/")
+        domain = parts[1] if len(parts) > 2 else None
+    tasks_total = 0
+    tasks_done = 0
+    for mark in _TASK.findall(data):
+        tasks_total += 1
+        if mark != b" ":
+            tasks_done += 1
+    status = fields.get("status") or _DEFAULT_STATUS[location]
+    return title, status, domain, tasks_total, tasks_done
+
+
+def _candidates(root: Path) -> dict[str, tuple[str, str, os.stat_result]]:
+    """Stat every spec file: rel_path -> (location, spec_id, stat).
+
+    A spec is either `<location>/<name>/spec.md` or a top-level `<location>/<name>.md`
+    (README.md excluded). Unreadable entries are skipped.
+    """
+    found: dict[str, tuple[str, str, os.stat_result]] = {}
+    for location in LOCATIONS:
+        try:
+            entries = list(os.scandir(root / location))
+        except OSError:
+            continue
+        for entry in entries:
+            try:
+                if entry.is_dir():
+                    spec = Path(entry.path) / "spec.md"
+                    st = spec.stat()
+                    rel = f"{location}/{entry.name}/spec.md"
+                    found[rel] = (location, f"{location}/{entry.name}", st)
+                elif entry.name.endswith(".md") and entry.name != "README.md":
+                    st = entry.stat()
+                    found[f"{location}/{entry.name}"] = (location, f"{location}/{entry.name[:-3]}", st)
+            except OSError:
+                continue
+    return found
+
+
+class SpecIndex:
+    """Thread-safe in-memory spec index with incremental, throttled refresh."""
+
+    def __init__(self, root: Path, refresh_seconds: float = 1.0) -> None:
+        self.root = root
+        self.refresh_seconds = refresh_seconds
+        self._records: dict[str, SpecRecord] = {}
+        self._lock = threading.Lock()
+        self._checked_at = float("-inf")
+        self.generation = 0
+
+    def refresh(self, force: bool = False) -> bool:
+        """Re-stat spec files and re-parse changed ones. Returns True if anything changed."""
+        with self._lock:
+            now = time.monotonic()
+            if not force and now - self._checked_at < self.refresh_seconds:
+                return False
+            self._checked_at = now
+            changed = False
+            records: dict[str, SpecRecord] = {}
+            for rel, (location, spec_id, st) in _candidates(self.root).items():
+                old = self._records.get(rel)
+                if old is not None and old.mtime_ns == st.st_mtime_ns and old.size == st.st_size:
+                    records[rel] = old
+                    continue
+                try:
+                    data = (self.root / rel).read_bytes()
+                except OSError:
+                    continue
+                title, status, domain, total, done = parse_spec(data, location, spec_id, rel)
+                records[rel] = SpecRecord(
+                    id=spec_id,
+                    title=title,
+                    status=status,
+                    domain=domain,
+                    location=location,
+                    path=rel,
+                    tasks_total=total,
+                    tasks_done=done,
+                    mtime_ns=st.st_mtime_ns,
+                    size=st.st_size,
+                )
+                changed = True
+            if changed or records.keys() != self._records.keys():
+                self._records = records
+                self.generation += 1
+                return True
+            return False
+
+    def records(self) -> list[SpecRecord]:
+        """Current records sorted by id (refreshing first if the interval elapsed)."""
+        self.refresh()
+        return sorted(self._records.values(), key=lambda r: r.id)
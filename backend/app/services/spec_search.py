@@ -0,0 +1,135 @@
+"""Ranked full-text search over spec titles and content.
+
+SQLite uses the trigram FTS5 index `specs_fts` (see data/init_db.sql), which matches any
+substring of at least three characters, Chinese included. Shorter terms cannot be looked up
+in a trigram index and are applied as LIKE filters instead. PostgreSQL uses the generated
+`search_vector` column and its GIN index.
+"""
+import re
+from dataclasses import dataclass
+
+from app.db import Database, Row, SqlValue
+from app.schemas import SpecSearchHit
+from app.services.spec_store import spec_columns
+
+HIGHLIGHT_START = "<mark>"
+HIGHLIGHT_END = "</mark>"
+ELLIPSIS = "…"
+
+# Shortest term the trigram tokenizer can match
+MIN_FTS_TERM = 3
+# Approximate snippet length (FTS5 counts tokens, the LIKE fallback counts characters)
+SNIPPET_TOKENS = 24
+SNIPPET_CHARS = 80
+
+
+@dataclass(frozen=True, slots=True)
+class SearchQuery:
+    """Search text (whitespace-separated terms, all required) plus filters and paging."""
+
+    text: str
+    limit: int
+    offset: int = 0
+    status: str | None = None
+    domain: str | None = None
+
+    def terms(self) -> list[str]:
+        return list(dict.fromkeys(self.text.split()))
+
+
+def _fts_phrase(term: str) -> str:
+    # Quoted FTS5 string: operators and punctuation in user input are taken literally
+    return '"' + term.replace('"', '""') + '"'
+
+
+def _like_pattern(term: str) -> str:
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def _filters(query: SearchQuery, alias: str) -> tuple[list[str], list[SqlValue]]:
+    clauses: list[str] = []
+    params: list[SqlValue] = []
+    if query.status is not None:
+        clauses.append(f"{alias}.status = ?")
+        params.append(query.status)
+    if query.domain is not None:
+        clauses.append(f"{alias}.domain = ?")
+        params.append(query.domain)
+    return clauses, params
+
+
+def highlight(text: str, terms: list[str]) -> str:
+    """Excerpt around the first match with every term wrapped in highlight markers."""
+    if not terms:
+        return text[:SNIPPET_CHARS]
+    pattern = re.compile("|".join(re.escape(t) for t in sorted(terms, key=len, reverse=True)), re.IGNORECASE)
+    match = pattern.search(text)
+    start = max(0, match.start() - SNIPPET_CHARS // 2) if match else 0
+    end = min(len(text), start + SNIPPET_CHARS)
+    excerpt = pattern.sub(lambda m: f"{HIGHLIGHT_START}{m[0]}{HIGHLIGHT_END}", text[start:end])
+    return f"{ELLIPSIS if start > 0 else ''}{excerpt}{ELLIPSIS if end < len(text) else ''}"
+
+
+async def _search_sqlite(db: Database, query: SearchQuery, terms: list[str]) -> list[Row]:
+    long_terms = [t for t in terms if len(t) >= MIN_FTS_TERM]
+    short_terms = [t for t in terms if len(t) < MIN_FTS_TERM]
+    clauses, params = _filters(query, "s")
+    for term in short_terms:
+        clauses.append("(s.title LIKE ? ESCAPE '\\' OR s.content LIKE ? ESCAPE '\\')")
+        params.extend((_like_pattern(term), _like_pattern(term)))
+
+    if not long_terms:
+        # No term the index can serve: scan, newest first, and cut snippets here
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = await db.fetch_all(
+            f"SELECT {spec_columns('s')}, s.content AS content, 0.0 AS rank FROM specs s {where}"
+            " ORDER BY s.updated_at DESC, s.id DESC LIMIT ? OFFSET ?",
+            (*params, query.limit, query.offset),
+        )
+        for row in rows:
+            content = row.pop("content")
+            row["snippet"] = highlight(content if isinstance(content, str) else "", short_terms)
+        return rows
+
+    match = " AND ".join(_fts_phrase(t) for t in long_terms)
+    where = " AND ".join(["specs_fts MATCH ?", *clauses])
+    # bm25 is lower-is-better; title matches weigh ten times body matches
+    return await db.fetch_all(
+        f"SELECT {spec_columns('s')},"
+        f" snippet(specs_fts, -1, '{HIGHLIGHT_START}', '{HIGHLIGHT_END}', '{ELLIPSIS}', {SNIPPET_TOKENS}) AS snippet,"
+        " -bm25(specs_fts, 10.0, 1.0) AS rank"
+        f" FROM specs_fts JOIN specs s ON s.id = specs_fts.rowid WHERE {where}"
+        " ORDER BY bm25(specs_fts, 10.0, 1.0) LIMIT ? OFFSET ?",
+        (match, *params, query.limit, query.offset),
+    )
+
+
+async def _search_postgres(db: Database, query: SearchQuery, terms: list[str]) -> list[Row]:
+    clauses, params = _filters(query, "s")
+    where = " AND ".join(["s.search_vector @@ q.query", *clauses])
+    options = f"StartSel={HIGHLIGHT_START}, StopSel={HIGHLIGHT_END}, MaxWords=35, MinWords=15"
+    # Rank and page first; ts_headline is costly and only runs for the rows returned
+    return await db.fetch_all(
+        f"SELECT {spec_columns('s')},"
+        f" ts_headline('simple', coalesce(s.content, ''), hit.query, '{options}') AS snippet, hit.rank AS rank"
+        " FROM ("
+        "   SELECT s.id, q.query, ts_rank(s.search_vector, q.query) AS rank"
+        "   FROM specs s, plainto_tsquery('simple', ?) AS q(query)"
+        f"  WHERE {where}"
+        "   ORDER BY rank DESC, s.id DESC LIMIT ? OFFSET ?"
+        " ) hit JOIN specs s ON s.id = hit.id ORDER BY hit.rank DESC, s.id DESC",
+        (" ".join(terms), *params, query.limit, query.offset),
+    )
+
+
+async def search_specs(db: Database, query: SearchQuery) -> list[SpecSearchHit]:
+    """Best matches first; every term must match."""
+    terms = query.terms()
+    if not terms:
+        return []
+    if db.dialect == "postgres":
+        rows = await _search_postgres(db, query, terms)
+    else:
+        rows = await _search_sqlite(db, query, terms)
+    return [SpecSearchHit.model_validate(row) for row in rows]
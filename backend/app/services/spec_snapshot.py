@@ -0,0 +1,344 @@
+"""Read-only snapshot of the spec listing, shared by all worker processes through mmap.
+
+The snapshot is one binary file per generation in the snapshot directory, plus a
+`CURRENT` file naming the live generation. Whenever a worker's SpecSync writes to the
+specs table, that worker rebuilds the snapshot from the table and swaps CURRENT with
+an atomic rename; every worker notices the new generation with one stat per request
+and maps the file read-only. Pages of /api/spec/list are then cut out of the mapping
+(no SQL, no per-worker copy of the data) and workers agree on the data as soon as
+CURRENT is swapped.
+
+File layout (little-endian):
+
+    header   magic, generation, row count, newest updated_at, fingerprint, section offsets
+    rows     one fixed-size row per spec in listing order (updated_at DESC, id DESC):
+             updated_at (us since epoch), id, JSON offset and length, status and domain
+             (indexes into the string table, NONE for null)
+    json     each spec serialized as SpecItem JSON, exactly as the API returns it
+    strings  distinct status/domain values
+    postings per string: the row indexes having it as status, then as domain
+
+Builders take an exclusive lock on `.lock` and read the table while holding it, so
+generations are ordered like the data they contain.
+"""
+import asyncio
+import fcntl
+import hashlib
+import mmap
+import os
+import struct
+from bisect import bisect_right
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from app.core import encode_cursor
+from app.db import Database, Row
+from app.schemas import SpecItem
+from app.services.spec_store import SpecQuery, spec_columns, to_utc
+
+_MAGIC = b"SPECSNP1"
+# magic, generation, rows, newest updated_at (us), fingerprint, rows/json/strings/postings offsets
+_HEADER = struct.Struct("<8sQIq16sQQQQ")
+# updated_at (us), id, json offset, json length, status, domain
+_ROW = struct.Struct("<qqQIII")
+# string offset, length, status postings offset, count, domain postings offset, count
+_STRING = struct.Struct("<QIQIQI")
+_INDEX = struct.Struct("<I")
+NONE = 0xFFFFFFFF
+
+_EPOCH = datetime(1970, 1, 1)
+_CURRENT = "CURRENT"
+_LOCK = ".lock"
+
+# Cheap summary of the table, to tell whether an existing snapshot still matches it
+_FINGERPRINT_SQL = (
+    "SELECT count(*) AS n, COALESCE(sum(id), 0) AS ids, COALESCE(sum(file_size), 0) AS sizes,"
+    " COALESCE(sum(tasks_total), 0) AS total, COALESCE(sum(tasks_done), 0) AS done,"
+    " min(updated_at) AS oldest, max(updated_at) AS newest FROM specs"
+)
+
+
+def _micros(value: datetime) -> int:
+    return (to_utc(value) - _EPOCH) // timedelta(microseconds=1)
+
+
+def _from_micros(value: int) -> datetime:
+    return _EPOCH + timedelta(microseconds=value)
+
+
+def _fingerprint(row: Row | None) -> bytes:
+    values = "|".join(str(row[key]) for key in ("n", "ids", "sizes", "total", "done", "oldest", "newest")) if row else ""
+    return hashlib.blake2b(values.encode(), digest_size=16).digest()
+
+
+def _build(generation: int, fingerprint: bytes, items: list[SpecItem]) -> bytes:
+    """Serialize items (already in listing order) into the snapshot format."""
+    strings: dict[str, int] = {}
+    status_postings: list[list[int]] = []
+    domain_postings: list[list[int]] = []
+
+    def intern(value: str | None) -> int:
+        if value is None:
+            return NONE
+        index = strings.get(value)
+        if index is None:
+            index = strings[value] = len(strings)
+            status_postings.append([])
+            domain_postings.append([])
+        return index
+
+    rows = bytearray()
+    blobs = bytearray()
+    for n, item in enumerate(items):
+        blob = item.model_dump_json().encode()
+        status = intern(item.status)
+        domain = intern(item.domain)
+        if status != NONE:
+            status_postings[status].append(n)
+        if domain != NONE:
+            domain_postings[domain].append(n)
+        rows += _ROW.pack(_micros(item.updated_at), item.id, len(blobs), len(blob), status, domain)
+        blobs += blob
+
+    rows_off = _HEADER.size
+    json_off = rows_off + len(rows)
+    strings_off = json_off + len(blobs)
+    postings_off = strings_off + _STRING.size * len(strings)
+    table = bytearray()
+    heap = bytearray()
+    postings = bytearray()
+    heap_off = postings_off + _INDEX.size * sum(len(p) for p in status_postings + domain_postings)
+    for value, index in strings.items():
+        encoded = value.encode()
+        status_at = postings_off + len(postings)
+        postings += b"".join(_INDEX.pack(i) for i in status_postings[index])
+        domain_at = postings_off + len(postings)
+        postings += b"".join(_INDEX.pack(i) for i in domain_postings[index])
+        table += _STRING.pack(
+            heap_off + len(heap),
+            len(encoded),
+            status_at,
+            len(status_postings[index]),
+            domain_at,
+            len(domain_postings[index]),
+        )
+        heap += encoded
+    newest = _micros(items[0].updated_at) if items else 0
+    header = _HEADER.pack(
+        _MAGIC, generation, len(items), newest, fingerprint, rows_off, json_off, strings_off, postings_off
+    )
+    return b"".join((header, rows, blobs, table, postings, heap))
+
+
+class _Postings:
+    """Row indexes of one status or domain value, read from the mapping (enough for bisect)."""
+
+    def __init__(self, buf: memoryview, offset: int, count: int) -> None:
+        self._buf = buf
+        self._offset = offset
+        self._count = count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, i: int) -> int:
+        if not 0 <= i < self._count:
+            raise IndexError(i)
+        return _INDEX.unpack_from(self._buf, self._offset + i * _INDEX.size)[0]
+
+
+@dataclass(frozen=True, slots=True)
+class _Value:
+    index: int
+    status_rows: _Postings
+    domain_rows: _Postings
+
+
+class SnapshotView:
+    """One mapped generation. Pages are built from memoryview slices of the mapping."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        with path.open("rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._buf = memoryview(self._map)
+        magic, self.generation, self.count, newest, self.fingerprint, self._rows, self._json, strings, postings = (
+            _HEADER.unpack_from(self._buf, 0)
+        )
+        if magic != _MAGIC:
+            raise ValueError(f"{path} is not a spec snapshot")
+        self.last_modified = _from_micros(newest).replace(tzinfo=UTC) if self.count else None
+        # Distinct values are few (statuses, domains); decode them once per generation
+        self._values: dict[str, _Value] = {}
+        for i in range((postings - strings) // _STRING.size):
+            s_off, s_len, st_off, st_n, dm_off, dm_n = _STRING.unpack_from(self._buf, strings + i * _STRING.size)
+            value = bytes(self._buf[s_off : s_off + s_len]).decode()
+            self._values[value] = _Value(i, _Postings(self._buf, st_off, st_n), _Postings(self._buf, dm_off, dm_n))
+
+    def _row(self, n: int) -> tuple[int, int, int, int, int, int]:
+        return _ROW.unpack_from(self._buf, self._rows + n * _ROW.size)
+
+    def _key(self, n: int) -> tuple[int, int]:
+        # Rows are in descending (updated_at, id) order; negated they ascend, as bisect needs
+        updated, row_id = _ROW.unpack_from(self._buf, self._rows + n * _ROW.size)[:2]
+        return -updated, -row_id
+
+    def page(self, query: SpecQuery) -> tuple[list[memoryview], str | None]:
+        """JSON of the items on the page and the next cursor, as list_page would return them."""
+        status = self._values.get(query.status) if query.status is not None else None
+        domain = self._values.get(query.domain) if query.domain is not None else None
+        if (query.status is not None and status is None) or (query.domain is not None and domain is None):
+            return [], None
+        # Walk the shorter posting list and check the other filter per row
+        candidates: range | _Postings = range(self.count)
+        check_status = check_domain = None
+        if status is not None and (domain is None or len(status.status_rows) <= len(domain.domain_rows)):
+            candidates = status.status_rows
+            check_domain = domain.index if domain is not None else None
+        elif domain is not None:
+            candidates = domain.domain_rows
+            check_status = status.index if status is not None else None
+
+        key: Callable[[int], tuple[int, int]] = self._key
+        start = 0
+        if query.after is not None:
+            start = bisect_right(candidates, (-_micros(query.after[0]), -query.after[1]), key=key)
+        if query.updated_to is not None:
+            # First row with updated_at < updated_to (2**63 sorts after every negated id)
+            start = max(start, bisect_right(candidates, (-_micros(query.updated_to), 2**63), key=key))
+        end = len(candidates)
+        if query.updated_from is not None:
+            # First row with updated_at < updated_from
+            end = bisect_right(candidates, (-_micros(query.updated_from), 2**63), key=key)
+
+        blobs: list[memoryview] = []
+        last: tuple[int, int] | None = None
+        more = False
+        for i in range(start, end):
+            updated, row_id, json_off, json_len, row_status, row_domain = self._row(candidates[i])
+            if (check_status is not None and row_status != check_status) or (
+                check_domain is not None and row_domain != check_domain
+            ):
+                continue
+            if len(blobs) == query.limit:
+                more = True
+                break
+            offset = self._json + json_off
+            blobs.append(self._buf[offset : offset + json_len])
+            last = (updated, row_id)
+        next_cursor = encode_cursor(_from_micros(last[0]), last[1]) if more and last is not None else None
+        return blobs, next_cursor
+
+    def page_response(self, query: SpecQuery) -> bytes:
+        """The whole ApiResponse[Page[SpecItem]] body, byte-identical to the model's JSON."""
+        blobs, next_cursor = self.page(query)
+        cursor = f'"{next_cursor}"' if next_cursor is not None else "null"
+        return b"".join(
+            (
+                b'{"ok":true,"data":{"items":[',
+                b",".join(blobs),
+                f'],"next_cursor":{cursor},"limit":{query.limit}}},"error":null}}'.encode(),
+            )
+        )
+
+
+class SpecSnapshot:
+    """Maps the current snapshot; `rebuild` is SpecSync's on_write hook."""
+
+    def __init__(self, directory: Path, keep: int = 2) -> None:
+        self.directory = directory
+        self.keep = keep
+        self._view: SnapshotView | None = None
+        self._current_stat: tuple[int, int] | None = None
+        self._verified = False
+        self._lock = asyncio.Lock()
+
+    def current(self) -> SnapshotView | None:
+        """The live generation, remapped if another worker swapped CURRENT since the last call."""
+        try:
+            st = os.stat(self.directory / _CURRENT)
+        except OSError:
+            return None
+        stamp = (st.st_ino, st.st_mtime_ns)
+        if stamp != self._current_stat:
+            try:
+                generation = int((self.directory / _CURRENT).read_text().strip())
+                view = SnapshotView(self._file(generation))
+            except (OSError, ValueError):
+                return self._view
+            # The previous mapping is released once no request holds slices of it
+            self._view = view
+            self._current_stat = stamp
+        return self._view
+
+    async def ensure(self, db: Database) -> SnapshotView:
+        """Current snapshot. The first call per process checks it against the table (a
+        snapshot left by an earlier run may be stale) and builds one if needed."""
+        view = self.current()
+        if view is None or not self._verified:
+            async with self._lock:
+                if not self._verified or self.current() is None:
+                    await self.rebuild(db, force=False)
+                    self._verified = True
+            view = self.current()
+        if view is None:
+            raise OSError(f"No spec snapshot in {self.directory}")
+        return view
+
+    def _file(self, generation: int) -> Path:
+        return self.directory / f"specs-{generation:012d}.snap"
+
+    async def rebuild(self, db: Database, force: bool = True) -> None:
+        """Write a new generation from the specs table.
+
+        Without force, nothing is written if the current generation's fingerprint matches
+        the table; the fingerprint is only a summary, so writers pass force.
+        """
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd = os.open(self.directory / _LOCK, os.O_RDWR | os.O_CREAT, 0o644)
+        except OSError:
+            self._verified = False
+            raise
+        try:
+            await asyncio.to_thread(fcntl.flock, fd, fcntl.LOCK_EX)
+            # Read under the lock: a later generation never holds older data
+            fingerprint = _fingerprint(await db.fetch_one(_FINGERPRINT_SQL))
+            view = self.current()
+            if not force and view is not None and view.fingerprint == fingerprint:
+                return
+            rows = await db.fetch_all(f"SELECT {spec_columns()} FROM specs ORDER BY updated_at DESC, id DESC")
+            await asyncio.to_thread(self._write, rows, fingerprint)
+            self.current()
+        except OSError:
+            # Check again on the next ensure() instead of serving a stale generation
+            self._verified = False
+            raise
+        finally:
+            os.close(fd)
+
+    def _write(self, rows: list[Row], fingerprint: bytes) -> None:
+        try:
+            generation = int((self.directory / _CURRENT).read_text().strip()) + 1
+        except (OSError, ValueError):
+            generation = 1
+        items = [SpecItem.model_validate(row) for row in rows]
+        # Text timestamps sort differently from datetimes when fractions are missing
+        items.sort(key=lambda item: (_micros(item.updated_at), item.id), reverse=True)
+        data = _build(generation, fingerprint, items)
+        path = self._file(generation)
+        tmp = path.with_suffix(".tmp")
+        with tmp.open("wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+        current_tmp = self.directory / f"{_CURRENT}.tmp"
+        current_tmp.write_text(f"{generation}\n")
+        os.replace(current_tmp, self.directory / _CURRENT)
+        # Workers still mapping an older file keep it readable after unlink
+        for old in self.directory.glob("specs-*.snap"):
+            if old.name < self._file(generation - self.keep + 1).name:
+                old.unlink(missing_ok=True)
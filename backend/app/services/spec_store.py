@@ -0,0 +1,243 @@
+"""Spec listing backed by the `specs` table (SQLite or PostgreSQL, see app/db).
+
+SpecSync mirrors SpecIndex records into the table, writing only rows whose file changed,
+and reports the files its index saw change to SpecEvents so connected clients can patch
+their lists. Events follow the files rather than the writes: with several workers, any
+of them may be the one that writes a change, and every worker's clients must hear of it.
+list_page serves one keyset page ordered by (updated_at, id) descending, so the cost of a
+page does not grow with the size of the archive.
+"""
+import asyncio
+import contextlib
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+from app.core import Page, encode_cursor
+from app.db import Database, Params, SqlValue
+from app.schemas import SpecItem
+from app.services.spec_events import SpecEvents
+from app.services.spec_index import SpecIndex, SpecRecord
+
+
+def spec_columns(alias: str = "") -> str:
+    """Select list for SpecItem rows; alias qualifies the columns when specs is joined."""
+    p = f"{alias}." if alias else ""
+    return (
+        f"{p}id AS id, {p}name AS name, {p}title AS title, {p}status AS status, {p}domain AS domain,"
+        f" {p}location AS location, {p}path AS path, COALESCE({p}tasks_total, 0) AS tasks_total,"
+        f" COALESCE({p}tasks_done, 0) AS tasks_done, {p}updated_at AS updated_at"
+    )
+
+
+_COLUMNS = spec_columns()
+
+_STORED = "SELECT id, path, updated_at, file_size FROM specs WHERE path IS NOT NULL"
+
+_UPSERT = """
+    INSERT INTO specs (name, title, status, domain, location, path,
+                       tasks_total, tasks_done, file_size, content, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT (path) DO UPDATE SET
+        name = excluded.name, title = excluded.title, status = excluded.status,
+        domain = excluded.domain, location = excluded.location,
+        tasks_total = excluded.tasks_total, tasks_done = excluded.tasks_done,
+        file_size = excluded.file_size, content = excluded.content,
+        updated_at = excluded.updated_at
+"""
+
+
+def to_utc(value: datetime) -> datetime:
+    """Naive UTC, as stored in updated_at; naive input is taken as UTC."""
+    if value.tzinfo is not None:
+        value = value.astimezone(UTC).replace(tzinfo=None)
+    return value
+
+
+def _as_datetime(value: object) -> datetime | None:
+    # SQLite returns timestamps as text, PostgreSQL as datetime
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, str):
+        return datetime.fromisoformat(value)
+    return None
+
+
+def _mtime(record: SpecRecord) -> datetime:
+    return to_utc(datetime.fromtimestamp(record.mtime_ns / 1e9, UTC))
+
+
+class SpecSync:
+    """Keeps the specs table in step with a SpecIndex.
+
+    `version` increases whenever a sync finds spec files changed since this process last
+    looked, or writes to the table, so cached responses built from an older version can be
+    discarded; `last_modified` is the newest spec file mtime. on_write runs after each
+    write, e.g. to rebuild the shared snapshot (spec_snapshot.py).
+    """
+
+    def __init__(
+        self,
+        index: SpecIndex,
+        events: SpecEvents | None = None,
+        on_write: Callable[[Database], Awaitable[None]] | None = None,
+    ) -> None:
+        self.index = index
+        self.events = events
+        self.on_write = on_write
+        self.version = 0
+        self.last_modified: datetime | None = None
+        self._generation = -1
+        # Per file, as of this process's last sync: (mtime_ns, size), and its row id if known
+        self._seen: dict[str, tuple[int, int]] = {}
+        self._ids: dict[str, int] = {}
+        self._lock = asyncio.Lock()
+
+    async def sync(self, db: Database, force: bool = False) -> None:
+        """Upsert changed spec files and delete rows whose file is gone; no-op if the index is unchanged.
+
+        force skips the index refresh interval (the file watcher knows something changed).
+        """
+        # Stat (and re-parse) off the event loop
+        await asyncio.to_thread(self.index.refresh, force)
+        if self.index.generation == self._generation:
+            return
+        async with self._lock:
+            generation = self.index.generation
+            if generation == self._generation:
+                return
+            records = self.index.records()
+            stored: dict[str, tuple[datetime | None, SqlValue, SqlValue]] = {
+                row["path"]: (_as_datetime(row["updated_at"]), row["file_size"], row["id"])
+                for row in await db.fetch_all(_STORED)
+                if isinstance(row["path"], str)
+            }
+            self._ids.update(
+                (path, row_id)
+                for path, (_, _, row_id) in stored.items()
+                if isinstance(row_id, int) and not isinstance(row_id, bool)
+            )
+            # What this process's index saw change, whether or not this process writes the rows:
+            # another worker may have synced the same change first
+            seen = {r.path: (r.mtime_ns, r.size) for r in records}
+            touched = [path for path, stamp in seen.items() if self._seen.get(path) != stamp]
+            gone = [path for path in self._seen if path not in seen]
+
+            changed = [r for r in records if stored.pop(r.path, (None, None, None))[:2] != (_mtime(r), r.size)]
+            rows = await asyncio.to_thread(self._rows, changed)
+            if rows or stored:
+                async with db.transaction() as conn:
+                    if rows:
+                        await conn.execute_many(_UPSERT, rows)
+                    if stored:
+                        await conn.execute_many(
+                            "DELETE FROM specs WHERE path = ?", [(path,) for path in stored]
+                        )
+                if rows:
+                    # Ids of inserted rows, so their removal can be published even if another
+                    # worker deletes them before this process looks at the table again
+                    self._ids.update(
+                        (row["path"], row["id"])
+                        for row in await db.fetch_all(_STORED)
+                        if isinstance(row["path"], str) and isinstance(row["id"], int)
+                    )
+                if self.on_write is not None:
+                    # A failed snapshot rebuild is retried when the snapshot is next used
+                    with contextlib.suppress(OSError):
+                        await self.on_write(db)
+            if rows or stored or touched or gone:
+                self.version += 1
+                if self.events is not None and self.events.active:
+                    await self._publish(db, touched, gone)
+            for path in gone:
+                self._ids.pop(path, None)
+            self._seen = seen
+            newest = max((r.mtime_ns for r in records), default=None)
+            self.last_modified = datetime.fromtimestamp(newest / 1e9, UTC) if newest is not None else None
+            self._generation = generation
+
+    async def _publish(self, db: Database, paths: list[str], gone: list[str]) -> None:
+        if self.events is None:
+            return
+        removed = [self._ids[path] for path in gone if path in self._ids]
+        if len(paths) + len(gone) > self.events.max_items or len(removed) < len(gone):
+            # Bulk change (first sync, mass archive), or a row another worker deleted before
+            # this process learned its id: clients reload instead
+            self.events.publish(self.version, reset=True)
+            return
+        upserted: list[SpecItem] = []
+        if paths:
+            marks = ", ".join("?" * len(paths))
+            rows = await db.fetch_all(f"SELECT {_COLUMNS} FROM specs WHERE path IN ({marks})", paths)
+            upserted = [SpecItem.model_validate(row) for row in rows]
+            self._ids.update((item.path, item.id) for item in upserted if item.path is not None)
+        self.events.publish(self.version, upserted=upserted, removed=removed)
+
+    def _rows(self, records: list[SpecRecord]) -> list[Params]:
+        return [
+            (
+                record.id.rsplit("/", 1)[-1],
+                record.title,
+                record.status,
+                record.domain,
+                record.location,
+                record.path,
+                record.tasks_total,
+                record.tasks_done,
+                record.size,
+                self._read(record),
+                _mtime(record),
+            )
+            for record in records
+        ]
+
+    def _read(self, record: SpecRecord) -> str | None:
+        try:
+            return (self.index.root / record.path).read_text(encoding="utf-8", errors="replace")
+        except OSError:
+            return None
+
+
+@dataclass(frozen=True, slots=True)
+class SpecQuery:
+    """Filters and keyset position for one listing page."""
+
+    limit: int
+    status: str | None = None
+    domain: str | None = None
+    updated_from: datetime | None = None
+    updated_to: datetime | None = None
+    after: tuple[datetime, int] | None = None
+
+
+async def list_page(db: Database, query: SpecQuery) -> Page[SpecItem]:
+    """Newest first. Equality filters and the (updated_at, id) range map onto the composite indexes."""
+    clauses: list[str] = []
+    params: list[str | int | datetime] = []
+    if query.status is not None:
+        clauses.append("status = ?")
+        params.append(query.status)
+    if query.domain is not None:
+        clauses.append("domain = ?")
+        params.append(query.domain)
+    if query.updated_from is not None:
+        clauses.append("updated_at >= ?")
+        params.append(to_utc(query.updated_from))
+    if query.updated_to is not None:
+        clauses.append("updated_at < ?")
+        params.append(to_utc(query.updated_to))
+    if query.after is not None:
+        clauses.append("(updated_at, id) < (?, ?)")
+        params.extend((to_utc(query.after[0]), query.after[1]))
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+    # One extra row tells whether another page exists
+    rows = await db.fetch_all(
+        f"SELECT {_COLUMNS} FROM specs {where} ORDER BY updated_at DESC, id DESC LIMIT ?",
+        (*params, query.limit + 1),
+    )
+    items = [SpecItem.model_validate(row) for row in rows[: query.limit]]
+    next_cursor = None
+    if len(rows) > query.limit:
+        last = items[-1]
+        next_cursor = encode_cursor(last.updated_at, last.id)
+    return Page(items=items, next_cursor=next_cursor, limit=query.limit)
@@ -0,0 +1,126 @@
+"""Watches docs/spec while clients listen on /api/spec/events and syncs on every change.
+
+File events come from watchfiles (inotify on Linux, installed with uvicorn[standard]);
+bursts of writes, e.g. an editor's save or an archive run moving many files, are
+grouped into one sync. Without watchfiles the directory is re-scanned on an interval.
+Nothing runs while no client is connected.
+"""
+import asyncio
+import contextlib
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from app.db import Database
+from app.schemas import SpecChangeEvent
+from app.services.spec_events import SpecEvents, Subscription
+from app.services.spec_store import SpecSync
+
+EVENT_STREAM_MEDIA_TYPE = "text/event-stream"
+
+# Browser EventSource reconnect delay after a dropped connection
+_RETRY_MS = 2000
+
+logger = logging.getLogger(__name__)
+
+
+class SpecWatcher:
+    """Single watch task per process, started by the first listener and stopped after the last."""
+
+    def __init__(
+        self,
+        spec_sync: SpecSync,
+        db: Database,
+        events: SpecEvents,
+        debounce_ms: int = 200,
+        max_delay_ms: int = 800,
+        poll_seconds: float = 0.5,
+        force_polling: bool = False,
+    ) -> None:
+        self.spec_sync = spec_sync
+        self.db = db
+        self.events = events
+        self.debounce_ms = debounce_ms
+        self.max_delay_ms = max_delay_ms
+        self.poll_seconds = poll_seconds
+        self.force_polling = force_polling
+        self._task: asyncio.Task[None] | None = None
+
+    @asynccontextmanager
+    async def listen(self) -> AsyncIterator[Subscription]:
+        """Subscribe to spec changes for the duration of the block."""
+        subscription = self.events.subscribe(self.spec_sync.version)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        try:
+            yield subscription
+        finally:
+            self.events.unsubscribe(subscription)
+            if not self.events.active:
+                # No await here: the block usually exits because the response was cancelled
+                self._cancel()
+
+    async def close(self) -> None:
+        """Stop watching (app shutdown)."""
+        task = self._task
+        self._cancel()
+        if task is not None:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    def _cancel(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _sync(self) -> None:
+        try:
+            await self.spec_sync.sync(self.db, force=True)
+        except Exception:
+            # Keep watching; the next change retries the sync
+            logger.exception("Spec sync after file change failed")
+
+    async def _run(self) -> None:
+        # Catch up on changes made while nobody was listening
+        await self._sync()
+        try:
+            from watchfiles import awatch
+        except ImportError:
+            awatch = None
+        root = self.spec_sync.index.root
+        while True:
+            if awatch is None or not root.is_dir():
+                await asyncio.sleep(self.poll_seconds)
+                await self._sync()
+                continue
+            try:
+                async for _changes in awatch(
+                    root,
+                    debounce=self.max_delay_ms,
+                    step=self.debounce_ms,
+                    force_polling=self.force_polling,
+                    poll_delay_ms=int(self.poll_seconds * 1000),
+                ):
+                    await self._sync()
+            except OSError:
+                # docs/spec removed or replaced; fall back to polling until it is back
+                logger.warning("Watching %s failed; polling instead", root, exc_info=True)
+
+
+def _frame(event: SpecChangeEvent, retry: bool = False) -> bytes:
+    head = f"retry: {_RETRY_MS}\n" if retry else ""
+    return f"{head}id: {event.version}\nevent: specs\ndata: {event.model_dump_json()}\n\n".encode()
+
+
+async def iter_events(watcher: SpecWatcher, heartbeat_seconds: float) -> AsyncIterator[bytes]:
+    """Server-sent events: a reset on connect, then coalesced changes as they are synced.
+
+    The reset tells the client to load the list now that it is subscribed, so nothing
+    written between its load and its subscription is missed. Comment lines keep idle
+    connections open through proxies.
+    """
+    async with watcher.listen() as subscription:
+        yield _frame(SpecChangeEvent(version=subscription.version, reset=True), retry=True)
+        while True:
+            event = await subscription.next(heartbeat_seconds)
+            yield b": ping\n\n" if event is None else _frame(event)
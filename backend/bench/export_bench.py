@@ -0,0 +1,191 @@
+"""Benchmark for /api/spec/export and the ApiResponse fast path.
+
+Seeds a temporary SQLite database (default 100k specs, 3 features each), then runs each
+scenario in a fresh subprocess so that peak RSS is measured per scenario:
+
+- stream:       iter_export (NDJSON, keyset batches) — what /api/spec/export sends
+- buffered:     all records in one ApiResponse, through FastAPI's default response_model
+                path (re-validate, jsonable_encoder, json.dumps)
+- fast_path:    all records in one ApiResponse, serialized by ApiJSONResponse
+
+Reports bytes, seconds, bytes/sec, time to first byte and peak RSS growth as JSON.
+
+Usage (from backend/):
+    python bench/export_bench.py
+    python bench/export_bench.py --records 20000 --include-content --output /tmp/export.json
+"""
+import argparse
+import asyncio
+import json
+import platform
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BACKEND = Path(__file__).resolve().parent.parent
+REPO = BACKEND.parent
+sys.path.insert(0, str(BACKEND))
+
+SCENARIOS = ("stream", "buffered", "fast_path")
+
+
+def _peak_rss_bytes() -> int:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+async def seed(path: Path, params: argparse.Namespace) -> None:
+    from app.db.sqlite import SQLiteDatabase
+
+    rng = random.Random(params.seed)
+    words = ("spec", "backend", "frontend", "分页", "列表", "接口", "归档", "用户", "登录", "search")
+    db = SQLiteDatabase(path, REPO / "data" / "init_db.sql", read_pool_size=1)
+    await db.open()
+    try:
+        async with db.transaction() as conn:
+            await conn.execute("DELETE FROM features")
+            await conn.execute("DELETE FROM specs")
+            batch = 5000
+            for start in range(0, params.records, batch):
+                specs = []
+                for i in range(start, min(start + batch, params.records)):
+                    text = " ".join(rng.choice(words) for _ in range(params.content_bytes // 6))
+                    specs.append(
+                        (
+                            i + 1,
+                            f"spec_{i:06d}",
+                            f"Spec {i}",
+                            rng.choice(("proposal", "implementation", "archived")),
+                            f"domain_{i % 50}",
+                            "archive",
+                            f"archive/spec_{i:06d}/spec.md",
+                            text,
+                            f"2026-01-01 00:00:{i % 60:02d}",
+                        )
+                    )
+                await conn.execute_many(
+                    "INSERT INTO specs (id, name, title, status, domain, location, path, content, updated_at)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    specs,
+                )
+                features = [
+                    (spec[0], f"feature {j} of {spec[1]}", "bench", j % 2 == 0)
+                    for spec in specs
+                    for j in range(params.features_per_spec)
+                ]
+                await conn.execute_many(
+                    "INSERT INTO features (spec_id, description, category, passes) VALUES (?, ?, ?, ?)",
+                    features,
+                )
+    finally:
+        await db.close()
+
+
+async def run_scenario(name: str, path: Path, params: argparse.Namespace) -> dict:
+    """Run one scenario in this process and return its measurements."""
+    from app.core import ApiJSONResponse, ApiResponse, success
+    from app.db.sqlite import SQLiteDatabase
+    from app.schemas import SpecExportRecord
+    from app.services import ExportQuery, iter_export, iter_records
+    from fastapi.encoders import jsonable_encoder
+
+    db = SQLiteDatabase(path, REPO / "data" / "init_db.sql", read_pool_size=1)
+    await db.open()
+    query = ExportQuery(batch_size=params.batch_size, include_content=params.include_content)
+    baseline_rss = _peak_rss_bytes()
+    start = time.perf_counter()
+    first_byte: float | None = None
+    total = 0
+    try:
+        if name == "stream":
+            async for chunk in iter_export(db, query):
+                if first_byte is None:
+                    first_byte = time.perf_counter() - start
+                total += len(chunk)
+        else:
+            # Collect everything first, as a non-streaming list endpoint would
+            records: list[SpecExportRecord] = []
+            async for batch in iter_records(db, query):
+                records.extend(batch)
+            payload = success(records)
+            if name == "buffered":
+                validated = ApiResponse[list[SpecExportRecord]].model_validate(payload.model_dump())
+                body = json.dumps(jsonable_encoder(validated)).encode()
+            else:
+                body = ApiJSONResponse(payload).body
+            first_byte = time.perf_counter() - start
+            total = len(body)
+    finally:
+        await db.close()
+    seconds = time.perf_counter() - start
+    return {
+        "bytes": total,
+        "seconds": seconds,
+        "bytes_per_sec": total / seconds if seconds else 0.0,
+        "first_byte_s": first_byte,
+        "peak_rss_growth_bytes": _peak_rss_bytes() - baseline_rss,
+        "peak_rss_bytes": _peak_rss_bytes(),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="NDJSON export / ApiResponse serialization benchmark")
+    parser.add_argument("--records", type=int, default=100_000, help="Number of specs to seed")
+    parser.add_argument("--features-per-spec", type=int, default=3, help="Features per spec")
+    parser.add_argument("--content-bytes", type=int, default=1024, help="Approximate spec content size")
+    parser.add_argument("--include-content", action="store_true", help="Export spec content too")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Export batch size")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help="Comma-separated scenarios to run")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--db", default=None, help="Reuse this database instead of seeding a temporary one")
+    parser.add_argument("--scenario", default=None, help=argparse.SUPPRESS)  # internal: child process
+    parser.add_argument("--output", default=None, help="Write the JSON result here instead of stdout")
+    params = parser.parse_args()
+
+    if params.scenario:
+        result = asyncio.run(run_scenario(params.scenario, Path(params.db), params))
+        print(json.dumps(result))
+        return
+
+    with tempfile.TemporaryDirectory(prefix="export_bench_") as tmp:
+        db_path = Path(params.db) if params.db else Path(tmp) / "bench.db"
+        if not params.db:
+            asyncio.run(seed(db_path, params))
+        results = {}
+        for name in params.scenarios.split(","):
+            argv = [sys.executable, __file__, "--scenario", name, "--db", str(db_path)]
+            argv += ["--batch-size", str(params.batch_size)]
+            if params.include_content:
+                argv.append("--include-content")
+            out = subprocess.run(argv, check=True, capture_output=True, text=True, cwd=BACKEND).stdout
+            results[name] = json.loads(out)
+            r = results[name]
+            print(
+                f"{name:<10} {r['bytes'] / 1e6:8.1f} MB  {r['seconds']:6.2f} s  "
+                f"{r['bytes_per_sec'] / 1e6:7.1f} MB/s  first byte {r['first_byte_s'] * 1000:8.1f} ms  "
+                f"peak RSS +{r['peak_rss_growth_bytes'] / 1e6:.1f} MB",
+                file=sys.stderr,
+            )
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "params": {k: v for k, v in vars(params).items() if k not in ("scenario", "output", "db")},
+        },
+        "results": results,
+    }
+    text = json.dumps(report, indent=2)
+    if params.output:
+        Path(params.output).write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
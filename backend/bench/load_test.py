@@ -0,0 +1,402 @@
+"""Load test for the backend API: throughput, latency percentiles and error rate.
+
+For each dataset size the harness seeds a temporary SQLite database with synthetic
+specs and features, starts `uvicorn app.main:app` with the requested number of
+workers on a free local port, and drives each target path with:
+
+- closed loop: --concurrency clients, each sending its next request when the previous
+  one finished (optionally paced to --closed-rps in total); measures capacity
+- open loop:   requests start on a fixed schedule of --rps per second whether or not
+  earlier ones finished; latency is measured from the scheduled start, so queueing
+  behind a slow server is counted (no coordinated omission)
+
+Results (requests, errors, error_rate, rps, p50/p95/p99/max in ms) are printed as JSON.
+With --baseline, p95/p99 and the error rate are compared against an earlier result
+and the exit status is 1 when any of them regressed beyond the tolerance.
+
+Usage (from backend/):
+    python bench/load_test.py
+    python bench/load_test.py --sizes 1000,100000 --workers 4 --rps 500 --duration 20
+    python bench/load_test.py --output baseline.json
+    python bench/load_test.py --baseline baseline.json --tolerance 0.25
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from urllib.request import urlopen
+
+BACKEND = Path(__file__).resolve().parent.parent
+REPO = BACKEND.parent
+sys.path.insert(0, str(BACKEND))
+
+MODES = ("closed", "open")
+DEFAULT_TARGETS = ("/health", "/api/spec/list?limit=50", "/api/features/projects/bench/progress")
+
+_WORDS = ("spec", "backend", "frontend", "分页", "列表", "接口", "归档", "用户", "登录", "search")
+
+
+async def seed(path: Path, size: int, features_per_spec: int, seed_value: int) -> None:
+    """Insert `size` specs (and their features) that SpecSync leaves alone (path IS NULL)."""
+    from app.db.sqlite import SQLiteDatabase
+
+    rng = random.Random(seed_value)
+    db = SQLiteDatabase(path, REPO / "data" / "init_db.sql", read_pool_size=1)
+    await db.open()
+    try:
+        async with db.transaction() as conn:
+            await conn.execute("DELETE FROM features")
+            await conn.execute("DELETE FROM specs")
+            batch = 5000
+            position = 0
+            for start in range(0, size, batch):
+                specs = [
+                    (
+                        i + 1,
+                        f"spec_{i:06d}",
+                        f"Spec {i}",
+                        rng.choice(("proposal", "implementation", "archived")),
+                        f"domain_{i % 50}",
+                        " ".join(rng.choice(_WORDS) for _ in range(100)),
+                        f"2026-01-01 {i // 3600 % 24:02d}:{i // 60 % 60:02d}:{i % 60:02d}.{i % 1000:03d}",
+                    )
+                    for i in range(start, min(start + batch, size))
+                ]
+                await conn.execute_many(
+                    "INSERT INTO specs (id, name, title, status, domain, content, updated_at)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    specs,
+                )
+                features = []
+                for spec in specs:
+                    for j in range(features_per_spec):
+                        features.append(("bench", position, spec[0], f"feature {j} of {spec[1]}", "bench", j % 2 == 0))
+                        position += 1
+                await conn.execute_many(
+                    "INSERT INTO features (project, position, spec_id, description, category, passes)"
+                    " VALUES (?, ?, ?, ?, ?, ?)",
+                    features,
+                )
+    finally:
+        await db.close()
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+class Server:
+    """uvicorn in a subprocess, configured through the same environment variables as production."""
+
+    def __init__(self, db_path: Path, spec_root: Path, workers: int, log_path: Path) -> None:
+        self.port = _free_port()
+        env = {k: v for k, v in os.environ.items() if k not in ("DATABASE_URL", "PROFILE_SLOW_MS")}
+        env.update(SQLITE_DB_PATH=str(db_path), SPEC_ROOT=str(spec_root))
+        self._log = log_path.open("wb")
+        argv = [sys.executable, "-m", "uvicorn", "app.main:app", "--host", "127.0.0.1", "--port", str(self.port)]
+        argv += ["--workers", str(workers), "--no-access-log", "--log-level", "warning"]
+        self._proc = subprocess.Popen(argv, cwd=BACKEND, env=env, stdout=self._log, stderr=subprocess.STDOUT)
+        self.log_path = log_path
+
+    def wait_ready(self, timeout: float = 30.0) -> None:
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self._proc.poll() is not None:
+                raise RuntimeError(f"uvicorn exited with {self._proc.returncode}; see {self.log_path}")
+            try:
+                with urlopen(f"http://127.0.0.1:{self.port}/health", timeout=1) as res:
+                    if res.status == 200:
+                        return
+            except OSError:
+                time.sleep(0.1)
+        raise RuntimeError(f"uvicorn not ready after {timeout} s; see {self.log_path}")
+
+    def stop(self) -> None:
+        if self._proc.poll() is None:
+            self._proc.send_signal(signal.SIGINT)
+            try:
+                self._proc.wait(timeout=15)
+            except subprocess.TimeoutExpired:
+                self._proc.kill()
+                self._proc.wait()
+        self._log.close()
+
+
+class Connection:
+    """Minimal HTTP/1.1 keep-alive client: GET only, Content-Length or chunked bodies."""
+
+    def __init__(self, port: int) -> None:
+        self.port = port
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+
+    async def get(self, path: str) -> tuple[int, int]:
+        """Return (status, body bytes); reconnects once if the server closed the connection."""
+        for attempt in (0, 1):
+            if self._reader is None or self._writer is None:
+                self._reader, self._writer = await asyncio.open_connection("127.0.0.1", self.port)
+            try:
+                self._writer.write(f"GET {path} HTTP/1.1\r\nHost: 127.0.0.1\r\n\r\n".encode())
+                return await self._response(self._reader)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                self.close()
+                if attempt:
+                    raise
+        raise ConnectionError("unreachable")
+
+    async def _response(self, reader: asyncio.StreamReader) -> tuple[int, int]:
+        status = int((await reader.readuntil(b"\r\n")).split(b" ", 2)[1])
+        length = 0
+        chunked = False
+        close = False
+        while (line := await reader.readuntil(b"\r\n")) != b"\r\n":
+            name, _, value = line.partition(b":")
+            name = name.strip().lower()
+            value = value.strip().lower()
+            if name == b"content-length":
+                length = int(value)
+            elif name == b"transfer-encoding" and value == b"chunked":
+                chunked = True
+            elif name == b"connection" and value == b"close":
+                close = True
+        size = 0
+        if chunked:
+            while (chunk := int((await reader.readuntil(b"\r\n")).split(b";")[0], 16)) > 0:
+                size += len(await reader.readexactly(chunk + 2)) - 2
+            await reader.readuntil(b"\r\n")
+        elif length:
+            size = len(await reader.readexactly(length))
+        if close:
+            self.close()
+        return status, size
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+        self._reader = self._writer = None
+
+
+@dataclass
+class Recorder:
+    latencies: list[float] = field(default_factory=list)
+    # errors: status >= 400 or no response; failed: no response (so no latency sample)
+    errors: int = 0
+    failed: int = 0
+    bytes: int = 0
+
+    async def call(self, conn: Connection, path: str, started: float) -> None:
+        try:
+            status, size = await conn.get(path)
+        except (OSError, asyncio.IncompleteReadError, ValueError):
+            self.errors += 1
+            self.failed += 1
+            conn.close()
+            return
+        self.latencies.append(time.perf_counter() - started)
+        self.bytes += size
+        if status >= 400:
+            self.errors += 1
+
+
+async def closed_loop(port: int, path: str, params: argparse.Namespace) -> tuple[Recorder, float]:
+    recorder = Recorder()
+    # Pacing per client when a total rate is given; 0 means as fast as possible
+    gap = params.concurrency / params.closed_rps if params.closed_rps else 0.0
+    start = time.perf_counter()
+    deadline = start + params.duration
+
+    async def client(n: int) -> None:
+        conn = Connection(port)
+        # Stagger paced clients so they do not fire in bursts
+        next_at = start + gap * n / params.concurrency
+        try:
+            while (now := time.perf_counter()) < deadline:
+                if gap and next_at > now:
+                    await asyncio.sleep(next_at - now)
+                next_at += gap
+                await recorder.call(conn, path, time.perf_counter())
+        finally:
+            conn.close()
+
+    await asyncio.gather(*(client(n) for n in range(params.concurrency)))
+    return recorder, time.perf_counter() - start
+
+
+async def open_loop(port: int, path: str, params: argparse.Namespace) -> tuple[Recorder, float]:
+    recorder = Recorder()
+    idle: list[Connection] = []
+    opened = 0
+    slots = asyncio.Semaphore(params.max_connections)
+    tasks: set[asyncio.Task[None]] = set()
+
+    async def one(scheduled: float) -> None:
+        nonlocal opened
+        # Waiting for a free connection counts towards latency
+        async with slots:
+            if idle:
+                conn = idle.pop()
+            else:
+                conn = Connection(port)
+                opened += 1
+            await recorder.call(conn, path, scheduled)
+            idle.append(conn)
+
+    start = time.perf_counter()
+    total = int(params.rps * params.duration)
+    for i in range(total):
+        scheduled = start + i / params.rps
+        delay = scheduled - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        task = asyncio.create_task(one(scheduled))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+    if tasks:
+        await asyncio.gather(*tasks)
+    for conn in idle:
+        conn.close()
+    return recorder, time.perf_counter() - start
+
+
+def _percentile(ordered: list[float], q: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, max(0, round(q * len(ordered) + 0.5) - 1))]
+
+
+def summarize(recorder: Recorder, seconds: float) -> dict[str, float]:
+    ordered = sorted(recorder.latencies)
+    requests = len(ordered) + recorder.failed
+    return {
+        "requests": requests,
+        "errors": recorder.errors,
+        "error_rate": recorder.errors / requests if requests else 0.0,
+        "rps": len(ordered) / seconds if seconds else 0.0,
+        "bytes": recorder.bytes,
+        "p50_ms": _percentile(ordered, 0.50) * 1000,
+        "p95_ms": _percentile(ordered, 0.95) * 1000,
+        "p99_ms": _percentile(ordered, 0.99) * 1000,
+        "max_ms": (ordered[-1] if ordered else 0.0) * 1000,
+    }
+
+
+async def drive(port: int, params: argparse.Namespace) -> dict[str, dict[str, dict[str, float]]]:
+    results: dict[str, dict[str, dict[str, float]]] = {}
+    for mode in params.modes.split(","):
+        results[mode] = {}
+        for path in params.targets:
+            # Warm-up: connections, caches, the first spec sync
+            warm = Connection(port)
+            for _ in range(params.warmup):
+                await Recorder().call(warm, path, time.perf_counter())
+            warm.close()
+            runner = closed_loop if mode == "closed" else open_loop
+            recorder, seconds = await runner(port, path, params)
+            results[mode][path] = summarize(recorder, seconds)
+            r = results[mode][path]
+            print(
+                f"  {mode:<6} {path:<45} {r['rps']:8.0f} rps  p50 {r['p50_ms']:7.2f}  p95 {r['p95_ms']:7.2f}"
+                f"  p99 {r['p99_ms']:7.2f} ms  errors {r['error_rate']:.2%}",
+                file=sys.stderr,
+            )
+    return results
+
+
+def compare(current: dict, baseline: dict, tolerance: float, slack_ms: float) -> list[str]:
+    """Regressions of p95/p99 (relative, with an absolute slack for tiny latencies) and error rate."""
+    problems: list[str] = []
+    for size, modes in current["results"].items():
+        for mode, paths in modes.items():
+            for path, r in paths.items():
+                base = baseline.get("results", {}).get(size, {}).get(mode, {}).get(path)
+                if base is None:
+                    continue
+                for key in ("p95_ms", "p99_ms"):
+                    limit = base[key] * (1 + tolerance) + slack_ms
+                    if r[key] > limit:
+                        problems.append(
+                            f"size={size} {mode} {path}: {key} {r[key]:.2f} > {limit:.2f} (baseline {base[key]:.2f})"
+                        )
+                if r["error_rate"] > base["error_rate"] + 0.001:
+                    problems.append(
+                        f"size={size} {mode} {path}: error_rate {r['error_rate']:.2%} > baseline {base['error_rate']:.2%}"
+                    )
+    return problems
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Backend API load test")
+    parser.add_argument("--sizes", default="1000,10000,100000", help="Comma-separated numbers of specs to seed")
+    parser.add_argument("--features-per-spec", type=int, default=3, help="Features per spec")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn worker processes")
+    parser.add_argument("--modes", default=",".join(MODES), help="closed, open or both")
+    parser.add_argument("--target", dest="targets", action="append", default=None, help="Path to request (repeatable)")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per mode and target")
+    parser.add_argument("--concurrency", type=int, default=32, help="Closed loop: concurrent clients")
+    parser.add_argument("--rps", type=float, default=200.0, help="Open loop: arrival rate per second")
+    parser.add_argument("--closed-rps", type=float, default=0.0, help="Closed loop: total pacing rate (0 = unpaced)")
+    parser.add_argument("--max-connections", type=int, default=256, help="Open loop: connection cap")
+    parser.add_argument("--warmup", type=int, default=50, help="Requests per target before measuring")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for the synthetic data")
+    parser.add_argument("--baseline", default=None, help="Earlier JSON result to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed relative p95/p99 increase")
+    parser.add_argument("--slack-ms", type=float, default=2.0, help="Allowed absolute p95/p99 increase on top")
+    parser.add_argument("--output", default=None, help="Write the JSON result here instead of stdout")
+    params = parser.parse_args()
+    params.targets = params.targets or list(DEFAULT_TARGETS)
+    if "open" in params.modes and params.rps <= 0:
+        parser.error("--rps must be positive for the open loop")
+
+    results: dict[str, dict[str, dict[str, dict[str, float]]]] = {}
+    with tempfile.TemporaryDirectory(prefix="load_test_") as tmp:
+        spec_root = Path(tmp) / "spec"
+        spec_root.mkdir()
+        for size in (int(s) for s in params.sizes.split(",")):
+            db_path = Path(tmp) / f"load_{size}.db"
+            asyncio.run(seed(db_path, size, params.features_per_spec, params.seed))
+            print(f"size={size} workers={params.workers}", file=sys.stderr)
+            server = Server(db_path, spec_root, params.workers, Path(tmp) / f"uvicorn_{size}.log")
+            try:
+                server.wait_ready()
+                results[str(size)] = asyncio.run(drive(server.port, params))
+            finally:
+                server.stop()
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "params": {k: v for k, v in vars(params).items() if k not in ("output", "baseline")},
+        },
+        "results": results,
+    }
+    problems: list[str] = []
+    if params.baseline:
+        baseline = json.loads(Path(params.baseline).read_text(encoding="utf-8"))
+        problems = compare(report, baseline, params.tolerance, params.slack_ms)
+        report["regressions"] = problems
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if params.output:
+        Path(params.output).write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+    for problem in problems:
+        print(f"REGRESSION {problem}", file=sys.stderr)
+    sys.exit(1 if problems else 0)
+
+
+if __name__ == "__main__":
+    main()
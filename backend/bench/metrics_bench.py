@@ -0,0 +1,141 @@
+"""Benchmark for MetricsMiddleware and the slow-request profiler overhead.
+
+Drives a minimal ASGI app (fixed JSON body, route set the way the FastAPI router sets
+it) directly, without a server or sockets, so the numbers are the per-request cost of
+the instrumentation itself:
+
+- bare:      the app alone
+- metrics:   MetricsMiddleware recording latency, size and status
+- profiled:  MetricsMiddleware plus SlowRequestProfiler sampling (threshold never hit)
+
+Also times rendering /metrics for the route count given. Reports microseconds per
+request (median of the rounds) and the overhead against bare as JSON.
+
+Usage (from backend/):
+    python bench/metrics_bench.py
+    python bench/metrics_bench.py --requests 50000 --concurrency 50 --output /tmp/metrics.json
+"""
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BACKEND = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND))
+
+from app.core.metrics import Metrics, MetricsMiddleware  # noqa: E402
+from app.core.profiler import SlowRequestProfiler  # noqa: E402
+from starlette.types import ASGIApp, Message, Receive, Scope, Send  # noqa: E402
+
+SCENARIOS = ("bare", "metrics", "profiled")
+
+_BODY = b'{"ok":true,"data":{"items":[],"next_cursor":null,"limit":50},"error":null}'
+
+
+class _Route:
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+
+def _app(routes: list[_Route]) -> ASGIApp:
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:
+        scope["route"] = routes[hash(scope["path"]) % len(routes)]
+        await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"application/json")]})
+        await send({"type": "http.response.body", "body": _BODY})
+
+    return app
+
+
+async def _receive() -> Message:
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def _send(message: Message) -> None:
+    return None
+
+
+async def _drive(app: ASGIApp, requests: int, concurrency: int, paths: list[str]) -> float:
+    async def worker(n: int) -> None:
+        for i in range(n):
+            scope: Scope = {"type": "http", "method": "GET", "path": paths[i % len(paths)], "headers": []}
+            await app(scope, _receive, _send)
+
+    per_worker = requests // concurrency
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(per_worker) for _ in range(concurrency)))
+    return (time.perf_counter() - start) / (per_worker * concurrency)
+
+
+def run(params: argparse.Namespace) -> dict:
+    routes = [_Route(f"/api/bench/{i}/{{item_id}}") for i in range(params.routes)]
+    paths = [f"/api/bench/{i}" for i in range(params.routes * 4)]
+    results: dict[str, dict[str, float]] = {}
+    with tempfile.TemporaryDirectory(prefix="metrics_bench_") as tmp:
+        for name in params.scenarios.split(","):
+            profiler = None
+            app = _app(routes)
+            if name != "bare":
+                if name == "profiled":
+                    profiler = SlowRequestProfiler(Path(tmp), threshold_ms=60_000, interval_ms=params.interval_ms)
+                    profiler.start()
+                app = MetricsMiddleware(app, Metrics(), profiler=profiler)
+            try:
+                samples = [
+                    asyncio.run(_drive(app, params.requests, params.concurrency, paths)) for _ in range(params.rounds)
+                ]
+            finally:
+                if profiler is not None:
+                    profiler.stop()
+            results[name] = {"us_per_request": statistics.median(samples) * 1e6, "min_us": min(samples) * 1e6}
+
+    metrics = Metrics()
+    for i, route in enumerate(routes):
+        for status in (200, 304, 404):
+            metrics.record("GET", route.path, status, 0.001 * (i % 50), 2048)
+    start = time.perf_counter()
+    text = metrics.render()
+    render_ms = (time.perf_counter() - start) * 1000
+
+    bare = results.get("bare", {}).get("us_per_request")
+    for r in results.values():
+        r["overhead_us"] = r["us_per_request"] - bare if bare is not None else 0.0
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "params": {k: v for k, v in vars(params).items() if k != "output"},
+        },
+        "results": results,
+        "render": {"ms": render_ms, "bytes": len(text), "series_lines": text.count("\n")},
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Request metrics middleware overhead benchmark")
+    parser.add_argument("--requests", type=int, default=20_000, help="Requests per round")
+    parser.add_argument("--concurrency", type=int, default=20, help="Concurrent request loops")
+    parser.add_argument("--rounds", type=int, default=5, help="Rounds per scenario")
+    parser.add_argument("--routes", type=int, default=20, help="Distinct route templates")
+    parser.add_argument("--interval-ms", type=float, default=5.0, help="Profiler sampling interval")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help="Comma-separated scenarios to run")
+    parser.add_argument("--output", default=None, help="Write the JSON result here instead of stdout")
+    params = parser.parse_args()
+
+    result = run(params)
+    for name, r in result["results"].items():
+        print(f"{name:<10}{r['us_per_request']:>8.2f} us/request  (+{r['overhead_us']:.2f} us)", file=sys.stderr)
+    print(f"render    {result['render']['ms']:>8.2f} ms for {result['render']['series_lines']} lines", file=sys.stderr)
+    text = json.dumps(result, indent=2)
+    if params.output:
+        Path(params.output).write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""Benchmark for serving spec listing pages from the mmap'd snapshot vs SQL.
+
+Seeds a temporary SQLite database with --rows specs, builds a snapshot generation from
+it and times the same page queries on both paths:
+
+- sql:       list_page() plus success(page).model_dump_json(), what the route did before
+- snapshot:  SnapshotView.page_response(), the bytes the route sends now
+
+Every page is checked for byte equality between the two paths before timing. Reports
+microseconds per page (median of the rounds), the build time of a generation and the
+snapshot file size as JSON.
+
+Usage (from backend/):
+    python bench/snapshot_bench.py
+    python bench/snapshot_bench.py --rows 20000 --limit 100 --output /tmp/snapshot.json
+"""
+import argparse
+import asyncio
+import json
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+BACKEND = Path(__file__).resolve().parent.parent
+REPO = BACKEND.parent
+sys.path.insert(0, str(BACKEND))
+
+from app.core import success  # noqa: E402
+from app.db.sqlite import SQLiteDatabase  # noqa: E402
+from app.services import SnapshotView, SpecQuery, SpecSnapshot, list_page  # noqa: E402
+
+STATUSES = ("proposal", "implementation", "archived", None)
+DOMAINS = ("auth", "billing", "search", "ui", None)
+
+
+async def _seed(db: SQLiteDatabase, rows: int, seed: int) -> None:
+    rng = random.Random(seed)
+    base = datetime(2026, 1, 1)
+    values = [
+        (
+            i + 1,
+            f"spec-{i}",
+            f"Spec {i}" if i % 7 else None,
+            rng.choice(STATUSES),
+            rng.choice(DOMAINS),
+            base + timedelta(seconds=rng.randrange(rows * 10), microseconds=rng.randrange(1_000_000)),
+        )
+        for i in range(rows)
+    ]
+    async with db.transaction() as conn:
+        await conn.execute("DELETE FROM specs")
+        await conn.execute_many(
+            "INSERT INTO specs (id, name, title, status, domain, updated_at) VALUES (?, ?, ?, ?, ?, ?)", values
+        )
+
+
+async def _queries(db: SQLiteDatabase, limit: int, pages: int) -> list[SpecQuery]:
+    """First pages for each filter plus a cursor walk of the unfiltered listing."""
+    queries = [SpecQuery(limit=limit, status=s, domain=d) for s in STATUSES[:-1] for d in DOMAINS[:-1]]
+    after = None
+    for _ in range(pages):
+        query = SpecQuery(limit=limit, after=after)
+        queries.append(query)
+        page = await list_page(db, query)
+        if not page.next_cursor:
+            break
+        last = page.items[-1]
+        after = (last.updated_at, last.id)
+    return queries
+
+
+async def _sql(db: SQLiteDatabase, queries: list[SpecQuery]) -> list[bytes]:
+    return [success(await list_page(db, q)).model_dump_json().encode() for q in queries]
+
+
+def _snapshot(view: SnapshotView, queries: list[SpecQuery]) -> list[bytes]:
+    return [view.page_response(q) for q in queries]
+
+
+async def _run(params: argparse.Namespace) -> dict:
+    with tempfile.TemporaryDirectory(prefix="snapshot_bench_") as tmp:
+        db = SQLiteDatabase(Path(tmp) / "bench.db", REPO / "data" / "init_db.sql")
+        await db.open()
+        try:
+            await _seed(db, params.rows, params.seed)
+            snapshot = SpecSnapshot(Path(tmp) / "snapshot")
+            start = time.perf_counter()
+            await snapshot.rebuild(db)
+            build_ms = (time.perf_counter() - start) * 1000
+            view = snapshot.current()
+            assert view is not None
+            queries = await _queries(db, params.limit, params.pages)
+
+            if await _sql(db, queries) != _snapshot(view, queries):
+                raise SystemExit("snapshot pages differ from the SQL path")
+
+            sql: list[float] = []
+            snap: list[float] = []
+            for _ in range(params.rounds):
+                start = time.perf_counter()
+                await _sql(db, queries)
+                sql.append((time.perf_counter() - start) / len(queries))
+                start = time.perf_counter()
+                _snapshot(view, queries)
+                snap.append((time.perf_counter() - start) / len(queries))
+            size = view.path.stat().st_size
+        finally:
+            await db.close()
+
+    results = {
+        name: {"us_per_page": statistics.median(samples) * 1e6, "min_us": min(samples) * 1e6}
+        for name, samples in (("sql", sql), ("snapshot", snap))
+    }
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "params": {k: v for k, v in vars(params).items() if k != "output"},
+        },
+        "pages": len(queries),
+        "results": results,
+        "speedup": results["sql"]["us_per_page"] / results["snapshot"]["us_per_page"],
+        "build": {"ms": build_ms, "bytes": size},
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Spec listing snapshot vs SQL benchmark")
+    parser.add_argument("--rows", type=int, default=5000, help="Specs to seed")
+    parser.add_argument("--limit", type=int, default=50, help="Page size")
+    parser.add_argument("--pages", type=int, default=40, help="Pages in the cursor walk")
+    parser.add_argument("--rounds", type=int, default=5, help="Timing rounds")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed for the data")
+    parser.add_argument("--output", default=None, help="Write the JSON result here instead of stdout")
+    params = parser.parse_args()
+
+    result = asyncio.run(_run(params))
+    for name, r in result["results"].items():
+        print(f"{name:<10}{r['us_per_page']:>10.1f} us/page", file=sys.stderr)
+    print(
+        f"build     {result['build']['ms']:>10.1f} ms, {result['build']['bytes']} bytes"
+        f"  (snapshot {result['speedup']:.1f}x faster)",
+        file=sys.stderr,
+    )
+    text = json.dumps(result, indent=2)
+    if params.output:
+        Path(params.output).write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
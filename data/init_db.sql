@@ -2,26 +2,125 @@
 -- 用于创建开发数据库表结构
 
 -- 示例表：specs 存储 spec 文档信息
+-- 由 docs/spec 同步的行以 path（相对 docs/spec 的路径）唯一标识；updated_at 为文件修改时间（UTC）
 CREATE TABLE IF NOT EXISTS specs (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     name TEXT NOT NULL,
+    title TEXT,
     status TEXT DEFAULT 'proposal',
+    domain TEXT,
+    location TEXT,
+    path TEXT,
+    tasks_total INTEGER DEFAULT 0,
+    tasks_done INTEGER DEFAULT 0,
+    file_size INTEGER,
     content TEXT,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
--- 示例表：features 存储 feature 信息
+-- 列表按 (updated_at, id) 键集分页；筛选列在前，排序列在后
+CREATE UNIQUE INDEX IF NOT EXISTS idx_specs_path ON specs (path);
+CREATE INDEX IF NOT EXISTS idx_specs_updated ON specs (updated_at, id);
+CREATE INDEX IF NOT EXISTS idx_specs_status_updated ON specs (status, updated_at, id);
+CREATE INDEX IF NOT EXISTS idx_specs_domain_updated ON specs (domain, updated_at, id);
+
+-- 全文检索：外部内容 FTS5 表，title/content 由触发器与 specs 同步
+-- trigram 分词支持中文与任意子串匹配（检索词至少 3 个字符，需 SQLite >= 3.34）
+CREATE VIRTUAL TABLE IF NOT EXISTS specs_fts USING fts5(
+    title, content, content='specs', content_rowid='id', tokenize='trigram'
+);
+
+CREATE TRIGGER IF NOT EXISTS specs_fts_insert AFTER INSERT ON specs BEGIN
+    INSERT INTO specs_fts (rowid, title, content) VALUES (new.id, new.title, new.content);
+END;
+
+CREATE TRIGGER IF NOT EXISTS specs_fts_delete AFTER DELETE ON specs BEGIN
+    INSERT INTO specs_fts (specs_fts, rowid, title, content) VALUES ('delete', old.id, old.title, old.content);
+END;
+
+CREATE TRIGGER IF NOT EXISTS specs_fts_update AFTER UPDATE OF title, content ON specs BEGIN
+    INSERT INTO specs_fts (specs_fts, rowid, title, content) VALUES ('delete', old.id, old.title, old.content);
+    INSERT INTO specs_fts (rowid, title, content) VALUES (new.id, new.title, new.content);
+END;
+
+-- features：plan-auto 的 feature 与验收进度
+-- project 为 feature_list.json 中的 project，position 为该 feature 在列表中的序号，(project, position) 唯一
+-- steps 为验收步骤的 JSON 数组
 CREATE TABLE IF NOT EXISTS features (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     spec_id INTEGER,
+    project TEXT NOT NULL DEFAULT '',
+    position INTEGER,
     description TEXT NOT NULL,
     category TEXT,
+    steps TEXT,
     passes BOOLEAN DEFAULT FALSE,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     FOREIGN KEY (spec_id) REFERENCES specs(id)
 );
 
+CREATE INDEX IF NOT EXISTS idx_features_spec ON features (spec_id);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_features_project_position ON features (project, position);
+
+-- 完成计数：由下方触发器在写 features 的同一事务内增减，判断「是否全部完成」只读一行
+-- 触发器内不用 INSERT OR IGNORE：外层 UPSERT 的冲突策略会覆盖它
+CREATE TABLE IF NOT EXISTS feature_project_progress (
+    project TEXT PRIMARY KEY,
+    total INTEGER NOT NULL DEFAULT 0,
+    passed INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS feature_spec_progress (
+    spec_id INTEGER PRIMARY KEY,
+    total INTEGER NOT NULL DEFAULT 0,
+    passed INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TRIGGER IF NOT EXISTS features_progress_insert AFTER INSERT ON features BEGIN
+    INSERT INTO feature_project_progress (project) SELECT new.project
+        WHERE NOT EXISTS (SELECT 1 FROM feature_project_progress WHERE project = new.project);
+    UPDATE feature_project_progress
+        SET total = total + 1, passed = passed + (COALESCE(new.passes, 0) <> 0)
+        WHERE project = new.project;
+    INSERT INTO feature_spec_progress (spec_id) SELECT new.spec_id
+        WHERE new.spec_id IS NOT NULL
+        AND NOT EXISTS (SELECT 1 FROM feature_spec_progress WHERE spec_id = new.spec_id);
+    UPDATE feature_spec_progress
+        SET total = total + 1, passed = passed + (COALESCE(new.passes, 0) <> 0)
+        WHERE spec_id = new.spec_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS features_progress_delete AFTER DELETE ON features BEGIN
+    UPDATE feature_project_progress
+        SET total = total - 1, passed = passed - (COALESCE(old.passes, 0) <> 0)
+        WHERE project = old.project;
+    UPDATE feature_spec_progress
+        SET total = total - 1, passed = passed - (COALESCE(old.passes, 0) <> 0)
+        WHERE spec_id = old.spec_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS features_progress_update AFTER UPDATE OF passes, project, spec_id ON features BEGIN
+    UPDATE feature_project_progress
+        SET total = total - 1, passed = passed - (COALESCE(old.passes, 0) <> 0)
+        WHERE project = old.project;
+    UPDATE feature_spec_progress
+        SET total = total - 1, passed = passed - (COALESCE(old.passes, 0) <> 0)
+        WHERE spec_id = old.spec_id;
+    INSERT INTO feature_project_progress (project) SELECT new.project
+        WHERE NOT EXISTS (SELECT 1 FROM feature_project_progress WHERE project = new.project);
+    UPDATE feature_project_progress
+        SET total = total + 1, passed = passed + (COALESCE(new.passes, 0) <> 0)
+        WHERE project = new.project;
+    INSERT INTO feature_spec_progress (spec_id) SELECT new.spec_id
+        WHERE new.spec_id IS NOT NULL
+        AND NOT EXISTS (SELECT 1 FROM feature_spec_progress WHERE spec_id = new.spec_id);
+    UPDATE feature_spec_progress
+        SET total = total + 1, passed = passed + (COALESCE(new.passes, 0) <> 0)
+        WHERE spec_id = new.spec_id;
+END;
+
 -- 插入测试数据
 INSERT INTO specs (name, status, content) VALUES
     ('test_spec', 'proposal', 'This is a test spec for MCP verification');
@@ -0,0 +1,107 @@
+-- PostgreSQL 初始化脚本（与 init_db.sql 表结构一致）
+-- DATABASE_URL 为 postgresql:// 时由后端在每次启动时执行，语句均须可重复执行
+
+-- 整个脚本在一个隐式事务中执行；多个 worker 同时启动时由事务级咨询锁串行化
+SELECT pg_advisory_xact_lock(7283460016);
+
+CREATE TABLE IF NOT EXISTS specs (
+    id BIGSERIAL PRIMARY KEY,
+    name TEXT NOT NULL,
+    title TEXT,
+    status TEXT DEFAULT 'proposal',
+    domain TEXT,
+    location TEXT,
+    path TEXT,
+    tasks_total INTEGER DEFAULT 0,
+    tasks_done INTEGER DEFAULT 0,
+    file_size BIGINT,
+    content TEXT,
+    created_at TIMESTAMP DEFAULT (now() AT TIME ZONE 'utc'),
+    updated_at TIMESTAMP DEFAULT (now() AT TIME ZONE 'utc')
+);
+
+-- 全文检索向量，随 title/content 自动更新
+ALTER TABLE specs ADD COLUMN IF NOT EXISTS search_vector TSVECTOR GENERATED ALWAYS AS (
+    setweight(to_tsvector('simple', coalesce(title, '')), 'A')
+    || setweight(to_tsvector('simple', coalesce(content, '')), 'B')
+) STORED;
+
+-- 列表按 (updated_at, id) 键集分页；筛选列在前，排序列在后
+CREATE UNIQUE INDEX IF NOT EXISTS idx_specs_path ON specs (path);
+CREATE INDEX IF NOT EXISTS idx_specs_updated ON specs (updated_at, id);
+CREATE INDEX IF NOT EXISTS idx_specs_status_updated ON specs (status, updated_at, id);
+CREATE INDEX IF NOT EXISTS idx_specs_domain_updated ON specs (domain, updated_at, id);
+CREATE INDEX IF NOT EXISTS idx_specs_search ON specs USING GIN (search_vector);
+
+CREATE TABLE IF NOT EXISTS features (
+    id BIGSERIAL PRIMARY KEY,
+    spec_id BIGINT REFERENCES specs(id),
+    project TEXT NOT NULL DEFAULT '',
+    position INTEGER,
+    description TEXT NOT NULL,
+    category TEXT,
+    steps TEXT,
+    passes BOOLEAN DEFAULT FALSE,
+    created_at TIMESTAMP DEFAULT (now() AT TIME ZONE 'utc'),
+    updated_at TIMESTAMP DEFAULT (now() AT TIME ZONE 'utc')
+);
+
+-- 旧库补列
+ALTER TABLE features ADD COLUMN IF NOT EXISTS project TEXT NOT NULL DEFAULT '';
+ALTER TABLE features ADD COLUMN IF NOT EXISTS position INTEGER;
+ALTER TABLE features ADD COLUMN IF NOT EXISTS steps TEXT;
+ALTER TABLE features ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP DEFAULT (now() AT TIME ZONE 'utc');
+
+CREATE INDEX IF NOT EXISTS idx_features_spec ON features (spec_id);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_features_project_position ON features (project, position);
+
+-- 完成计数：由触发器在写 features 的同一事务内增减，判断「是否全部完成」只读一行
+CREATE TABLE IF NOT EXISTS feature_project_progress (
+    project TEXT PRIMARY KEY,
+    total INTEGER NOT NULL DEFAULT 0,
+    passed INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS feature_spec_progress (
+    spec_id BIGINT PRIMARY KEY,
+    total INTEGER NOT NULL DEFAULT 0,
+    passed INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE OR REPLACE FUNCTION features_progress() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE feature_project_progress
+            SET total = total - 1, passed = passed - COALESCE(OLD.passes, FALSE)::int
+            WHERE project = OLD.project;
+        UPDATE feature_spec_progress
+            SET total = total - 1, passed = passed - COALESCE(OLD.passes, FALSE)::int
+            WHERE spec_id = OLD.spec_id;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO feature_project_progress AS p (project, total, passed)
+            VALUES (NEW.project, 1, COALESCE(NEW.passes, FALSE)::int)
+            ON CONFLICT (project) DO UPDATE
+            SET total = p.total + 1, passed = p.passed + COALESCE(NEW.passes, FALSE)::int;
+        IF NEW.spec_id IS NOT NULL THEN
+            INSERT INTO feature_spec_progress AS p (spec_id, total, passed)
+                VALUES (NEW.spec_id, 1, COALESCE(NEW.passes, FALSE)::int)
+                ON CONFLICT (spec_id) DO UPDATE
+                SET total = p.total + 1, passed = p.passed + COALESCE(NEW.passes, FALSE)::int;
+        END IF;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS features_progress ON features;
+CREATE TRIGGER features_progress AFTER INSERT OR DELETE OR UPDATE OF passes, project, spec_id ON features
+    FOR EACH ROW EXECUTE FUNCTION features_progress();
+
+-- 计数表新建时补齐已有 features 的计数；之后由触发器维护，这里不再改动
+INSERT INTO feature_project_progress (project, total, passed)
+    SELECT project, count(*), count(*) FILTER (WHERE passes) FROM features GROUP BY project
+    ON CONFLICT (project) DO NOTHING;
+INSERT INTO feature_spec_progress (spec_id, total, passed)
+    SELECT spec_id, count(*), count(*) FILTER (WHERE passes) FROM features WHERE spec_id IS NOT NULL GROUP BY spec_id
+    ON CONFLICT (spec_id) DO NOTHING;
@@ -0,0 +1,26 @@
+import { NextRequest, NextResponse } from "next/server";
+
+import { backendRequest } from "@/lib/backend";
+
+// 经 node:http 连接池访问后端，需要 Node.js 运行时
+export const runtime = "nodejs";
+
+// 一次往返执行多个 API 调用：请求体原样转发给后端 /api/batch，
+// 后端在同一进程内并发执行各子请求，并把结果放进同一个 ApiResponse 返回
+export async function POST(request: NextRequest): Promise<NextResponse> {
+  try {
+    const res = await backendRequest("/api/batch", {
+      method: "POST",
+      headers: { "Content-Type": "application/json", Accept: "application/json" },
+      body: await request.text(),
+      signal: request.signal,
+    });
+    return new NextResponse(res.body, { status: res.status, headers: { "Content-Type": "application/json" } });
+  } catch (e) {
+    return NextResponse.json({
+      ok: false,
+      data: null,
+      error: e instanceof Error ? e.message : "Backend unreachable",
+    });
+  }
+}
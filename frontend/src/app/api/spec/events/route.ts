@@ -0,0 +1,31 @@
+import { NextRequest } from "next/server";
+
+const API_BASE = process.env.NEXT_PUBLIC_API_URL ?? "http://127.0.0.1:8000";
+
+// 每个浏览器连接对应一条后端 SSE 连接，不能被缓存或静态化
+export const dynamic = "force-dynamic";
+
+export async function GET(request: NextRequest): Promise<Response> {
+  // 浏览器断开时同时断开后端连接，后端据此停止文件监听
+  const upstream = new AbortController();
+  request.signal.addEventListener("abort", () => upstream.abort());
+  try {
+    const res = await fetch(`${API_BASE}/api/spec/events`, {
+      cache: "no-store",
+      headers: { Accept: "text/event-stream" },
+      signal: upstream.signal,
+    });
+    if (!res.ok || !res.body) {
+      return new Response(null, { status: 502 });
+    }
+    return new Response(res.body, {
+      headers: {
+        "Content-Type": "text/event-stream",
+        "Cache-Control": "no-cache, no-transform",
+        "X-Accel-Buffering": "no",
+      },
+    });
+  } catch {
+    return new Response(null, { status: 502 });
+  }
+}
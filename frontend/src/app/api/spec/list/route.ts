@@ -1,12 +1,90 @@
-import { NextResponse } from "next/server";
+import { NextRequest, NextResponse } from "next/server";
 
-const API_BASE = process.env.NEXT_PUBLIC_API_URL ?? "http://127.0.0.1:8000";
+import { backendRequest, header } from "@/lib/backend";
+
+// 经 node:http 连接池访问后端，需要 Node.js 运行时
+export const runtime = "nodejs";
+
+// 按查询串缓存后端响应体与校验器；后端返回 304 时直接复用缓存的响应体
+interface CachedListing {
+  etag: string;
+  lastModified: string | null;
+  body: string;
+}
+
+const MAX_CACHED = 100;
+const cache = new Map<string, CachedListing>();
+
+function remember(key: string, entry: CachedListing): void {
+  cache.delete(key);
+  cache.set(key, entry);
+  if (cache.size > MAX_CACHED) {
+    const oldest = cache.keys().next().value;
+    if (oldest !== undefined) cache.delete(oldest);
+  }
+}
+
+function validatorHeaders(etag: string | null, lastModified: string | null): Record<string, string> {
+  const headers: Record<string, string> = { "Cache-Control": "no-cache" };
+  if (etag) headers.ETag = etag;
+  if (lastModified) headers["Last-Modified"] = lastModified;
+  return headers;
+}
+
+function matchesEtag(ifNoneMatch: string | null, etag: string): boolean {
+  if (!ifNoneMatch) return false;
+  return ifNoneMatch.split(",").some((tag) => {
+    const value = tag.trim().replace(/^W\//, "");
+    return value === "*" || value === etag;
+  });
+}
+
+export async function GET(request: NextRequest): Promise<NextResponse> {
+  // 透传分页与筛选参数（cursor、limit、status、domain、updated_from、updated_to）
+  const search = request.nextUrl.search;
+  const clientEtag = request.headers.get("if-none-match");
+  const cached = cache.get(search);
+
+  // 有缓存时用缓存的校验器向后端条件请求；否则转发浏览器自带的校验器
+  const upstreamHeaders: Record<string, string> = {};
+  if (cached) {
+    upstreamHeaders["If-None-Match"] = cached.etag;
+    if (cached.lastModified) upstreamHeaders["If-Modified-Since"] = cached.lastModified;
+  } else {
+    if (clientEtag) upstreamHeaders["If-None-Match"] = clientEtag;
+    const since = request.headers.get("if-modified-since");
+    if (since) upstreamHeaders["If-Modified-Since"] = since;
+  }
 
-export async function GET(): Promise<NextResponse> {
   try {
-    const res = await fetch(`${API_BASE}/api/spec/list`, { cache: "no-store" });
-    const json = await res.json();
-    return NextResponse.json(json);
+    const res = await backendRequest(`/api/spec/list${search}`, { headers: upstreamHeaders, signal: request.signal });
+
+    if (res.status === 304 && !cached) {
+      // 浏览器的校验器仍然有效
+      return new NextResponse(null, {
+        status: 304,
+        headers: validatorHeaders(header(res, "etag"), header(res, "last-modified")),
+      });
+    }
+
+    let entry: CachedListing;
+    if (res.status === 304 && cached) {
+      entry = cached;
+    } else {
+      const body = res.body;
+      const etag = header(res, "etag");
+      if (res.status < 200 || res.status >= 300 || !etag) {
+        return new NextResponse(body, { status: res.status, headers: { "Content-Type": "application/json" } });
+      }
+      entry = { etag, lastModified: header(res, "last-modified"), body };
+    }
+    remember(search, entry);
+
+    const headers = validatorHeaders(entry.etag, entry.lastModified);
+    if (matchesEtag(clientEtag, entry.etag)) {
+      return new NextResponse(null, { status: 304, headers });
+    }
+    return new NextResponse(entry.body, { status: 200, headers: { "Content-Type": "application/json", ...headers } });
   } catch (e) {
     return NextResponse.json({
       ok: false,
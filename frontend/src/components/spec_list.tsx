@@ -1,44 +1,165 @@
 "use client";
 
-import { useEffect, useState } from "react";
+import { useCallback, useEffect, useRef, useState } from "react";
 import { Button } from "@/components/ui/button";
 
 interface SpecItem {
-  id: string;
-  title: string;
-  status: string;
+  id: number;
+  name: string;
+  title: string | null;
+  status: string | null;
+  domain: string | null;
+  location: string | null;
+  path: string | null;
+  tasks_total: number;
+  tasks_done: number;
+  updated_at: string;
+}
+
+interface SpecPage {
+  items: SpecItem[];
+  next_cursor: string | null;
+  limit: number;
+}
+
+// /api/spec/events 推送的变更：reset 时重新加载，否则按 id 原地更新
+interface SpecChangeEvent {
+  version: number;
+  reset: boolean;
+  upserted: SpecItem[];
+  removed: number[];
+}
+
+interface SpecListState {
+  items: SpecItem[];
+  nextCursor: string | null;
+}
+
+type SpecPageResponse = { ok: boolean; data?: SpecPage | null; error?: string | null };
+
+// 事件流被关闭（后端不可达等）后重新连接的间隔
+const RECONNECT_MS = 5000;
+
+function fetchPage(cursor: string | null): Promise<SpecPageResponse> {
+  const query = cursor ? `?cursor=${encodeURIComponent(cursor)}` : "";
+  return fetch(`/api/spec/list${query}`).then((res) => res.json());
+}
+
+// 与后端排序一致：updated_at 降序，其次 id 降序
+function newerFirst(a: SpecItem, b: SpecItem): number {
+  const diff = Date.parse(b.updated_at) - Date.parse(a.updated_at);
+  return diff !== 0 ? diff : b.id - a.id;
+}
+
+function applyChange(list: SpecListState, change: SpecChangeEvent): SpecListState {
+  const replaced = new Set([...change.removed, ...change.upserted.map((item) => item.id)]);
+  const oldest = list.items[list.items.length - 1];
+  // 还有下一页时，排在已加载范围之后的条目留给「加载更多」，避免重复
+  const incoming = change.upserted.filter(
+    (item) => !list.nextCursor || !oldest || newerFirst(item, oldest) <= 0,
+  );
+  const items = [...list.items.filter((item) => !replaced.has(item.id)), ...incoming].sort(newerFirst);
+  return { items, nextCursor: list.nextCursor };
 }
 
 export function SpecList() {
-  const [data, setData] = useState<SpecItem[] | null>(null);
+  const [list, setList] = useState<SpecListState | null>(null);
   const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [error, setError] = useState<string | null>(null);
+  // 只采用最新一次加载的结果；加载期间到达的变更在加载完成后补上
+  const loadSeq = useRef(0);
+  const pending = useRef<SpecChangeEvent[] | null>(null);
 
-  useEffect(() => {
-    let cancelled = false;
-    setLoading(true);
+  const loadFirstPage = useCallback(() => {
+    const seq = ++loadSeq.current;
+    pending.current = [];
     setError(null);
-    fetch("/api/spec/list")
-      .then((res) => res.json())
-      .then((json: { ok: boolean; data?: SpecItem[]; error?: string }) => {
-        if (cancelled) return;
-        if (!json.ok) {
+    fetchPage(null)
+      .then((json) => {
+        if (seq !== loadSeq.current) return;
+        if (!json.ok || !json.data) {
           setError(json.error ?? "请求失败");
-          setData(null);
-        } else {
-          setData(json.data ?? []);
+          setList(null);
+          return;
         }
+        const changes = pending.current ?? [];
+        setList(changes.reduce(applyChange, { items: json.data.items, nextCursor: json.data.next_cursor }));
       })
       .catch((e) => {
-        if (!cancelled) setError(e instanceof Error ? e.message : "网络错误");
+        if (seq === loadSeq.current) setError(e instanceof Error ? e.message : "网络错误");
       })
       .finally(() => {
-        if (!cancelled) setLoading(false);
+        if (seq !== loadSeq.current) return;
+        pending.current = null;
+        setLoading(false);
       });
+  }, []);
+
+  // 订阅变更推送：空闲时不发任何请求，变更到达后原地更新列表
+  useEffect(() => {
+    if (typeof EventSource === "undefined") {
+      loadFirstPage();
+      return;
+    }
+    let source: EventSource | null = null;
+    let reconnect: ReturnType<typeof setTimeout> | null = null;
+    let loaded = false;
+
+    const connect = () => {
+      source = new EventSource("/api/spec/events");
+      source.addEventListener("specs", (e) => {
+        const change = JSON.parse((e as MessageEvent<string>).data) as SpecChangeEvent;
+        if (change.reset) {
+          // 每次（重新）连接的第一个事件都是 reset：订阅已生效，此时加载不会漏掉变更
+          loaded = true;
+          loadFirstPage();
+        } else if (pending.current) {
+          pending.current.push(change);
+        } else {
+          setList((prev) => (prev ? applyChange(prev, change) : prev));
+        }
+      });
+      source.onerror = () => {
+        // 推送不可用时至少展示一次列表
+        if (!loaded) {
+          loaded = true;
+          loadFirstPage();
+        }
+        // EventSource 会自动重连；只有被关闭（如代理返回 502）时才需要手动重连
+        if (source?.readyState === EventSource.CLOSED) {
+          source.close();
+          reconnect = setTimeout(connect, RECONNECT_MS);
+        }
+      };
+    };
+
+    connect();
     return () => {
-      cancelled = true;
+      if (reconnect) clearTimeout(reconnect);
+      source?.close();
     };
-  }, []);
+  }, [loadFirstPage]);
+
+  const loadMore = useCallback(() => {
+    if (!list?.nextCursor) return;
+    setLoadingMore(true);
+    fetchPage(list.nextCursor)
+      .then((json) => {
+        if (!json.ok || !json.data) {
+          setError(json.error ?? "请求失败");
+          return;
+        }
+        const page = json.data;
+        setList((prev) => {
+          const items = prev?.items ?? [];
+          const seen = new Set(items.map((item) => item.id));
+          return { items: [...items, ...page.items.filter((item) => !seen.has(item.id))], nextCursor: page.next_cursor };
+        });
+      })
+      .catch((e) => setError(e instanceof Error ? e.message : "网络错误"))
+      .finally(() => setLoadingMore(false));
+  }, [list?.nextCursor]);
 
   if (loading) {
     return <p className="text-muted-foreground">加载中...</p>;
@@ -47,23 +168,35 @@ export function SpecList() {
     return (
       <div className="rounded-md border border-destructive/50 bg-destructive/10 p-4">
         <p className="text-destructive">错误：{error}</p>
-        <Button variant="outline" size="sm" onClick={() => window.location.reload()} className="mt-2">
+        <Button variant="outline" size="sm" onClick={loadFirstPage} className="mt-2">
           重试
         </Button>
       </div>
     );
   }
-  if (!data?.length) {
+  if (!list?.items.length) {
     return <p className="text-muted-foreground">暂无 Spec</p>;
   }
   return (
-    <ul className="space-y-2">
-      {data.map((item) => (
-        <li key={item.id} className="flex items-center gap-2 rounded border px-3 py-2">
-          <span className="font-medium">{item.title}</span>
-          <span className="text-muted-foreground text-sm">{item.status}</span>
-        </li>
-      ))}
-    </ul>
+    <div className="space-y-2">
+      <ul className="space-y-2">
+        {list.items.map((item) => (
+          <li key={item.id} className="flex items-center gap-2 rounded border px-3 py-2">
+            <span className="font-medium">{item.title ?? item.name}</span>
+            <span className="text-muted-foreground text-sm">{item.status}</span>
+            {item.tasks_total > 0 && (
+              <span className="text-muted-foreground ml-auto text-sm">
+                {item.tasks_done}/{item.tasks_total}
+              </span>
+            )}
+          </li>
+        ))}
+      </ul>
+      {list.nextCursor && (
+        <Button variant="outline" size="sm" onClick={loadMore} disabled={loadingMore}>
+          {loadingMore ? "加载中..." : "加载更多"}
+        </Button>
+      )}
+    </div>
   );
 }
@@ -14,6 +14,12 @@ set -e
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 PROJECT_ROOT="$(cd "$SCRIPT_DIR/.." && pwd)"
 
+# 已安装 spec-coding 时交给原生实现 `spec-coding archive`（每个文件只解析一次、并发判定、
+# 批量移动与合并，支持 --dry-run / --json）；设置 SPEC_ARCHIVE_LEGACY=1 可继续使用下方脚本实现
+if [[ "${SPEC_ARCHIVE_LEGACY:-}" != "1" ]] && command -v spec-coding >/dev/null 2>&1; then
+    exec spec-coding archive --root "$PROJECT_ROOT" "$@"
+fi
+
 # ========================================
 # 颜色和输出
 # ========================================
@@ -0,0 +1,172 @@
+"""
+spec-coding check 基准测试。
+
+在临时目录生成 N 篇 Spec（active / archive 各半，另有若干 Source of Truth 领域文件与一份
+feature_list.json），分别计时：
+- cold_serial：无缓存，在当前进程中逐个检查（-j 1）
+- cold_pool：无缓存，进程池并行检查（-j JOBS）
+- warm：缓存全部命中（pre-commit 中没有 Spec 改动的提交）
+- one_changed：缓存命中，只有一篇 Spec 改动（常见的 pre-commit 场景）
+
+每个场景都包含读取、哈希、跨文件检查与写缓存，与 `spec-coding check` 的实际路径一致。结果以
+JSON 输出。
+
+用法（在 spec_cli 目录下）：
+    python bench/check_bench.py
+    python bench/check_bench.py --specs 2000 --spec-bytes 16384 --jobs 8 --output /tmp/check_bench.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from spec_cli.commands.check import (  # noqa: E402
+    SPEC_ROOT,
+    CheckCache,
+    check_specs,
+    cross_check,
+    feature_lists,
+)
+
+_WORDS = ("接口", "分页", "字段", "登录", "校验", "backend", "frontend", "spec", "列表", "归档")
+
+
+def _spec(rng: random.Random, n: int, size: int, status: str) -> str:
+    parts = [f"status: {status}\ndomain: d{n % 10}\n\n# 需求 {n}\n\n## ADDED\n\n### REQ-{n} 需求 {n}\n"]
+    written = 0
+    while written < size:
+        line = " ".join(rng.choice(_WORDS) for _ in range(12))
+        if rng.random() < 0.2:
+            line = f"- [{rng.choice(' x')}] {line}"
+        parts.append(line + "\n")
+        written += len(line.encode("utf-8")) + 1
+    if rng.random() < 0.3:
+        parts.append("\n```markdown\n- [*] 代码块中的示例\nstatus: proposal\n```\n")
+    return "".join(parts)
+
+
+def generate(root: Path, params: argparse.Namespace) -> list[Path]:
+    rng = random.Random(params.seed)
+    spec_root = root / SPEC_ROOT
+    paths = []
+    for n in range(params.specs):
+        if n % 2:
+            path = spec_root / "archive" / f"2026-01-{n % 28 + 1:02d}_spec_{n}" / "spec.md"
+            status = "implementation"
+        else:
+            path = spec_root / "active" / f"spec_{n}" / "spec.md"
+            status = rng.choice(("proposal", "implementation"))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(_spec(rng, n, params.spec_bytes, status), encoding="utf-8")
+        paths.append(path)
+    for d in range(10):
+        path = spec_root / "specs" / f"d{d}" / "spec.md"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        sections = "".join(
+            f'## REQ-{k} 需求 {k}\n<!-- sot:req id="REQ-{k}" updated="2026-01-01" -->\n\n正文 {k}\n\n'
+            for k in range(d, params.specs, 10)
+        )
+        path.write_text(f"# d{d}\n\n{sections}", encoding="utf-8")
+    plan_dir = root / "docs" / "plan_auto"
+    plan_dir.mkdir(parents=True, exist_ok=True)
+    features = [{"description": f"feature {k}", "steps": ["a", "b"], "passes": k % 3 == 0} for k in range(50)]
+    (plan_dir / "feature_list.json").write_text(
+        json.dumps({"project": "bench", "spec": "spec_0", "features": features}), encoding="utf-8"
+    )
+    return paths
+
+
+def _check(root: Path, cache_path: Path | None, jobs: int) -> int:
+    cache = CheckCache(cache_path)
+    specs, hits = check_specs(root, cache, jobs)
+    cache.save()
+    cross_check(root, specs, feature_lists(root))
+    return hits
+
+
+def _timed(fn: Callable[[], object], repeat: int, setup: Callable[[], None] | None = None) -> list[float]:
+    samples = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def run(params: argparse.Namespace) -> dict:
+    results: dict[str, list[float]] = {}
+    jobs = params.jobs or os.cpu_count() or 1
+    with tempfile.TemporaryDirectory(prefix="check_bench_") as tmp:
+        root = Path(tmp)
+        paths = generate(root, params)
+        total_bytes = sum(path.stat().st_size for path in paths)
+        cache_path = root / "cache.json"
+
+        results["cold_serial"] = _timed(lambda: _check(root, None, 1), params.repeat)
+        results["cold_pool"] = _timed(lambda: _check(root, None, jobs), params.repeat)
+
+        _check(root, cache_path, jobs)
+        results["warm"] = _timed(lambda: _check(root, cache_path, jobs), params.repeat)
+
+        target = paths[len(paths) // 2]
+        original = target.read_text(encoding="utf-8")
+        counter = iter(range(params.repeat))
+        results["one_changed"] = _timed(
+            lambda: _check(root, cache_path, jobs),
+            params.repeat,
+            setup=lambda: target.write_text(f"{original}\n变更 {next(counter)}\n", encoding="utf-8"),
+        )
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "params": {k: v for k, v in vars(params).items() if k != "output"},
+            "jobs": jobs,
+            "spec_bytes_total": total_bytes,
+        },
+        "results": {
+            name: {
+                "median_s": statistics.median(samples),
+                "min_s": min(samples),
+                "samples_s": samples,
+            }
+            for name, samples in results.items()
+        },
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="spec-coding check 基准测试")
+    parser.add_argument("--specs", type=int, default=500, help="生成的 Spec 篇数（active、archive 各半）")
+    parser.add_argument("--spec-bytes", type=int, default=8192, help="每篇 Spec 正文的大致字节数")
+    parser.add_argument("--jobs", type=int, default=None, help="进程池大小，默认 CPU 数")
+    parser.add_argument("--repeat", type=int, default=5, help="每个场景重复次数")
+    parser.add_argument("--seed", type=int, default=0, help="随机种子")
+    parser.add_argument("--output", default=None, help="结果 JSON 写入路径，默认输出到标准输出")
+    params = parser.parse_args()
+
+    result = run(params)
+    for name, r in result["results"].items():
+        print(f"{name:<14}{r['median_s'] * 1000:>10.2f} ms", file=sys.stderr)
+    text = json.dumps(result, indent=2, ensure_ascii=False)
+    if params.output:
+        Path(params.output).write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
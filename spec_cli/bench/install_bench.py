@@ -0,0 +1,231 @@
+"""
+spec_cli 安装 / 更新路径基准测试。
+
+在临时目录生成合成仓库（N 条规则、M 个技能、文件大小区间、深层嵌套），分别计时：
+- build_tree：build_templates.build 生成展开的 templates/ 目录
+- build_bundle：build_templates.build_bundle 生成模板包
+- fingerprint：模板包过期检查（source_fingerprint）
+- to_placeholders：_to_placeholders 处理全部源文本
+- fresh_install：空目录首次安装
+- update_same_version：同版本、模板未变时再次更新
+- update_version_bump：版本变化且约 10% 模板内容变化时更新
+- docs_only：空目录 --docs-only 安装
+
+结果以 JSON 输出；给出 --baseline 时与保存的基线比较，任一场景中位数变慢超过阈值即以非零状态退出。
+
+用法（在 spec_cli 目录下）：
+    python bench/install_bench.py --output bench/baseline.json
+    python bench/install_bench.py --baseline bench/baseline.json --threshold 0.2
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from spec_cli import build_templates  # noqa: E402
+from spec_cli.bundle import TemplateBundle  # noqa: E402
+from spec_cli.cli import VERSION, VERSION_FILE  # noqa: E402
+from spec_cli.commands.init import _install_templates  # noqa: E402
+
+_WORDS = ("backend", "frontend", "app/api", "app.core", "application", "spec", "docs", "规则", "技能", "the")
+
+
+def _text(rng: random.Random, size: int) -> str:
+    """生成约 size 字节、含占位符候选词的文本。"""
+    parts: list[str] = []
+    length = 0
+    while length < size:
+        line = " ".join(rng.choice(_WORDS) for _ in range(12)) + "\n"
+        parts.append(line)
+        length += len(line.encode("utf-8"))
+    return "".join(parts)
+
+
+def generate_repo(root: Path, params: argparse.Namespace) -> None:
+    """在 root 下生成与本仓库结构一致的合成仓库。"""
+    rng = random.Random(params.seed)
+
+    def write(path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(_text(rng, rng.randint(params.min_size, params.max_size)), encoding="utf-8")
+
+    for i in range(params.rules):
+        write(root / ".cursor" / "rules" / f"rule_{i:04d}.mdc")
+        write(root / ".claude" / "rules" / f"rule_{i:04d}.md")
+    for i in range(params.skills):
+        for base in (root / ".cursor" / "skills", root / ".claude" / "skills"):
+            skill = base / f"skill_{i:04d}"
+            write(skill / "SKILL.md")
+            for j in range(params.files_per_skill):
+                nested = skill.joinpath(*(f"level_{d}" for d in range(j % (params.depth + 1))))
+                write(nested / f"file_{j:03d}.md")
+    for name in ("spec", "spec_process"):
+        for i in range(max(1, params.rules // 5)):
+            write(root / "docs" / name / f"doc_{i:03d}.md")
+    write(root / "CLAUDE.md")
+    (root / ".cursor" / "mcp.json").write_text('{"mcpServers": {}}\n', encoding="utf-8")
+
+
+def _mutate(root: Path, fraction: float, seed: int) -> None:
+    """改动约 fraction 比例的规则与技能文件，模拟版本升级带来的模板变化。"""
+    rng = random.Random(seed)
+    files = sorted(p for top in (".cursor", ".claude") for p in (root / top).rglob("*.md*"))
+    for path in rng.sample(files, max(1, int(len(files) * fraction))):
+        with path.open("a", encoding="utf-8") as f:
+            f.write("\nbackend frontend app/changed\n")
+
+
+def _timed(fn: Callable[[], object], repeat: int, setup: Callable[[], None] | None = None) -> list[float]:
+    samples = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            fn()
+            samples.append(time.perf_counter() - start)
+    return samples
+
+
+def run(params: argparse.Namespace) -> dict:
+    results: dict[str, list[float]] = {}
+    with tempfile.TemporaryDirectory(prefix="spec_cli_bench_") as tmp:
+        work = Path(tmp)
+        repo = work / "repo"
+        generate_repo(repo, params)
+        sources = build_templates._collect_sources(repo)
+        source_bytes = sum(src.stat().st_size for src, _, _ in sources)
+        bundle = work / "templates.bundle"
+        target = work / "target"
+
+        results["build_tree"] = _timed(lambda: build_templates.build(repo, work / "templates"), params.repeat)
+        results["build_bundle"] = _timed(lambda: build_templates.build_bundle(bundle, repo), params.repeat)
+        results["fingerprint"] = _timed(lambda: build_templates.source_fingerprint(repo), params.repeat)
+        texts = [src.read_text(encoding="utf-8") for src, _, apply in sources if apply]
+        results["to_placeholders"] = _timed(
+            lambda: [build_templates._to_placeholders(t) for t in texts], params.repeat
+        )
+
+        def install(is_update: bool, docs_only: bool = False) -> None:
+            with TemplateBundle(bundle) as templates:
+                report = _install_templates(
+                    templates,
+                    target,
+                    backend_dir="server",
+                    frontend_dir="web",
+                    app_package="myapp",
+                    docs_only=docs_only,
+                    skip_skills=docs_only,
+                    is_update=is_update,
+                    jobs=params.jobs,
+                )
+            if report["failed"]:
+                raise RuntimeError(f"安装失败: {report['failed'][:3]}")
+
+        def fresh_target() -> None:
+            shutil.rmtree(target, ignore_errors=True)
+            target.mkdir()
+
+        results["fresh_install"] = _timed(lambda: install(False), params.repeat, setup=fresh_target)
+        results["docs_only"] = _timed(lambda: install(False, docs_only=True), params.repeat, setup=fresh_target)
+
+        fresh_target()
+        install(False)
+        results["update_same_version"] = _timed(lambda: install(True), params.repeat)
+
+        def bump() -> None:
+            # 每轮在上一轮的基础上再改动一部分模板，并把已安装版本回退，模拟升级
+            _mutate(repo, 0.1, seed=params.seed + len(results.get("update_version_bump", [])))
+            with contextlib.redirect_stdout(io.StringIO()):
+                build_templates.build_bundle(bundle, repo)
+            data = json.loads((target / VERSION_FILE).read_text(encoding="utf-8"))
+            data["version"] = "0.0.0"
+            (target / VERSION_FILE).write_text(json.dumps(data), encoding="utf-8")
+
+        results["update_version_bump"] = _timed(lambda: install(True), params.repeat, setup=bump)
+
+    return {
+        "meta": {
+            "spec_coding_version": VERSION,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "params": {k: v for k, v in vars(params).items() if k not in ("output", "baseline", "threshold")},
+            "source_files": len(sources),
+            "source_bytes": source_bytes,
+        },
+        "results": {
+            name: {
+                "median_s": statistics.median(samples),
+                "min_s": min(samples),
+                "mean_s": statistics.fmean(samples),
+                "samples_s": samples,
+            }
+            for name, samples in results.items()
+        },
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> list[str]:
+    """逐场景比较中位数，返回超出阈值的回退描述。"""
+    regressions = []
+    print(f"{'场景':<22}{'基线(ms)':>10}{'当前(ms)':>10}{'比例':>6}")
+    for name, result in current["results"].items():
+        base = baseline.get("results", {}).get(name)
+        if base is None:
+            print(f"{name:<24}{'-':>12}{result['median_s'] * 1000:>12.2f}{'新增':>6}")
+            continue
+        ratio = result["median_s"] / base["median_s"] if base["median_s"] else float("inf")
+        flag = " !" if ratio > 1 + threshold else ""
+        print(f"{name:<24}{base['median_s'] * 1000:>12.2f}{result['median_s'] * 1000:>12.2f}{ratio:>8.2f}{flag}")
+        if ratio > 1 + threshold:
+            regressions.append(f"{name}: {ratio:.2f}x（阈值 {1 + threshold:.2f}x）")
+    if baseline.get("meta", {}).get("params") != current["meta"]["params"]:
+        print("注意：基线与本次的生成参数不同，比较结果仅供参考。", file=sys.stderr)
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="spec_cli 安装 / 更新路径基准测试")
+    parser.add_argument("--rules", type=int, default=50, help="规则文件数（.cursor 与 .claude 各一份）")
+    parser.add_argument("--skills", type=int, default=20, help="技能目录数")
+    parser.add_argument("--files-per-skill", type=int, default=8, help="每个技能下的附加文件数")
+    parser.add_argument("--depth", type=int, default=4, help="技能目录最大嵌套深度")
+    parser.add_argument("--min-size", type=int, default=512, help="单个文件最小字节数")
+    parser.add_argument("--max-size", type=int, default=64 * 1024, help="单个文件最大字节数")
+    parser.add_argument("--repeat", type=int, default=5, help="每个场景重复次数")
+    parser.add_argument("--jobs", type=int, default=None, help="安装线程数，默认与 init 相同")
+    parser.add_argument("--seed", type=int, default=0, help="随机种子，保证合成仓库可复现")
+    parser.add_argument("--output", default=None, help="结果 JSON 写入路径，默认输出到标准输出")
+    parser.add_argument("--baseline", default=None, help="与该基线 JSON 比较")
+    parser.add_argument("--threshold", type=float, default=0.2, help="允许的中位数变慢比例，默认 0.2（20%%）")
+    params = parser.parse_args()
+
+    current = run(params)
+    text = json.dumps(current, indent=2, ensure_ascii=False)
+    if params.output:
+        Path(params.output).write_text(text + "\n", encoding="utf-8")
+    elif not params.baseline:
+        print(text)
+
+    if params.baseline:
+        baseline = json.loads(Path(params.baseline).read_text(encoding="utf-8"))
+        regressions = compare(current, baseline, params.threshold)
+        for item in regressions:
+            print(f"回退: {item}", file=sys.stderr)
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
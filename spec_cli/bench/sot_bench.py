@@ -0,0 +1,158 @@
+"""
+结构化 Source of Truth 基准测试。
+
+在临时目录生成一个领域：旧格式为 archive.sh 追加写出的 N 段历史（每段一个 Spec，约 1/4 修改
+已有需求），分别计时：
+- legacy_scan：读取并解析整个旧格式文件（改造前读者的做法）
+- compact：旧格式重放为结构化文档并写回（spec-coding sot compact）
+- index_rebuild：索引缺失时扫描结构化文件并重写索引
+- list_indexed：索引有效时列出需求
+- read_one_indexed：按索引偏移读取单个需求
+- merge_one：归档一个 Spec 的 delta（读取、原地合并、写回与更新索引）
+
+结果以 JSON 输出。
+
+用法（在 spec_cli 目录下）：
+    python bench/sot_bench.py
+    python bench/sot_bench.py --history 2000 --output /tmp/sot_bench.json
+"""
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from spec_cli.sot import INDEX_FILE, SotStore, load_text, parse_delta  # noqa: E402
+
+_WORDS = ("接口", "分页", "字段", "登录", "校验", "backend", "frontend", "spec", "列表", "归档")
+
+
+def _spec(rng: random.Random, n: int, req_ids: list[int], size: int) -> str:
+    """生成一篇带 ADDED / MODIFIED 的 Spec。"""
+    parts = [f"status: implementation\ndomain: bench\n\n# 需求 {n}\n\n## ADDED\n"]
+    for req in req_ids:
+        body = " ".join(rng.choice(_WORDS) for _ in range(size // 8))
+        parts.append(f"\n### REQ-{req} 需求 {req}\n{body}\n")
+    return "".join(parts)
+
+
+def generate_legacy(path: Path, params: argparse.Namespace) -> None:
+    rng = random.Random(params.seed)
+    next_id = 1
+    chunks = []
+    for n in range(params.history):
+        if next_id > 1 and rng.random() < 0.25:
+            ids = [rng.randrange(1, next_id)]
+        else:
+            ids = [next_id]
+            next_id += 1
+        text = _spec(rng, n, ids, params.section_bytes)
+        if n == 0:
+            chunks.append(text)
+        else:
+            body = "".join(line for line in text.splitlines(keepends=True) if not line.startswith("status:"))
+            chunks.append(f"\n\n--- 归档于 2026-01-{n % 28 + 1:02d} ---\n\n---\n{body}")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("".join(chunks), encoding="utf-8")
+
+
+def _timed(fn: Callable[[], object], repeat: int, setup: Callable[[], None] | None = None) -> list[float]:
+    samples = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def run(params: argparse.Namespace) -> dict:
+    results: dict[str, list[float]] = {}
+    with tempfile.TemporaryDirectory(prefix="sot_bench_") as tmp:
+        store = SotStore(Path(tmp))
+        path = store.path("bench")
+        generate_legacy(path, params)
+        legacy_text = path.read_text(encoding="utf-8")
+        legacy_bytes = len(legacy_text.encode("utf-8"))
+
+        results["legacy_scan"] = _timed(
+            lambda: load_text(path.read_text(encoding="utf-8"), "bench"), params.repeat
+        )
+        results["compact"] = _timed(
+            lambda: store.save("bench", store.load("bench")),
+            params.repeat,
+            setup=lambda: path.write_text(legacy_text, encoding="utf-8"),
+        )
+        compact_bytes = path.stat().st_size
+        index = store.index("bench")
+        requirements = len(index.entries) if index is not None else 0
+        middle = index.entries[len(index.entries) // 2].id if index is not None and index.entries else ""
+
+        results["index_rebuild"] = _timed(
+            lambda: store.index("bench"),
+            params.repeat,
+            setup=lambda: path.with_name(INDEX_FILE).unlink(missing_ok=True),
+        )
+        results["list_indexed"] = _timed(lambda: store.index("bench"), params.repeat)
+        results["read_one_indexed"] = _timed(lambda: store.read("bench", middle), params.repeat)
+
+        rng = random.Random(params.seed + 1)
+        delta = parse_delta(_spec(rng, 0, [1, requirements + 1], params.section_bytes), "bench_merge")
+
+        def merge() -> None:
+            doc = store.load("bench")
+            doc.apply(delta, updated="2026-10-18", source="bench_merge")
+            store.save("bench", doc)
+
+        results["merge_one"] = _timed(merge, params.repeat)
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "params": {k: v for k, v in vars(params).items() if k != "output"},
+            "legacy_bytes": legacy_bytes,
+            "compact_bytes": compact_bytes,
+            "requirements": requirements,
+        },
+        "results": {
+            name: {
+                "median_s": statistics.median(samples),
+                "min_s": min(samples),
+                "samples_s": samples,
+            }
+            for name, samples in results.items()
+        },
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="结构化 Source of Truth 基准测试")
+    parser.add_argument("--history", type=int, default=500, help="旧格式文件中追加的 Spec 段数")
+    parser.add_argument("--section-bytes", type=int, default=2048, help="每个需求正文的大致字节数")
+    parser.add_argument("--repeat", type=int, default=5, help="每个场景重复次数")
+    parser.add_argument("--seed", type=int, default=0, help="随机种子")
+    parser.add_argument("--output", default=None, help="结果 JSON 写入路径，默认输出到标准输出")
+    params = parser.parse_args()
+
+    result = run(params)
+    for name, r in result["results"].items():
+        print(f"{name:<18}{r['median_s'] * 1000:>10.2f} ms", file=sys.stderr)
+    text = json.dumps(result, indent=2, ensure_ascii=False)
+    if params.output:
+        Path(params.output).write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+启动开销回归检查：`spec-coding version` 在 hooks / CI 中被高频调用，其导入开销与耗时须保持在预算内。
+
+检查项：
+1. `python -X importtime -m spec_cli version` 中 spec_cli 自身模块的累计导入耗时不超过 IMPORT_BUDGET_US；
+2. version 快速路径不得导入 FORBIDDEN 中的模块（argparse、子命令实现、模板相关模块等）；
+3. 多次运行取中位数，相对空解释器（python -c pass）的额外墙钟耗时不超过 WALL_BUDGET_MS。
+
+用法（在 spec_cli 目录下）：python bench/startup_budget.py [--runs N]
+不满足预算时以非零状态退出，可直接放入 CI 或 pre-commit。
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+IMPORT_BUDGET_US = 20_000
+WALL_BUDGET_MS = 60.0
+FORBIDDEN = (
+    "argparse",
+    "spec_cli.commands",
+    "spec_cli.bundle",
+    "spec_cli.render",
+    "spec_cli.workspace",
+    "zipfile",
+    "concurrent.futures",
+)
+
+PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+
+
+def _run(args: list[str]) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        [sys.executable, *args],
+        cwd=PACKAGE_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def import_profile() -> dict[str, tuple[int, int]]:
+    """返回 version 快速路径导入的模块 -> (累计导入耗时微秒, 嵌套深度)。"""
+    stderr = _run(["-X", "importtime", "-m", "spec_cli", "version"]).stderr
+    modules: dict[str, tuple[int, int]] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, raw_name = line[len("import time:") :].split("|")
+        name = raw_name.strip()
+        # 名称前的缩进表示被谁导入：每层两个空格
+        depth = (len(raw_name) - len(raw_name.lstrip()) - 1) // 2
+        modules[name] = (int(cumulative), depth)
+    return modules
+
+
+def wall_ms(args: list[str], runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        _run(args)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="spec-coding 启动开销预算检查")
+    parser.add_argument("--runs", type=int, default=15, help="墙钟耗时采样次数，取中位数")
+    args = parser.parse_args()
+
+    errors: list[str] = []
+    modules = import_profile()
+    # 只累加顶层的 spec_cli 模块，其累计耗时已包含它们各自导入的依赖
+    own_us = sum(us for name, (us, depth) in modules.items() if depth == 0 and name.startswith("spec_cli"))
+    print(f"spec_cli 导入耗时: {own_us / 1000:.2f}ms（预算 {IMPORT_BUDGET_US / 1000:.0f}ms）")
+    if own_us > IMPORT_BUDGET_US:
+        errors.append(f"导入耗时超出预算: {own_us}us > {IMPORT_BUDGET_US}us")
+    leaked = sorted(n for n in modules if any(n == f or n.startswith(f + ".") for f in FORBIDDEN))
+    if leaked:
+        errors.append(f"version 快速路径导入了不应加载的模块: {', '.join(leaked)}")
+
+    _run(["-m", "spec_cli", "version"])  # 预热 pyc
+    baseline = wall_ms(["-c", "pass"], args.runs)
+    version = wall_ms(["-m", "spec_cli", "version"], args.runs)
+    extra = version - baseline
+    print(f"墙钟耗时: {version:.1f}ms，空解释器 {baseline:.1f}ms，额外 {extra:.1f}ms（预算 {WALL_BUDGET_MS:.0f}ms）")
+    if extra > WALL_BUDGET_MS:
+        errors.append(f"墙钟耗时超出预算: 额外 {extra:.1f}ms > {WALL_BUDGET_MS:.0f}ms")
+
+    for error in errors:
+        print(f"失败: {error}", file=sys.stderr)
+    sys.exit(1 if errors else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,4 @@
-"""构建前从仓库根生成 templates，保证单一来源（只改 .cursor 与 docs）。"""
+"""构建前从仓库根生成 templates.bundle，保证单一来源（只改 .cursor 与 docs）。"""
 
 import sys
 from pathlib import Path
@@ -13,14 +13,10 @@ class BuildPyWithTemplates(build_py):
         sys.path.insert(0, str(root))
         try:
             import spec_cli.build_templates
-            spec_cli.build_templates.build()
-        except Exception:
-            pass
-        super().run(self)
-        try:
-            spec_cli.build_templates.cleanup_templates()
+            spec_cli.build_templates.build_bundle()
         except Exception:
             pass
+        super().run()
 
 
 setup(cmdclass={"build_py": BuildPyWithTemplates})
@@ -1,16 +1,17 @@
 """
 从仓库根目录的 .cursor 与 docs 生成 spec_cli 的 templates（带占位符）。
-唯一编辑处：仓库根 .cursor/ 与 docs/；本脚本在发布或本地安装前运行，生成 spec_cli/templates/。
+唯一编辑处：仓库根 .cursor/ 与 docs/；本脚本在发布或本地安装前运行，生成 spec_cli/templates.bundle
+（单文件模板包，见 spec_cli/bundle.py），也可用 build() 生成展开的 spec_cli/templates/ 目录。
 """
 
-import re
+import hashlib
 import shutil
 import sys
 from pathlib import Path
 
-PLACEHOLDER_BACKEND = "{{BACKEND_DIR}}"
-PLACEHOLDER_FRONTEND = "{{FRONTEND_DIR}}"
-PLACEHOLDER_APP = "{{APP_PACKAGE}}"
+from spec_cli.bundle import bundle_path, read_index, write_bundle
+from spec_cli.render import PASSTHROUGH, TO_PLACEHOLDERS, read_chunks
+from spec_cli.sot import INDEX_FILE
 
 
 def _repo_root() -> Path:
@@ -23,118 +24,142 @@ def _templates_dir() -> Path:
     return Path(__file__).resolve().parent / "templates"
 
 
+def _in_repo(repo: Path) -> bool:
+    return (repo / ".cursor").is_dir() and (repo / "docs").is_dir()
+
+
 def _to_placeholders(content: str) -> str:
     """将仓库中的 backend/frontend/app 转为占位符（用于 .cursor 与 .claude 下的规则、技能及 CLAUDE.md）。"""
-    s = content.replace("backend", PLACEHOLDER_BACKEND)
-    s = s.replace("frontend", PLACEHOLDER_FRONTEND)
-    # 仅替换作为包名的 app：app/、app.，避免改到 application 等
-    s = re.sub(r"\bapp/", f"{PLACEHOLDER_APP}/", s)
-    s = re.sub(r"\bapp\.", f"{PLACEHOLDER_APP}.", s)
-    return s
+    return TO_PLACEHOLDERS.render(content)
 
 
 def _copy_with_placeholders(src: Path, dest: Path, apply_placeholders: bool) -> None:
+    """单遍流式复制；二进制文件按字节原样复制。"""
     dest.parent.mkdir(parents=True, exist_ok=True)
-    text = src.read_text(encoding="utf-8")
-    if apply_placeholders:
-        text = _to_placeholders(text)
-    dest.write_text(text, encoding="utf-8")
+    (TO_PLACEHOLDERS if apply_placeholders else PASSTHROUGH).write(read_chunks(src), dest)
 
 
-def build() -> bool:
-    """从仓库根生成 templates。若不在仓库内（无 .cursor/docs）则跳过并返回 False。"""
-    repo = _repo_root()
-    templates = _templates_dir()
+def _collect_sources(repo: Path) -> list[tuple[Path, str, bool]]:
+    """列出参与生成模板的源文件：(源文件, 模板内相对路径, 是否替换占位符)，按相对路径排序。"""
+    sources: list[tuple[Path, str, bool]] = []
 
-    if not (repo / ".cursor").is_dir() or not (repo / "docs").is_dir():
-        return False
+    def add_tree(src: Path, dest: str, apply_placeholders: bool) -> None:
+        if src.is_dir():
+            for f in src.rglob("*"):
+                # Source of Truth 的偏移索引是本地生成的缓存，不进入模板
+                if f.is_file() and f.name != INDEX_FILE:
+                    sources.append((f, f"{dest}/{f.relative_to(src).as_posix()}", apply_placeholders))
 
-    # 清空并重建 templates
-    if templates.exists():
-        shutil.rmtree(templates)
-    templates.mkdir(parents=True)
+    def add_skills(src: Path, dest: str) -> None:
+        # 仅收录技能子目录，忽略 skills/ 下的散落文件
+        if src.is_dir():
+            for item in src.iterdir():
+                if item.is_dir():
+                    add_tree(item, f"{dest}/{item.name}", apply_placeholders=True)
 
-    # .cursor/rules -> templates/cursor/rules（替换占位符）
+    # .cursor/rules -> cursor/rules（替换占位符）
     rules_src = repo / ".cursor" / "rules"
-    rules_dst = templates / "cursor" / "rules"
     if rules_src.is_dir():
         for f in rules_src.glob("*.mdc"):
-            _copy_with_placeholders(f, rules_dst / f.name, apply_placeholders=True)
-
-    # .cursor/skills -> templates/cursor/skills（替换占位符）
-    skills_src = repo / ".cursor" / "skills"
-    skills_dst = templates / "cursor" / "skills"
-    if skills_src.is_dir():
-        for item in skills_src.iterdir():
-            if item.is_dir():
-                for f in item.rglob("*"):
-                    if f.is_file():
-                        rel = f.relative_to(item)
-                        dest_file = skills_dst / item.name / rel
-                        _copy_with_placeholders(f, dest_file, apply_placeholders=True)
-
-    # docs/spec -> templates/docs/spec（不替换）
-    spec_src = repo / "docs" / "spec"
-    spec_dst = templates / "docs" / "spec"
-    if spec_src.is_dir():
-        for f in spec_src.rglob("*"):
-            if f.is_file():
-                rel = f.relative_to(spec_src)
-                dest_file = spec_dst / rel
-                _copy_with_placeholders(f, dest_file, apply_placeholders=False)
-
-    # docs/spec_process -> templates/docs/spec_process（不替换）
-    process_src = repo / "docs" / "spec_process"
-    process_dst = templates / "docs" / "spec_process"
-    if process_src.is_dir():
-        for f in process_src.rglob("*"):
-            if f.is_file():
-                rel = f.relative_to(process_src)
-                dest_file = process_dst / rel
-                _copy_with_placeholders(f, dest_file, apply_placeholders=False)
-
-    # .claude/rules -> templates/claude/rules（替换占位符，供 Claude Code 使用）
-    claude_rules_src = repo / ".claude" / "rules"
-    claude_rules_dst = templates / "claude" / "rules"
-    if claude_rules_src.is_dir():
-        for f in claude_rules_src.rglob("*"):
-            if f.is_file():
-                rel = f.relative_to(claude_rules_src)
-                dest_file = claude_rules_dst / rel
-                _copy_with_placeholders(f, dest_file, apply_placeholders=True)
-
-    # .claude/skills -> templates/claude/skills（Claude Code 独立维护，不覆盖 .cursor/skills）
-    claude_skills_src = repo / ".claude" / "skills"
-    claude_skills_dst = templates / "claude" / "skills"
-    if claude_skills_src.is_dir():
-        for item in claude_skills_src.iterdir():
-            if item.is_dir():
-                for f in item.rglob("*"):
-                    if f.is_file():
-                        rel = f.relative_to(item)
-                        dest_file = claude_skills_dst / item.name / rel
-                        _copy_with_placeholders(f, dest_file, apply_placeholders=True)
-
-    # CLAUDE.md -> templates/CLAUDE.md（替换占位符）
+            sources.append((f, f"cursor/rules/{f.name}", True))
+
+    # .cursor/skills -> cursor/skills（替换占位符）
+    add_skills(repo / ".cursor" / "skills", "cursor/skills")
+
+    # docs/spec、docs/spec_process（不替换）
+    add_tree(repo / "docs" / "spec", "docs/spec", apply_placeholders=False)
+    add_tree(repo / "docs" / "spec_process", "docs/spec_process", apply_placeholders=False)
+
+    # .claude/rules -> claude/rules（替换占位符，供 Claude Code 使用）
+    add_tree(repo / ".claude" / "rules", "claude/rules", apply_placeholders=True)
+
+    # .claude/skills -> claude/skills（Claude Code 独立维护，不覆盖 .cursor/skills）
+    add_skills(repo / ".claude" / "skills", "claude/skills")
+
+    # CLAUDE.md（替换占位符）
     claude_md_src = repo / "CLAUDE.md"
     if claude_md_src.is_file():
-        _copy_with_placeholders(claude_md_src, templates / "CLAUDE.md", apply_placeholders=True)
+        sources.append((claude_md_src, "CLAUDE.md", True))
 
-    # .cursor/mcp.json -> templates/cursor/mcp.json（MCP 服务器配置模板）
+    # .cursor/mcp.json（MCP 服务器配置模板，不替换）
     mcp_src = repo / ".cursor" / "mcp.json"
-    mcp_dst = templates / "cursor" / "mcp.json"
     if mcp_src.is_file():
-        _copy_with_placeholders(mcp_src, mcp_dst, apply_placeholders=False)
+        sources.append((mcp_src, "cursor/mcp.json", False))
+
+    return sorted(sources, key=lambda s: s[1])
+
+
+def source_fingerprint(repo: Path | None = None) -> str:
+    """源文件指纹：各源文件的相对路径、大小与 mtime，加上渲染规则所在模块自身；只 stat，不读内容。"""
+    repo = repo or _repo_root()
+    h = hashlib.sha256()
+    here = Path(__file__).resolve().parent
+    modules = ("render.py", "bundle.py", "build_templates.py")
+    entries = _collect_sources(repo) + [(here / m, f"@{m}", False) for m in modules]
+    for src, name, apply in entries:
+        st = src.stat()
+        h.update(f"{name}\0{int(apply)}\0{st.st_size}\0{st.st_mtime_ns}\n".encode())
+    return h.hexdigest()
+
+
+def build(repo: Path | None = None, templates: Path | None = None) -> bool:
+    """从仓库根生成展开的 templates/ 目录。若不在仓库内（无 .cursor/docs）则跳过并返回 False。
+
+    repo / templates 默认为本仓库根与 spec_cli/templates，可另行指定（如基准测试中的合成仓库）。
+    """
+    repo = repo or _repo_root()
+    templates = templates or _templates_dir()
+
+    if not _in_repo(repo):
+        return False
+
+    # 清空并重建 templates
+    if templates.exists():
+        shutil.rmtree(templates)
+    templates.mkdir(parents=True)
+
+    for src, name, apply_placeholders in _collect_sources(repo):
+        _copy_with_placeholders(src, templates / name, apply_placeholders=apply_placeholders)
 
     print(f"已从 {repo} 生成 templates -> {templates}")
     return True
 
 
+def build_bundle(path: Path | None = None, repo: Path | None = None) -> Path | None:
+    """从仓库根生成单文件模板包，返回其路径；不在仓库内时返回 None。"""
+    from spec_cli.cli import VERSION
+
+    repo = repo or _repo_root()
+    if not _in_repo(repo):
+        return None
+    path = path or bundle_path()
+    fingerprint = source_fingerprint(repo)
+    entries = []
+    for src, name, apply_placeholders in _collect_sources(repo):
+        renderer = TO_PLACEHOLDERS if apply_placeholders else PASSTHROUGH
+        entries.append((name, b"".join(renderer.iter_file(src))))
+    write_bundle(path, entries, fingerprint=fingerprint, version=VERSION)
+    print(f"已从 {repo} 生成模板包 -> {path}")
+    return path
+
+
+def ensure_bundle() -> Path | None:
+    """返回可用的模板包路径：在仓库内时仅当源指纹变化才重建；不在仓库内则使用随包发布的模板包。"""
+    path = bundle_path()
+    repo = _repo_root()
+    if not _in_repo(repo):
+        return path if read_index(path) is not None else None
+    index = read_index(path)
+    if index is not None and index.get("fingerprint") == source_fingerprint(repo):
+        return path
+    return build_bundle(path)
+
+
 def cleanup_templates() -> None:
     """删除 templates 目录（仅当在仓库内、可重新生成时），保证代码中只保留一套流程。"""
     repo = _repo_root()
     templates = _templates_dir()
-    if not (repo / ".cursor").is_dir() or not (repo / "docs").is_dir():
+    if not _in_repo(repo):
         return
     if templates.exists():
         try:
@@ -144,7 +169,11 @@ def cleanup_templates() -> None:
 
 
 def main() -> None:
-    if not build():
+    if "--dir" in sys.argv[1:]:
+        ok = build()
+    else:
+        ok = build_bundle() is not None
+    if not ok:
         print("跳过：未在仓库根找到 .cursor 或 docs（如从 sdist 安装则正常）", file=sys.stderr)
         sys.exit(0)
 
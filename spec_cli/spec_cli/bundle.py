@@ -0,0 +1,201 @@
+"""
+模板来源：预构建的单文件模板包（templates.bundle）、旧式 templates/ 目录，或已在内存中渲染好的模板集。
+
+模板包为 zip（条目均为 STORED，不压缩），内含 index.json 记录格式版本、源指纹及每个条目的大小与 sha256。
+读取时整体 mmap，条目内容直接按偏移切片为 memoryview，不经解压与复制。
+"""
+
+import hashlib
+import json
+import mmap
+import struct
+import zipfile
+from collections.abc import Iterator
+from pathlib import Path
+
+from spec_cli.render import CHUNK_SIZE, Buffer, read_chunks
+
+BUNDLE_FORMAT = 1
+BUNDLE_NAME = "templates.bundle"
+INDEX_NAME = "index.json"
+
+# zip 本地文件头：固定 30 字节，文件名长度与扩展字段长度分别位于偏移 26、28
+_LOCAL_HEADER = struct.Struct("<4sHHHHHIIIHH")
+_LOCAL_HEADER_SIGNATURE = b"PK\x03\x04"
+
+
+def bundle_path() -> Path:
+    """spec_cli 包内模板包路径。"""
+    return Path(__file__).resolve().parent / BUNDLE_NAME
+
+
+def read_index(path: Path) -> dict | None:
+    """只读取模板包的索引（不 mmap 条目），格式不符或损坏时返回 None。"""
+    try:
+        with zipfile.ZipFile(path) as zf:
+            index = json.loads(zf.read(INDEX_NAME))
+    except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+        return None
+    if not isinstance(index, dict) or index.get("format") != BUNDLE_FORMAT:
+        return None
+    return index
+
+
+class TemplateBundle:
+    """模板包的只读视图。"""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        with path.open("rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mm)
+        self._spans: dict[str, tuple[int, int]] = {}
+        with zipfile.ZipFile(path) as zf:
+            self.index: dict = json.loads(zf.read(INDEX_NAME))
+            for info in zf.infolist():
+                if info.filename == INDEX_NAME or info.is_dir():
+                    continue
+                if info.compress_type != zipfile.ZIP_STORED:
+                    raise ValueError(f"模板包条目未以 STORED 方式存储: {info.filename}")
+                header = _LOCAL_HEADER.unpack_from(self._mm, info.header_offset)
+                if header[0] != _LOCAL_HEADER_SIGNATURE:
+                    raise ValueError(f"模板包条目头损坏: {info.filename}")
+                start = info.header_offset + _LOCAL_HEADER.size + header[9] + header[10]
+                self._spans[info.filename] = (start, info.file_size)
+        self._names = sorted(self._spans)
+
+    def close(self) -> None:
+        self._view.release()
+        self._mm.close()
+
+    def __enter__(self) -> "TemplateBundle":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def is_file(self, name: str) -> bool:
+        return name in self._spans
+
+    def is_dir(self, prefix: str) -> bool:
+        return bool(self.files(prefix))
+
+    def files(self, prefix: str) -> list[str]:
+        """prefix 目录下所有条目（递归，已排序）。"""
+        prefix = prefix.rstrip("/") + "/"
+        return [name for name in self._names if name.startswith(prefix)]
+
+    def size(self, name: str) -> int:
+        return self._spans[name][1]
+
+    def sha256(self, name: str) -> str | None:
+        entry = self.index.get("entries", {}).get(name)
+        return entry.get("sha256") if entry else None
+
+    def chunks(self, name: str, chunk_size: int = CHUNK_SIZE) -> Iterator[Buffer]:
+        """按块产出条目内容，均为 mmap 上的 memoryview 切片。"""
+        start, size = self._spans[name]
+        for offset in range(start, start + size, chunk_size):
+            yield self._view[offset : min(offset + chunk_size, start + size)]
+
+
+class TemplateDir:
+    """旧式 templates/ 目录，与 TemplateBundle 提供相同的读取接口。"""
+
+    def __init__(self, root: Path) -> None:
+        self.path = root
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self) -> "TemplateDir":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def is_file(self, name: str) -> bool:
+        return (self.path / name).is_file()
+
+    def is_dir(self, prefix: str) -> bool:
+        return (self.path / prefix).is_dir()
+
+    def files(self, prefix: str) -> list[str]:
+        base = self.path / prefix
+        if not base.is_dir():
+            return []
+        return sorted(p.relative_to(self.path).as_posix() for p in base.rglob("*") if p.is_file())
+
+    def size(self, name: str) -> int:
+        return (self.path / name).stat().st_size
+
+    def sha256(self, name: str) -> str | None:
+        return None
+
+    def chunks(self, name: str, chunk_size: int = CHUNK_SIZE) -> Iterator[Buffer]:
+        return read_chunks(self.path / name, chunk_size)
+
+
+class MemoryTemplates:
+    """内存中的模板集（名称 -> 内容），用于同一组模板批量安装到多个目标。"""
+
+    def __init__(self, entries: dict[str, bytes]) -> None:
+        self.path = Path("<memory>")
+        self._entries = entries
+        self._names = sorted(entries)
+        self._digests = {name: hashlib.sha256(data).hexdigest() for name, data in entries.items()}
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self) -> "MemoryTemplates":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def is_file(self, name: str) -> bool:
+        return name in self._entries
+
+    def is_dir(self, prefix: str) -> bool:
+        return bool(self.files(prefix))
+
+    def files(self, prefix: str) -> list[str]:
+        prefix = prefix.rstrip("/") + "/"
+        return [name for name in self._names if name.startswith(prefix)]
+
+    def size(self, name: str) -> int:
+        return len(self._entries[name])
+
+    def sha256(self, name: str) -> str | None:
+        return self._digests[name]
+
+    def chunks(self, name: str, chunk_size: int = CHUNK_SIZE) -> Iterator[Buffer]:
+        view = memoryview(self._entries[name])
+        for offset in range(0, len(view), chunk_size):
+            yield view[offset : offset + chunk_size]
+
+
+TemplateSource = TemplateBundle | TemplateDir | MemoryTemplates
+
+
+def write_bundle(path: Path, entries: list[tuple[str, bytes]], fingerprint: str, version: str) -> None:
+    """写入模板包（先写临时文件再原子替换）；条目按名称排序、时间戳固定，输出可复现。"""
+    index = {
+        "format": BUNDLE_FORMAT,
+        "version": version,
+        "fingerprint": fingerprint,
+        "entries": {
+            name: {"size": len(data), "sha256": hashlib.sha256(data).hexdigest()}
+            for name, data in sorted(entries)
+        },
+    }
+    tmp = path.with_name(path.name + ".tmp")
+    with zipfile.ZipFile(tmp, "w", compression=zipfile.ZIP_STORED) as zf:
+        zf.writestr(
+            zipfile.ZipInfo(INDEX_NAME, date_time=(1980, 1, 1, 0, 0, 0)),
+            json.dumps(index, indent=2, ensure_ascii=False),
+        )
+        for name, data in sorted(entries):
+            zf.writestr(zipfile.ZipInfo(name, date_time=(1980, 1, 1, 0, 0, 0)), data)
+    tmp.replace(path)
@@ -0,0 +1 @@
+"""spec-coding 子命令：每个模块提供 add_arguments(parser) 与 run(args)，在 cli.COMMANDS 中登记后按需导入。"""
@@ -0,0 +1,444 @@
+"""archive 子命令：归档已完成的 Spec 与 Plan-Auto 产物，并合并到 Source of Truth。
+
+取代 scripts/archive.sh：每个 spec.md 与 feature_list.json 只读取、解析一次（含 delta 提取），
+所有 Spec 的可归档判定并发执行；归档先生成完整计划（--dry-run 到此为止），再作为一个批次
+执行——各 Spec 的 delta 按领域在内存中合并进结构化 Source of Truth（见 spec_cli/sot.py）、
+每个领域文件只写一次，Spec 目录整体移动，任一步失败时回滚已完成的移动。
+"""
+
+import argparse
+import json
+import os
+import re
+import shutil
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date
+from pathlib import Path
+
+from spec_cli.sot import Delta, SotStore, StagedWrite, parse_delta
+
+SPEC_ACTIVE = Path("docs/spec/active")
+SPEC_ARCHIVE = Path("docs/spec/archive")
+SPEC_SOT = Path("docs/spec/specs")
+PLAN_AUTO = Path("docs/plan_auto")
+PLAN_AUTO_ARCHIVE = PLAN_AUTO / "archive"
+
+# 可归档的 Spec 状态
+ARCHIVABLE_STATUS = "implementation"
+
+# 与 archive.sh 一致：取文件中第一行 `status:` / `domain:` 的第一个词
+_STATUS = re.compile(r"^status:[ \t]*(\S*)", re.MULTILINE)
+_DOMAIN = re.compile(r"^domain:[ \t]*(\S*)", re.MULTILINE)
+_TASK = re.compile(r"^[ \t]*[-*+][ \t]+\[([ xX])\]", re.MULTILINE)
+_PENDING = "[pending]"
+
+# Plan-Auto 中按名称归档的文件与按模式归档的文件；mcp_setup.md 保留
+_PLAN_AUTO_FILES = ("scope.md", "feature_list.json", "claude-progress.txt")
+_PLAN_AUTO_PATTERNS = ("*_feature_list.json", "*_progress.txt", "*.md")
+_PLAN_AUTO_KEEP = frozenset({"mcp_setup.md"})
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """注册 archive 子命令参数。"""
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--check",
+        "--status",
+        dest="mode",
+        action="store_const",
+        const="check",
+        help="检查可归档项，不做修改（默认）",
+    )
+    mode.add_argument(
+        "--auto",
+        dest="mode",
+        action="store_const",
+        const="auto",
+        help="归档所有可归档的 Spec，以及 features 全部通过的 Plan-Auto",
+    )
+    mode.add_argument(
+        "--spec",
+        dest="specs",
+        action="append",
+        metavar="NAME",
+        help="归档指定 Spec（不检查状态与任务），可重复给出",
+    )
+    mode.add_argument(
+        "--plan-auto",
+        "--harnesses",
+        dest="mode",
+        action="store_const",
+        const="plan-auto",
+        help="归档 Plan-Auto（不检查 features 是否通过）",
+    )
+    mode.add_argument(
+        "--all",
+        dest="mode",
+        action="store_const",
+        const="all",
+        help="归档所有可归档的 Spec 与 Plan-Auto",
+    )
+    parser.add_argument("--dry-run", action="store_true", help="只输出归档计划，不移动、不写入")
+    parser.add_argument("--json", action="store_true", help="以 JSON 输出检查结果、计划与执行结果")
+    parser.add_argument("--root", default=None, help="项目根目录，默认当前目录")
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=None,
+        help="并发解析 Spec 的线程数，默认自动（min(32, CPU 数 + 4)）",
+    )
+
+
+@dataclass(slots=True)
+class SpecState:
+    """一个活跃 Spec 的解析结果；delta 在解析时一并提取，合并 Source of Truth 时不再读盘。"""
+
+    name: str
+    path: Path
+    spec_file: Path
+    status: str | None = None
+    domain: str | None = None
+    tasks_total: int = 0
+    tasks_done: int = 0
+    pending: int = 0
+    delta: Delta | None = None
+    error: str | None = None
+
+    @property
+    def reason(self) -> str | None:
+        """不可归档的原因，None 表示可归档。"""
+        if self.error is not None:
+            return self.error
+        if self.status != ARCHIVABLE_STATUS:
+            return f"状态为 {self.status or '未标注'}，需为 {ARCHIVABLE_STATUS}"
+        if self.pending:
+            return f"还有 {self.pending} 项未完成任务"
+        return None
+
+    def to_json(self) -> dict[str, object]:
+        return {
+            "name": self.name,
+            "path": self.path.as_posix(),
+            "status": self.status,
+            "domain": self.domain,
+            "tasks_total": self.tasks_total,
+            "tasks_done": self.tasks_done,
+            "pending": self.pending,
+            "eligible": self.reason is None,
+            "reason": self.reason,
+        }
+
+
+@dataclass(slots=True)
+class PlanAutoState:
+    """docs/plan_auto 的解析结果；feature_list.json 只读取一次。"""
+
+    exists: bool = False
+    project: str = "unknown"
+    features_total: int = 0
+    features_passed: int = 0
+    files: list[Path] = field(default_factory=list)
+    error: str | None = None
+
+    @property
+    def complete(self) -> bool:
+        return self.exists and self.error is None and self.features_passed == self.features_total
+
+    def to_json(self) -> dict[str, object]:
+        return {
+            "exists": self.exists,
+            "project": self.project,
+            "features_total": self.features_total,
+            "features_passed": self.features_passed,
+            "complete": self.complete,
+            "files": [p.as_posix() for p in self.files],
+            "error": self.error,
+        }
+
+
+@dataclass(slots=True)
+class Plan:
+    """一次归档的全部动作：移动 (src, dst) 与 Source of Truth 合并（领域 -> 按顺序合并的 Spec）。"""
+
+    date: str
+    moves: list[tuple[Path, Path]] = field(default_factory=list)
+    merges: dict[str, list[SpecState]] = field(default_factory=dict)
+    errors: list[str] = field(default_factory=list)
+
+    def to_json(self, root: Path) -> dict[str, object]:
+        store = SotStore(root / SPEC_SOT)
+        return {
+            "date": self.date,
+            "moves": [{"src": _rel(src, root), "dst": _rel(dst, root)} for src, dst in self.moves],
+            "merges": [
+                {
+                    "domain": domain,
+                    "target": _rel(store.path(domain), root),
+                    "specs": [
+                        {
+                            "name": spec.name,
+                            "upserts": [section.id for section in spec.delta.upserts] if spec.delta else [],
+                            "removed": list(spec.delta.removed) if spec.delta else [],
+                        }
+                        for spec in specs
+                    ],
+                }
+                for domain, specs in self.merges.items()
+            ],
+            "errors": self.errors,
+        }
+
+
+def _rel(path: Path, root: Path) -> str:
+    try:
+        return path.relative_to(root).as_posix()
+    except ValueError:
+        return path.as_posix()
+
+
+def _default_jobs() -> int:
+    return min(32, (os.cpu_count() or 1) + 4)
+
+
+def _parse_spec(root: Path, name: str, path: Path, spec_file: Path) -> SpecState:
+    """读取并解析一个 Spec：状态、领域与任务勾选情况。"""
+    state = SpecState(name=name, path=path.relative_to(root), spec_file=spec_file)
+    try:
+        text = spec_file.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError) as e:
+        state.error = f"无法读取: {e}"
+        return state
+    state.delta = parse_delta(text, name)
+    status = _STATUS.search(text)
+    state.status = status.group(1) or None if status else None
+    domain = _DOMAIN.search(text)
+    state.domain = domain.group(1) or None if domain else None
+    for mark in _TASK.findall(text):
+        state.tasks_total += 1
+        if mark != " ":
+            state.tasks_done += 1
+    state.pending = state.tasks_total - state.tasks_done + text.count(_PENDING)
+    return state
+
+
+def scan_specs(root: Path, jobs: int | None = None) -> list[SpecState]:
+    """并发解析 active/ 下的所有 Spec（`<name>/spec.md` 或 `<name>.md`），按名称排序。"""
+    active = root / SPEC_ACTIVE
+    try:
+        entries = sorted(os.scandir(active), key=lambda e: e.name)
+    except OSError:
+        return []
+    found: list[tuple[str, Path, Path]] = []
+    for entry in entries:
+        path = Path(entry.path)
+        if entry.is_dir():
+            spec_file = path / "spec.md"
+            if spec_file.is_file():
+                found.append((entry.name, path, spec_file))
+        elif entry.name.endswith(".md") and entry.name != "README.md" and entry.is_file():
+            found.append((entry.name[: -len(".md")], path, path))
+    if not found:
+        return []
+    with ThreadPoolExecutor(max_workers=min(jobs or _default_jobs(), len(found))) as pool:
+        return list(pool.map(lambda item: _parse_spec(root, *item), found))
+
+
+def scan_plan_auto(root: Path) -> PlanAutoState:
+    """解析 feature_list.json 并列出 Plan-Auto 中待归档的文件。"""
+    plan_dir = root / PLAN_AUTO
+    state = PlanAutoState()
+    feature_list = plan_dir / "feature_list.json"
+    if feature_list.is_file():
+        state.exists = True
+        try:
+            data = json.loads(feature_list.read_text(encoding="utf-8"))
+            features = data.get("features", []) if isinstance(data, dict) else []
+            state.project = str(data.get("project") or "unknown") if isinstance(data, dict) else "unknown"
+            state.features_total = len(features)
+            state.features_passed = sum(1 for f in features if isinstance(f, dict) and f.get("passes", False))
+        except (OSError, UnicodeDecodeError, json.JSONDecodeError) as e:
+            state.error = f"无法解析 feature_list.json: {e}"
+
+    files: dict[str, Path] = {}
+    for name in _PLAN_AUTO_FILES:
+        if (plan_dir / name).is_file():
+            files[name] = plan_dir / name
+    for pattern in _PLAN_AUTO_PATTERNS:
+        for path in sorted(plan_dir.glob(pattern)):
+            if path.is_file() and path.name not in _PLAN_AUTO_KEEP:
+                files.setdefault(path.name, path)
+    state.files = list(files.values())
+    return state
+
+
+def _archive_target(root: Path, spec: SpecState, day: str) -> Path:
+    # 目录形式整体移动；单文件形式 active/<name>.md 归档为 archive/<date>_<name>.md
+    suffix = "" if spec.spec_file != root / spec.path else ".md"
+    return root / SPEC_ARCHIVE / f"{day}_{spec.name}{suffix}"
+
+
+def build_plan(
+    root: Path,
+    specs: list[SpecState],
+    plan_auto: PlanAutoState,
+    mode: str,
+    names: list[str] | None,
+    day: str,
+) -> Plan:
+    """根据模式选出要归档的 Spec 与 Plan-Auto，生成移动与合并动作。"""
+    plan = Plan(date=day)
+    by_name = {spec.name: spec for spec in specs}
+    if names:
+        selected = []
+        for name in dict.fromkeys(names):
+            spec = by_name.get(name)
+            if spec is None:
+                plan.errors.append(f"Spec not found: {name}")
+            elif spec.error is not None:
+                plan.errors.append(f"{name}: {spec.error}")
+            else:
+                selected.append(spec)
+    elif mode in ("auto", "all"):
+        selected = [spec for spec in specs if spec.reason is None]
+    else:
+        selected = []
+
+    for spec in selected:
+        dst = _archive_target(root, spec, day)
+        if dst.exists():
+            plan.errors.append(f"{spec.name}: 归档目标已存在: {_rel(dst, root)}")
+            continue
+        plan.moves.append((root / spec.path, dst))
+        plan.merges.setdefault(spec.domain or "general", []).append(spec)
+
+    archive_plan_auto = mode == "plan-auto" or mode == "all" or (mode == "auto" and plan_auto.complete)
+    if archive_plan_auto and plan_auto.files:
+        target_dir = root / PLAN_AUTO_ARCHIVE / f"{day}_{plan_auto.project}"
+        for src in plan_auto.files:
+            dst = target_dir / src.name
+            if dst.exists():
+                plan.errors.append(f"Plan-Auto: 归档目标已存在: {_rel(dst, root)}")
+                continue
+            plan.moves.append((src, dst))
+    return plan
+
+
+def apply_plan(plan: Plan, store: SotStore) -> None:
+    """执行计划：先把合并后的各领域文件写入临时文件，再移动，最后原子替换领域文件并更新索引。
+
+    任一步骤失败（含替换领域文件）时，恢复已替换的领域文件、删除临时文件，并按逆序撤回已完成的移动，
+    工作区保持执行前的状态。
+    """
+    staged: list[StagedWrite] = []
+    done: list[tuple[Path, Path]] = []
+    try:
+        for domain, specs in plan.merges.items():
+            doc = store.load(domain)
+            for spec in specs:
+                if spec.delta is not None:
+                    doc.apply(spec.delta, updated=plan.date, source=spec.name)
+            staged.append(store.stage(domain, doc))
+        for src, dst in plan.moves:
+            dst.parent.mkdir(parents=True, exist_ok=True)
+            shutil.move(src, dst)
+            done.append((src, dst))
+        for write in staged:
+            write.commit(keep_backup=True)
+    except BaseException:
+        for write in staged:
+            write.revert()
+        for src, dst in reversed(done):
+            shutil.move(dst, src)
+        raise
+    for write in staged:
+        write.drop_backup()
+
+
+def _print_status(root: Path, specs: list[SpecState], plan_auto: PlanAutoState) -> None:
+    eligible = [spec.name for spec in specs if spec.reason is None]
+    print("归档状态")
+    print()
+    if eligible:
+        print(f"可归档的 Spec: {' '.join(eligible)}")
+    else:
+        print("没有可归档的 Spec")
+    for spec in specs:
+        if spec.reason is not None:
+            print(f"  - {spec.name}: {spec.reason}")
+    if plan_auto.complete:
+        print(f"可归档的 Plan-Auto: {plan_auto.project}")
+    elif plan_auto.error is not None:
+        print(f"Plan-Auto: {plan_auto.error}")
+    elif plan_auto.exists:
+        print(f"没有可归档的 Plan-Auto（features 通过 {plan_auto.features_passed}/{plan_auto.features_total}）")
+    else:
+        print("没有可归档的 Plan-Auto")
+    print()
+    print("归档目录:")
+    print(f"  Spec:      {root / SPEC_ARCHIVE}")
+    print(f"  Plan-Auto: {root / PLAN_AUTO_ARCHIVE}")
+
+
+def _print_plan(root: Path, plan: Plan, dry_run: bool) -> None:
+    if not plan.moves:
+        print("没有需要归档的内容。")
+    for src, dst in plan.moves:
+        print(f"  {'将移动' if dry_run else '已移动'}: {_rel(src, root)} -> {_rel(dst, root)}")
+    store = SotStore(root / SPEC_SOT)
+    for domain, specs in plan.merges.items():
+        names = ", ".join(spec.name for spec in specs)
+        print(f"  {'将合并' if dry_run else '已合并'}: {names} -> {_rel(store.path(domain), root)}")
+    for error in plan.errors:
+        print(f"  ! {error}", file=sys.stderr)
+
+
+def run(args: argparse.Namespace) -> None:
+    """执行 archive 子命令。"""
+    root = Path(args.root or os.getcwd()).resolve()
+    mode = "spec" if args.specs else (args.mode or "check")
+    if not (root / "docs").is_dir():
+        print(f"错误：未找到 docs/ 目录，请在项目根目录执行或使用 --root: {root}", file=sys.stderr)
+        sys.exit(1)
+
+    specs = scan_specs(root, args.jobs)
+    plan_auto = scan_plan_auto(root)
+    plan = build_plan(root, specs, plan_auto, mode, args.specs, date.today().isoformat())
+
+    applied = False
+    apply_error: str | None = None
+    if mode != "check" and not args.dry_run and plan.moves:
+        try:
+            apply_plan(plan, SotStore(root / SPEC_SOT))
+            applied = True
+        except (OSError, UnicodeDecodeError) as e:
+            # UnicodeDecodeError：领域文件不是合法的 UTF-8（读取发生在任何改动之前）
+            apply_error = f"归档失败，已回滚: {e}"
+
+    if args.json:
+        result = {
+            "root": root.as_posix(),
+            "mode": mode,
+            "dry_run": args.dry_run,
+            "specs": [spec.to_json() for spec in specs],
+            "plan_auto": plan_auto.to_json(),
+            "plan": plan.to_json(root),
+            "applied": applied,
+            "error": apply_error,
+        }
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+    elif mode == "check":
+        _print_status(root, specs, plan_auto)
+    else:
+        print(f"归档计划（{plan.date}{'，dry-run' if args.dry_run else ''}）:")
+        _print_plan(root, plan, dry_run=not applied)
+        if apply_error is not None:
+            print(f"错误：{apply_error}", file=sys.stderr)
+        elif applied:
+            print()
+            print(f"归档完成: {len(plan.moves)} 项移动，{len(plan.merges)} 个 Source of Truth 文件更新")
+
+    if plan.errors or apply_error is not None:
+        sys.exit(1)
@@ -0,0 +1,567 @@
+"""check 子命令：校验 docs/spec 下的 Spec 与 Plan-Auto 的 feature_list.json。
+
+逐文件检查（文件头字段、状态与所在目录是否相符、任务勾选框的格式与完成情况、命名规范、
+Source of Truth 小节 ID）在进程池中并行执行，结果按「相对路径 + 内容 sha256」缓存在项目根的
+.spec-check-cache.json：再次运行时内容未变的文件直接复用上次结果，pre-commit 中每次提交只
+重新检查改动过的文件。跨文件检查（active 与 archive 中的同名 Spec、feature_list.json 的结构、
+引用的 Spec 及其状态）依赖全部文件的摘要，每次在主进程中重新计算，开销很小。
+
+文件头的解析与后端 spec_index 一致：开头的 `key: value` 行（可用 `---` 包围），遇到第一行
+非字段即停止，正文中的 `status:` 不会被误认；代码块中的内容不参与任务与标题检查。
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from spec_cli.cli import VERSION
+from spec_cli.sot import is_legacy, split_heading
+
+SPEC_ROOT = Path("docs/spec")
+PLAN_AUTO = Path("docs/plan_auto")
+LOCATIONS = ("active", "archive", "specs")
+CACHE_FILE = ".spec-check-cache.json"
+CACHE_FORMAT = 1
+
+# 检查规则变化时递增，旧缓存整体失效（框架版本变化同样失效）
+RULES_VERSION = 1
+
+ERROR = "error"
+WARNING = "warning"
+_SEVERITY_LABEL = {ERROR: "错误", WARNING: "警告"}
+
+# 状态机：proposal → implementation → 归档；archive 中保留归档前的状态
+KNOWN_FIELDS = ("status", "domain")
+ACTIVE_STATUSES = ("proposal", "implementation")
+ARCHIVE_STATUSES = ("implementation", "archived")
+
+# 待检查文件少于此数时不启动进程池，直接在当前进程中检查：单个文件约 0.2 ms（8 KiB），
+# 几十个文件的检查耗时还抵不上进程池的启动开销（见 bench/check_bench.py）
+_POOL_MIN_FILES = 64
+
+_FIELD = re.compile(r"^([A-Za-z_][\w-]*):\s*(.*?)\s*$")
+_FENCE = re.compile(r"^[ \t]{0,3}(`{3,}|~{3,})")
+_HEADING2 = re.compile(r"^##[ \t]+(.*?)(?:[ \t]+#+)?[ \t]*$")
+_SOT_META = re.compile(r'^<!--[ \t]*sot:req\b.*?\bid="([^"]*)"')
+# 与 archive 子命令一致：文件中第一行 `status:` 的第一个词
+_ARCHIVE_STATUS = re.compile(r"^status:[ \t]*(\S*)", re.MULTILINE)
+_TASK = re.compile(r"^[ \t]*[-*+][ \t]+\[([ xX])\]")
+# 看起来像勾选框但不会被识别的写法：`-[x]`、`- []`、`- [ x ]`、`- [*]`、`1. [ ]`、缺少列表符号
+_TASK_LIKE = re.compile(r"^[ \t]*(?:(?:[-*+]|\d+[.)])[ \t]*)?\[([ \txX*✓✔✗-]*)\](?![(:\[])")
+_PENDING = "[pending]"
+_ARCHIVE_NAME = re.compile(r"^(\d{4}-\d{2}-\d{2})_(.+)$")
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """注册 check 子命令参数。"""
+    parser.add_argument("--root", default=None, help="项目根目录，默认当前目录")
+    parser.add_argument("--json", action="store_true", help="以 JSON 输出问题列表与各 Spec 摘要")
+    parser.add_argument("--strict", action="store_true", help="有警告时也以非零状态退出")
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=None,
+        help="检查进程数，默认 CPU 数；1 表示在当前进程中检查",
+    )
+    parser.add_argument("--cache", default=None, help=f"结果缓存文件，默认 <root>/{CACHE_FILE}")
+    parser.add_argument("--no-cache", action="store_true", help="不读取也不写入缓存，全部重新检查")
+
+
+@dataclass(slots=True)
+class Issue:
+    """一条检查结果；line 为 1 起的行号，整文件问题为 None。"""
+
+    path: str
+    line: int | None
+    severity: str
+    code: str
+    message: str
+
+    def format(self) -> str:
+        where = self.path if self.line is None else f"{self.path}:{self.line}"
+        return f"{where}: {_SEVERITY_LABEL[self.severity]} [{self.code}] {self.message}"
+
+
+@dataclass(slots=True)
+class FileResult:
+    """一个 Spec 文件的检查结果与摘要；只依赖路径与内容，可按内容哈希缓存。"""
+
+    path: str  # 相对项目根，如 docs/spec/active/user_login/spec.md
+    location: str
+    name: str  # 目录名或去掉 .md 的文件名
+    status: str | None = None
+    domain: str | None = None
+    tasks_total: int = 0
+    tasks_done: int = 0
+    pending: int = 0
+    issues: list[Issue] = field(default_factory=list)
+
+    @property
+    def spec_id(self) -> str:
+        """与后端一致的 Spec 标识：`<location>/<name>`。"""
+        return f"{self.location}/{self.name}"
+
+    @property
+    def base_name(self) -> str:
+        """归档目录去掉日期前缀后的名称。"""
+        match = _ARCHIVE_NAME.match(self.name) if self.location == "archive" else None
+        return match.group(2) if match else self.name
+
+    def add(self, line: int | None, severity: str, code: str, message: str) -> None:
+        self.issues.append(Issue(self.path, line, severity, code, message))
+
+    def to_json(self) -> dict[str, object]:
+        return {
+            "path": self.path,
+            "location": self.location,
+            "name": self.name,
+            "status": self.status,
+            "domain": self.domain,
+            "tasks_total": self.tasks_total,
+            "tasks_done": self.tasks_done,
+            "pending": self.pending,
+            "issues": [asdict(issue) for issue in self.issues],
+        }
+
+    @classmethod
+    def from_json(cls, data: dict) -> "FileResult":
+        result = cls(**{key: value for key, value in data.items() if key != "issues"})
+        result.issues = [Issue(**issue) for issue in data["issues"]]
+        return result
+
+
+def _lines(text: str) -> list[tuple[int, str, bool]]:
+    """(行号, 行内容, 是否位于代码块内)；代码块的起止行本身也算在块内。"""
+    lines: list[tuple[int, str, bool]] = []
+    fence: str | None = None
+    for n, line in enumerate(text.splitlines(), start=1):
+        opening = _FENCE.match(line)
+        if fence is not None:
+            lines.append((n, line, True))
+            if opening and opening.group(1)[0] == fence[0] and len(opening.group(1)) >= len(fence):
+                fence = None
+        elif opening:
+            fence = opening.group(1)
+            lines.append((n, line, True))
+        else:
+            lines.append((n, line, False))
+    return lines
+
+
+def _front_matter(result: FileResult, lines: list[tuple[int, str, bool]]) -> dict[str, tuple[int, str]]:
+    """解析文件头字段：字段名 -> (行号, 值)，重复字段取第一个并记录警告。"""
+    fields: dict[str, tuple[int, str]] = {}
+    i = 0
+    while i < len(lines) and not lines[i][1].strip():
+        i += 1
+    fenced = i < len(lines) and lines[i][1].strip() == "---"
+    if fenced:
+        i += 1
+    for n, line, _ in lines[i:]:
+        stripped = line.strip()
+        if fenced and stripped == "---":
+            break
+        match = _FIELD.match(stripped)
+        if match is None:
+            if fenced and not stripped:
+                continue
+            break
+        key = match.group(1).lower()
+        if key in fields:
+            result.add(n, WARNING, "front-matter", f"重复的字段 {key}，以第 {fields[key][0]} 行为准")
+            continue
+        fields[key] = (n, match.group(2))
+        if key not in KNOWN_FIELDS:
+            result.add(n, WARNING, "front-matter", f"未知字段 {key}（支持: {'、'.join(KNOWN_FIELDS)}）")
+    return fields
+
+
+def _check_status(result: FileResult, text: str, fields: dict[str, tuple[int, str]]) -> None:
+    line, status = fields.get("status", (None, ""))
+    result.status = status or None
+
+    # archive 子命令取全文第一行 status:，与文件头不一致时两边会按不同状态处理
+    legacy = _ARCHIVE_STATUS.search(text)
+    legacy_status = legacy.group(1) or None if legacy else None
+    if legacy is not None and legacy_status != (status.split()[0] if status else None):
+        legacy_line = text.count("\n", 0, legacy.start()) + 1
+        result.add(
+            legacy_line,
+            WARNING,
+            "status",
+            f"归档按此行判定状态为 {legacy_status or '空'}，而文件头状态为 {status or '未标注'}",
+        )
+
+    if result.location == "active":
+        if not status:
+            result.add(None, ERROR, "status", f"缺少文件头 status 行（{' | '.join(ACTIVE_STATUSES)}）")
+        elif status == "archived":
+            result.add(line, ERROR, "status", "状态为 archived 的 Spec 仍在 active/，应通过 spec-coding archive 归档")
+        elif status not in ACTIVE_STATUSES:
+            result.add(line, ERROR, "status", f"未知状态 {status}（可选: {'、'.join(ACTIVE_STATUSES)}）")
+        elif status == "proposal" and result.tasks_done:
+            result.add(
+                line,
+                WARNING,
+                "transition",
+                f"proposal 阶段已勾选 {result.tasks_done} 项任务，开始实现前应改为 implementation",
+            )
+    elif result.location == "archive":
+        if status == "proposal":
+            result.add(line, WARNING, "transition", "以 proposal 状态归档，未经过 implementation")
+        elif status and status not in ARCHIVE_STATUSES:
+            result.add(line, ERROR, "status", f"未知状态 {status}（可选: {'、'.join(ARCHIVE_STATUSES)}）")
+        if result.pending:
+            result.add(None, WARNING, "tasks", f"已归档，但还有 {result.pending} 项未完成任务")
+
+
+def _check_tasks(result: FileResult, lines: list[tuple[int, str, bool]]) -> None:
+    for n, line, in_code in lines:
+        if in_code:
+            continue
+        task = _TASK.match(line)
+        if task is not None:
+            result.tasks_total += 1
+            if task.group(1) != " ":
+                result.tasks_done += 1
+        elif _TASK_LIKE.match(line):
+            result.add(n, ERROR, "task", f"无法识别的任务勾选框，应写作 `- [ ]` 或 `- [x]`: {line.strip()}")
+        result.pending += line.count(_PENDING)
+    result.pending += result.tasks_total - result.tasks_done
+
+
+def _check_names(result: FileResult, fields: dict[str, tuple[int, str]]) -> None:
+    name = result.base_name
+    if result.location == "archive" and _ARCHIVE_NAME.match(result.name) is None:
+        result.add(None, WARNING, "naming", f"归档名称应为 YYYY-MM-DD_<名称>: {result.name}")
+    if "-" in name:
+        result.add(None, WARNING, "naming", f"名称使用下划线，不用连字符: {name}")
+    line, domain = fields.get("domain", (None, ""))
+    result.domain = domain or None
+    if result.domain is None and result.location == "specs" and result.path.endswith("/spec.md"):
+        # specs/<domain>/spec.md
+        result.domain = result.name
+    if domain and ("-" in domain or " " in domain):
+        result.add(line, WARNING, "naming", f"领域名使用下划线，不用连字符或空格: {domain}")
+
+
+def _check_sot(result: FileResult, text: str, lines: list[tuple[int, str, bool]]) -> None:
+    """Source of Truth 文件：旧格式提示 compact；需求 ID 重复时合并会互相覆盖。"""
+    if is_legacy(text):
+        result.add(None, WARNING, "sot", "旧的追加式格式，建议执行 spec-coding sot compact")
+        return
+    seen: dict[str, int] = {}
+    for i, (n, line, in_code) in enumerate(lines):
+        heading = None if in_code else _HEADING2.match(line)
+        if heading is None:
+            continue
+        req_id = split_heading(heading.group(1))[0]
+        following = next((other for _, other, _ in lines[i + 1 :] if other.strip()), "")
+        meta = _SOT_META.match(following.strip())
+        if meta is not None:
+            req_id = meta.group(1)
+        if req_id in seen:
+            result.add(n, ERROR, "sot", f"需求 ID {req_id} 与第 {seen[req_id]} 行重复，合并时后者会覆盖前者")
+        else:
+            seen[req_id] = n
+
+
+def check_file(path: str, location: str, name: str, data: bytes) -> FileResult:
+    """检查一个 Spec 文件；只依赖参数，可在工作进程中执行。"""
+    result = FileResult(path=path, location=location, name=name)
+    try:
+        text = data.decode("utf-8")
+    except UnicodeDecodeError as e:
+        result.add(None, ERROR, "encoding", f"不是合法的 UTF-8: {e}")
+        return result
+    lines = _lines(text)
+    fields = _front_matter(result, lines)
+    _check_tasks(result, lines)
+    if location == "specs":
+        _check_sot(result, text, lines)
+        result.status = fields.get("status", (None, ""))[1] or None
+    else:
+        _check_status(result, text, fields)
+    _check_names(result, fields)
+    return result
+
+
+def _check_item(item: tuple[str, str, str, bytes]) -> FileResult:
+    return check_file(*item)
+
+
+def discover(root: Path) -> list[tuple[str, str, str, Path]]:
+    """列出所有 Spec 文件：(相对路径, 位置, 名称, 绝对路径)，与后端 spec_index 的规则一致。
+
+    一个 Spec 是 `<location>/<name>/spec.md` 或顶层的 `<location>/<name>.md`（README.md 除外）。
+    """
+    found: list[tuple[str, str, str, Path]] = []
+    for location in LOCATIONS:
+        base = root / SPEC_ROOT / location
+        try:
+            entries = sorted(os.scandir(base), key=lambda e: e.name)
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.is_dir():
+                spec = Path(entry.path) / "spec.md"
+                if spec.is_file():
+                    rel = (SPEC_ROOT / location / entry.name / "spec.md").as_posix()
+                    found.append((rel, location, entry.name, spec))
+            elif entry.name.endswith(".md") and entry.name != "README.md" and entry.is_file():
+                rel = (SPEC_ROOT / location / entry.name).as_posix()
+                found.append((rel, location, entry.name[: -len(".md")], Path(entry.path)))
+    return found
+
+
+class CheckCache:
+    """按相对路径记录内容 sha256 与检查结果；规则或框架版本变化时整体失效。"""
+
+    def __init__(self, path: Path | None) -> None:
+        self.path = path
+        self._rules = f"{VERSION}/{RULES_VERSION}"
+        self._entries: dict[str, dict] = {}
+        self._used: dict[str, dict] = {}
+        self._dirty = False
+        if path is None:
+            return
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+            return
+        if isinstance(data, dict) and data.get("format") == CACHE_FORMAT and data.get("rules") == self._rules:
+            files = data.get("files")
+            self._entries = files if isinstance(files, dict) else {}
+
+    def get(self, rel: str, digest: str) -> FileResult | None:
+        entry = self._entries.get(rel)
+        if not isinstance(entry, dict) or entry.get("sha256") != digest:
+            return None
+        try:
+            result = FileResult.from_json(entry["result"])
+        except (KeyError, TypeError):
+            return None
+        self._used[rel] = entry
+        return result
+
+    def put(self, rel: str, digest: str, result: FileResult) -> None:
+        self._used[rel] = {"sha256": digest, "result": result.to_json()}
+        self._dirty = True
+
+    def save(self) -> None:
+        """只保留本次出现的文件；有变化（含文件被删除）时临时文件 + 原子替换写入。"""
+        if self.path is None or not (self._dirty or self._used.keys() != self._entries.keys()):
+            return
+        data = {"format": CACHE_FORMAT, "rules": self._rules, "files": self._used}
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        try:
+            tmp.write_text(json.dumps(data, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError:
+            # 缓存只是加速，写不了不影响检查结果
+            tmp.unlink(missing_ok=True)
+
+
+def check_specs(root: Path, cache: CheckCache, jobs: int | None = None) -> tuple[list[FileResult], int]:
+    """检查所有 Spec 文件，返回 (按路径排序的结果, 缓存命中数)。"""
+    results: dict[str, FileResult] = {}
+    todo: list[tuple[str, str, str, bytes]] = []
+    digests: dict[str, str] = {}
+    hits = 0
+    for rel, location, name, path in discover(root):
+        try:
+            data = path.read_bytes()
+        except OSError as e:
+            results[rel] = FileResult(path=rel, location=location, name=name)
+            results[rel].add(None, ERROR, "read", f"无法读取: {e}")
+            continue
+        digest = hashlib.sha256(data).hexdigest()
+        cached = cache.get(rel, digest)
+        if cached is not None:
+            results[rel] = cached
+            hits += 1
+        else:
+            digests[rel] = digest
+            todo.append((rel, location, name, data))
+
+    workers = max(1, min(jobs or os.cpu_count() or 1, len(todo)))
+    if workers == 1 or len(todo) < _POOL_MIN_FILES:
+        checked = [_check_item(item) for item in todo]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            checked = list(pool.map(_check_item, todo, chunksize=max(1, len(todo) // (workers * 4))))
+    for result in checked:
+        results[result.path] = result
+        cache.put(result.path, digests[result.path], result)
+    return [results[rel] for rel in sorted(results)], hits
+
+
+def feature_lists(root: Path) -> list[Path]:
+    """docs/plan_auto 下的 feature_list.json 与 *_feature_list.json（不含 archive/）。"""
+    plan_dir = root / PLAN_AUTO
+    paths = [plan_dir / "feature_list.json", *sorted(plan_dir.glob("*_feature_list.json"))]
+    return [path for path in paths if path.is_file()]
+
+
+def _spec_refs(specs: list[FileResult]) -> dict[str, FileResult]:
+    """feature_list.json 的 spec 字段可写路径（相对 docs/spec 或项目根）、`<location>/<name>` 或名称。
+
+    同名时 active 优先；已归档的 Spec 也可按去掉日期前缀的名称找到。
+    """
+    refs: dict[str, FileResult] = {}
+    prefix = f"{SPEC_ROOT.as_posix()}/"
+    for spec in sorted(specs, key=lambda s: LOCATIONS.index(s.location), reverse=True):
+        for key in (spec.path, spec.path.removeprefix(prefix), spec.spec_id, spec.name, spec.base_name):
+            refs[key] = spec
+    return refs
+
+
+def _check_feature_list(root: Path, path: Path, refs: dict[str, FileResult]) -> list[Issue]:
+    rel = path.relative_to(root).as_posix()
+    issues: list[Issue] = []
+
+    def add(line: int | None, severity: str, code: str, message: str) -> None:
+        issues.append(Issue(rel, line, severity, code, message))
+
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, UnicodeDecodeError) as e:
+        add(None, ERROR, "read", f"无法读取: {e}")
+        return issues
+    except json.JSONDecodeError as e:
+        add(e.lineno, ERROR, "features", f"不是合法的 JSON: {e.msg}")
+        return issues
+    if not isinstance(data, dict):
+        add(None, ERROR, "features", "顶层应为对象（project、spec、features）")
+        return issues
+
+    project = data.get("project")
+    if not isinstance(project, str) or not project.strip():
+        add(None, ERROR, "features", "缺少 project 或不是非空字符串")
+    features = data.get("features")
+    if not isinstance(features, list):
+        add(None, ERROR, "features", "features 应为数组")
+        return issues
+
+    passed = 0
+    descriptions: dict[str, int] = {}
+    for i, feature in enumerate(features):
+        where = f"features[{i}]"
+        if not isinstance(feature, dict):
+            add(None, ERROR, "features", f"{where} 应为对象")
+            continue
+        description = feature.get("description")
+        if not isinstance(description, str) or not description.strip():
+            add(None, ERROR, "features", f"{where}.description 应为非空字符串")
+        elif description in descriptions:
+            add(None, WARNING, "features", f"{where} 与 features[{descriptions[description]}] 的 description 重复")
+        else:
+            descriptions[description] = i
+        steps = feature.get("steps", [])
+        if not isinstance(steps, list) or not all(isinstance(step, str) for step in steps):
+            add(None, ERROR, "features", f"{where}.steps 应为字符串数组")
+        passes = feature.get("passes", False)
+        if not isinstance(passes, bool):
+            add(None, ERROR, "features", f"{where}.passes 应为 true 或 false，而不是 {json.dumps(passes, ensure_ascii=False)}")
+        elif passes:
+            passed += 1
+        category = feature.get("category")
+        if category is not None and not isinstance(category, str):
+            add(None, WARNING, "features", f"{where}.category 应为字符串")
+
+    ref = data.get("spec")
+    if ref is None:
+        return issues
+    if not isinstance(ref, str) or not ref.strip():
+        add(None, ERROR, "features", "spec 应为 Spec 名称或路径")
+        return issues
+    spec = refs.get(ref.strip().strip("/"))
+    if spec is None:
+        add(None, ERROR, "features", f"引用的 Spec 不存在: {ref}")
+        return issues
+
+    total = len(features)
+    progress = f"features 通过 {passed}/{total}"
+    if spec.location == "active" and spec.status == "proposal" and passed:
+        add(None, WARNING, "transition", f"{spec.path} 仍为 proposal，但 {progress}")
+    elif spec.location == "archive" and passed < total:
+        add(None, WARNING, "transition", f"{spec.path} 已归档，但 {progress}")
+    elif spec.location == "active" and spec.status == "implementation":
+        if total and passed == total and spec.pending:
+            add(None, WARNING, "transition", f"features 已全部通过，但 {spec.path} 还有 {spec.pending} 项未完成任务")
+        elif spec.tasks_total and not spec.pending and passed < total:
+            add(None, WARNING, "transition", f"{spec.path} 的任务已全部完成、可被归档，但 {progress}")
+    return issues
+
+
+def cross_check(root: Path, specs: list[FileResult], lists: list[Path]) -> list[Issue]:
+    """依赖多个文件的检查：active 中的重名与已归档同名 Spec，以及 feature_list.json。"""
+    issues: list[Issue] = []
+    active: dict[str, FileResult] = {}
+    archived: dict[str, list[FileResult]] = {}
+    for spec in specs:
+        if spec.location == "active":
+            other = active.get(spec.name)
+            if other is not None:
+                issues.append(Issue(spec.path, None, ERROR, "duplicate", f"与 {other.path} 同名，归档时只会处理其中一个"))
+            else:
+                active[spec.name] = spec
+        elif spec.location == "archive":
+            archived.setdefault(spec.base_name, []).append(spec)
+    for name, spec in active.items():
+        for old in archived.get(name, []):
+            issues.append(Issue(spec.path, None, WARNING, "duplicate", f"同名 Spec 已归档: {old.path}"))
+
+    refs = _spec_refs(specs)
+    for path in lists:
+        issues.extend(_check_feature_list(root, path, refs))
+    return issues
+
+
+def run(args: argparse.Namespace) -> None:
+    """执行 check 子命令。"""
+    root = Path(args.root or os.getcwd()).resolve()
+    if not (root / SPEC_ROOT).is_dir():
+        print(f"错误：未找到 {SPEC_ROOT.as_posix()}/ 目录，请在项目根目录执行或使用 --root: {root}", file=sys.stderr)
+        sys.exit(1)
+
+    cache_path = None if args.no_cache else Path(args.cache) if args.cache else root / CACHE_FILE
+    cache = CheckCache(cache_path)
+    specs, hits = check_specs(root, cache, args.jobs)
+    cache.save()
+    lists = feature_lists(root)
+    issues = [issue for spec in specs for issue in spec.issues]
+    issues.extend(cross_check(root, specs, lists))
+    issues.sort(key=lambda issue: (issue.path, issue.line or 0))
+    errors = sum(1 for issue in issues if issue.severity == ERROR)
+    warnings = len(issues) - errors
+
+    if args.json:
+        result = {
+            "root": root.as_posix(),
+            "files": len(specs),
+            "cached": hits,
+            "feature_lists": [path.relative_to(root).as_posix() for path in lists],
+            "errors": errors,
+            "warnings": warnings,
+            "issues": [asdict(issue) for issue in issues],
+            "specs": [{k: v for k, v in spec.to_json().items() if k != "issues"} for spec in specs],
+        }
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+    else:
+        for issue in issues:
+            print(issue.format())
+        if issues:
+            print()
+        checked = f"检查 {len(specs)} 个 Spec 文件（缓存命中 {hits}）、{len(lists)} 个 feature list"
+        print(f"{checked}：{errors} 个错误，{warnings} 个警告" if issues else f"{checked}：全部通过")
+
+    if errors or (args.strict and warnings):
+        sys.exit(1)
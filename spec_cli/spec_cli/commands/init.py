@@ -0,0 +1,499 @@
+"""init 子命令：在目标项目中安装或增量更新 Spec 框架文件。"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from spec_cli.bundle import TemplateBundle, TemplateDir, TemplateSource
+from spec_cli.cli import VERSION_FILE, _get_version
+from spec_cli.render import PASSTHROUGH, from_placeholders
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """注册 init 子命令参数。"""
+    parser.add_argument(
+        "targets",
+        nargs="*",
+        metavar="target",
+        help="目标目录，默认当前目录；给出多个目录或 glob（如 'services/*'）时进入 workspace 模式",
+    )
+    parser.add_argument(
+        "--targets-from",
+        metavar="FILE",
+        default=None,
+        help="从清单文件读取目标（每行一个目录，或 JSON 列表，元素可带 backend_dir 等覆盖项），进入 workspace 模式",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="workspace 模式下并行处理目标的进程数，默认 CPU 数",
+    )
+    parser.add_argument("--backend-dir", default="backend", help="后端代码目录名，用于规则 globs")
+    parser.add_argument("--frontend-dir", default="frontend", help="前端代码目录名，用于规则 globs")
+    parser.add_argument("--app-package", default="app", help="后端 Python 包名，用于规则与技能中的路径")
+    parser.add_argument(
+        "--docs-only",
+        action="store_true",
+        help="仅创建 docs/spec 与 docs/spec_process，不写入 .cursor",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="强制重新初始化（覆盖 docs/ 目录）",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=None,
+        help="并发读写文件的线程数，默认自动（min(32, CPU 数 + 4)）",
+    )
+
+
+def _read_installed_version(target_root: Path) -> str | None:
+    """读取目标项目已安装的版本，返回 None 表示未安装。"""
+    version_file = target_root / VERSION_FILE
+    if version_file.is_file():
+        try:
+            data = json.loads(version_file.read_text(encoding="utf-8"))
+            return data.get("version")
+        except (json.JSONDecodeError, KeyError):
+            return "0.0.0"  # 旧版本格式，视为需要更新
+    return None
+
+
+Combo = tuple[str, str, str]
+
+
+@dataclass(frozen=True, slots=True)
+class ManifestEntry:
+    """清单中的一个框架文件：写入内容的 sha256、写入后的大小与 mtime，以及所用模板条目的 sha256。
+
+    旧版本的清单只记录哈希，size / mtime_ns / template 为 None，此时不能仅凭 stat 判断文件未变。
+    """
+
+    sha256: str
+    size: int | None = None
+    mtime_ns: int | None = None
+    template: str | None = None
+
+    def to_json(self) -> dict[str, object]:
+        return {"sha256": self.sha256, "size": self.size, "mtime_ns": self.mtime_ns, "template": self.template}
+
+    @classmethod
+    def from_json(cls, value: object) -> "ManifestEntry | None":
+        if isinstance(value, str):
+            return cls(value)
+        if not isinstance(value, dict) or not isinstance(value.get("sha256"), str):
+            return None
+        size, mtime_ns, template = value.get("size"), value.get("mtime_ns"), value.get("template")
+        return cls(
+            value["sha256"],
+            size if isinstance(size, int) else None,
+            mtime_ns if isinstance(mtime_ns, int) else None,
+            template if isinstance(template, str) else None,
+        )
+
+
+def _read_manifest(target_root: Path) -> tuple[dict[str, ManifestEntry], Combo | None]:
+    """读取上次安装的框架文件清单与 (backend_dir, frontend_dir, app_package)；旧版本无清单时返回空。"""
+    version_file = target_root / VERSION_FILE
+    if not version_file.is_file():
+        return {}, None
+    try:
+        data = json.loads(version_file.read_text(encoding="utf-8"))
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return {}, None
+    if not isinstance(data, dict):
+        return {}, None
+    files = data.get("files")
+    manifest: dict[str, ManifestEntry] = {}
+    if isinstance(files, dict):
+        for rel, value in files.items():
+            entry = ManifestEntry.from_json(value)
+            if entry is not None:
+                manifest[rel] = entry
+    combo = (data.get("backend_dir"), data.get("frontend_dir"), data.get("app_package"))
+    return manifest, combo if all(isinstance(value, str) for value in combo) else None
+
+
+def _file_sha256(path: Path) -> str:
+    with path.open("rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def _write_version(
+    target_root: Path,
+    version: str,
+    files: dict[str, ManifestEntry] | None = None,
+    backend_dir: str | None = None,
+    frontend_dir: str | None = None,
+    app_package: str | None = None,
+) -> None:
+    """写入版本标记文件（含安装配置与框架文件哈希清单）。"""
+    version_file = target_root / VERSION_FILE
+    data = {
+        "version": version,
+        "backend_dir": backend_dir,
+        "frontend_dir": frontend_dir,
+        "app_package": app_package,
+        "files": {rel: entry.to_json() for rel, entry in sorted((files or {}).items())},
+    }
+    version_file.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+
+
+def _templates_dir() -> Path:
+    return Path(__file__).resolve().parent.parent / "templates"
+
+
+def _default_jobs() -> int:
+    """默认并发数：与 ThreadPoolExecutor 默认值一致，文件 IO 受延迟限制，可多于 CPU 数。"""
+    return min(32, (os.cpu_count() or 1) + 4)
+
+
+def _copy_templates(
+    target_root: Path,
+    backend_dir: str,
+    frontend_dir: str,
+    app_package: str,
+    docs_only: bool,
+    skip_skills: bool,
+    is_update: bool,
+    jobs: int | None = None,
+) -> dict[str, list[str]]:
+    """复制模板到目标项目，返回按 added/changed/skipped/removed/failed 分组的框架文件相对路径。
+
+    框架文件的 sha256 清单记录在版本文件中；更新模式下内容未变化的文件不重写。
+    文件读写由 jobs 个线程并发执行（None 表示自动），单个文件失败记入 failed，不中断其余文件。
+    """
+    templates = _open_templates()
+    try:
+        return _install_templates(
+            templates,
+            target_root,
+            backend_dir=backend_dir,
+            frontend_dir=frontend_dir,
+            app_package=app_package,
+            docs_only=docs_only,
+            skip_skills=skip_skills,
+            is_update=is_update,
+            jobs=jobs,
+        )
+    finally:
+        templates.close()
+
+
+def _templates_incomplete(templates: TemplateSource) -> bool:
+    if not templates.is_dir("cursor/rules"):
+        return True
+    if not templates.is_dir("docs/spec"):
+        return True
+    if not templates.is_dir("claude/rules") and not templates.is_file("CLAUDE.md"):
+        return True
+    return False
+
+
+def _open_templates() -> TemplateSource:
+    """打开模板来源：优先使用模板包（仓库内源文件变化时才重建），其次为旧式 templates/ 目录。"""
+    path = None
+    try:
+        import spec_cli.build_templates
+        path = spec_cli.build_templates.ensure_bundle()
+    except Exception as e:
+        print(f"自动生成模板包失败: {e}", file=sys.stderr)
+    if path is not None:
+        templates: TemplateSource = TemplateBundle(path)
+    else:
+        templates = TemplateDir(_templates_dir())
+    if _templates_incomplete(templates):
+        templates.close()
+        print(f"错误：模板不存在或为空: {templates.path}", file=sys.stderr)
+        print("请在 spec_coding 仓库根执行 pip install -e . 以生成模板。", file=sys.stderr)
+        sys.exit(1)
+    return templates
+
+
+def _install_templates(
+    templates: TemplateSource,
+    target_root: Path,
+    backend_dir: str,
+    frontend_dir: str,
+    app_package: str,
+    docs_only: bool,
+    skip_skills: bool,
+    is_update: bool,
+    jobs: int | None,
+    prerendered: bool = False,
+) -> dict[str, list[str]]:
+    """按计划安装模板；prerendered=True 表示模板集已按本次目录与包名渲染（见 workspace），直接原样写入。"""
+    previous, previous_combo = _read_manifest(target_root) if is_update else ({}, None)
+    # 占位符组合与上次相同时，渲染结果只取决于模板条目，可凭清单中的模板哈希判断是否需要重新渲染
+    same_combo = previous_combo == (backend_dir, frontend_dir, app_package)
+    manifest: dict[str, ManifestEntry] = {}
+    managed_roots: list[str] = []
+    # 安装计划：(模板条目名, 目标文件, 是否替换占位符, 是否纳入清单)，先收集再并发执行
+    plan: list[tuple[str, Path, bool, bool]] = []
+
+    placeholder_renderer = PASSTHROUGH if prerendered else from_placeholders(backend_dir, frontend_dir, app_package)
+
+    def install_file(name: str, dest: Path, substitute_text: bool, track: bool) -> tuple[str, ManifestEntry | None]:
+        """流式渲染并写入单个文件，返回 (状态, 清单记录)；track=True 时内容未变化则跳过写入。"""
+        renderer = placeholder_renderer if substitute_text else PASSTHROUGH
+        if not track:
+            renderer.write(templates.chunks(name), dest)
+            return "untracked", None
+        template = templates.sha256(name)
+
+        def written(digest: str) -> ManifestEntry:
+            st = dest.stat()
+            return ManifestEntry(digest, st.st_size, st.st_mtime_ns, template)
+
+        if not dest.is_file():
+            digest, _ = renderer.write(templates.chunks(name), dest)
+            return "added", written(digest)
+        st = dest.stat()
+        old = previous.get(dest.relative_to(target_root).as_posix())
+        if (
+            old is not None
+            and same_combo
+            and template is not None
+            and old.template == template
+            and (old.size, old.mtime_ns) == (st.st_size, st.st_mtime_ns)
+        ):
+            # 模板条目与占位符组合均未变，文件自上次写入后也未被改动：仅 stat，不渲染也不读目标文件
+            return "skipped", old
+        # 目标已存在：先只计算渲染结果的哈希，确有变化才写盘；原样复制的条目直接使用模板包索引中的哈希
+        if renderer is PASSTHROUGH and template is not None:
+            digest, size = template, templates.size(name)
+        else:
+            digest, size = renderer.digest(templates.chunks(name))
+        # stat 与清单不符（或无清单）时以磁盘上的实际内容为准：大小不同必然需要重写，大小相同再比较哈希，
+        # 安装后被手工改动的文件因此会被恢复，只是 touch 过的文件则无需重写
+        if st.st_size == size and _file_sha256(dest) == digest:
+            return "skipped", ManifestEntry(digest, st.st_size, st.st_mtime_ns, template)
+        renderer.write(templates.chunks(name), dest)
+        return "changed", written(digest)
+
+    def copy_tree(
+        src: str,
+        dest: Path,
+        substitute_text: bool = True,
+        track: bool = True,
+    ) -> None:
+        if track:
+            managed_roots.append(dest.relative_to(target_root).as_posix() + "/")
+        for name in templates.files(src):
+            plan.append((name, dest / name[len(src) + 1 :], substitute_text, track))
+
+    def copy_file(src: str, dest: Path, substitute_text: bool = True) -> None:
+        managed_roots.append(dest.relative_to(target_root).as_posix())
+        plan.append((src, dest, substitute_text, True))
+
+    # docs/spec + docs/spec_process（仅首次安装或强制模式时写入；属业务文档，不纳入清单，按字节原样复制）
+    if not is_update:
+        for name in ("docs",):
+            if templates.is_dir(name):
+                copy_tree(name, target_root / name, substitute_text=False, track=False)
+
+    # .claude/rules（始终更新）
+    if templates.is_dir("claude/rules"):
+        copy_tree("claude/rules", target_root / ".claude" / "rules", substitute_text=True)
+
+    # .claude/skills（始终更新，除非 docs_only）
+    if not docs_only and templates.is_dir("claude/skills"):
+        copy_tree("claude/skills", target_root / ".claude" / "skills", substitute_text=True)
+
+    # CLAUDE.md（始终更新）
+    if templates.is_file("CLAUDE.md"):
+        copy_file("CLAUDE.md", target_root / "CLAUDE.md", substitute_text=True)
+
+    if not docs_only:
+        # .cursor/rules（始终更新）
+        if templates.is_dir("cursor/rules"):
+            copy_tree("cursor/rules", target_root / ".cursor" / "rules", substitute_text=True)
+
+        # .cursor/skills（始终更新）
+        if not skip_skills and templates.is_dir("cursor/skills"):
+            copy_tree("cursor/skills", target_root / ".cursor" / "skills", substitute_text=True)
+
+        # .cursor/mcp.json（始终更新，框架保证向后兼容）
+        if templates.is_file("cursor/mcp.json"):
+            copy_file("cursor/mcp.json", target_root / ".cursor" / "mcp.json", substitute_text=False)
+
+    # 目录统一预先创建（每个目录一次），文件读写交给有界线程池；结果按计划顺序汇总，输出确定
+    for directory in sorted({dest.parent for _, dest, _, _ in plan}):
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            pass  # 该目录下的文件写入时会失败并逐个记入 failed
+
+    report: dict[str, list[str]] = {
+        "added": [],
+        "changed": [],
+        "skipped": [],
+        "removed": [],
+        "kept": [],
+        "failed": [],
+    }
+    with ThreadPoolExecutor(max_workers=max(1, jobs or _default_jobs())) as pool:
+        futures = [pool.submit(install_file, *entry) for entry in plan]
+        for (_, dest, _, track), future in zip(plan, futures):
+            rel = dest.relative_to(target_root).as_posix()
+            try:
+                status, entry = future.result()
+            except OSError as e:
+                # 单个文件失败不中断整体安装；保留旧哈希，下次更新会重试
+                report["failed"].append(f"{rel}: {e}")
+                if rel in previous:
+                    manifest[rel] = previous[rel]
+                continue
+            if track and entry is not None:
+                manifest[rel] = entry
+                report[status].append(rel)
+
+    # 上次清单中属于本次已处理目录、但模板中已不存在的文件：视为框架删除，同步移除
+    # 安装后被本地改动过的文件不删除，保留并提示，此后不再纳入清单
+    for rel, entry in sorted(previous.items()):
+        if rel in manifest:
+            continue
+        if not any(rel == root or rel.startswith(root) for root in managed_roots):
+            manifest[rel] = entry  # 本次未处理的部分（如 --docs-only 跳过的 .cursor）原样保留
+            continue
+        stale = target_root / rel
+        try:
+            if stale.is_file():
+                if _file_sha256(stale) != entry.sha256:
+                    report["kept"].append(rel)
+                    continue
+                stale.unlink()
+        except OSError as e:
+            # 与写入失败一致：记入 failed 并保留清单记录，下次更新会重试
+            report["failed"].append(f"{rel}: {e}")
+            manifest[rel] = entry
+            continue
+        report["removed"].append(rel)
+
+    # 写入/更新版本文件
+    _write_version(
+        target_root,
+        _get_version(),
+        files=manifest,
+        backend_dir=backend_dir,
+        frontend_dir=frontend_dir,
+        app_package=app_package,
+    )
+
+    return report
+
+
+def _print_report(report: dict[str, list[str]]) -> None:
+    """输出框架文件变更摘要。"""
+    print(
+        f"  文件: 新增 {len(report['added'])}，变更 {len(report['changed'])}，"
+        f"跳过 {len(report['skipped'])}（未变化），删除 {len(report['removed'])}，"
+        f"保留 {len(report['kept'])}（本地已修改），失败 {len(report['failed'])}"
+    )
+    for label, key in (("+", "added"), ("~", "changed"), ("-", "removed")):
+        for rel in report[key]:
+            print(f"    {label} {rel}")
+    for rel in report["kept"]:
+        print(f"    = {rel}（新版模板已删除此文件，但它在安装后被本地修改过，已保留）")
+    for entry in report["failed"]:
+        print(f"    ! {entry}", file=sys.stderr)
+
+
+def _detect_install(target: Path) -> tuple[str | None, bool]:
+    """检测目标是否已初始化，返回 (已安装版本, 是否为更新模式)。"""
+    installed_version = _read_installed_version(target)
+    has_docs = (target / "docs" / "spec").is_dir() or (target / "docs" / "spec_process").is_dir()
+    return installed_version, installed_version is not None or has_docs
+
+
+def _is_workspace(args: argparse.Namespace) -> bool:
+    """多个目标、glob 或清单文件时进入 workspace 模式。"""
+    if args.targets_from or len(args.targets) > 1:
+        return True
+    return any(ch in t for t in args.targets for ch in "*?[")
+
+
+def run(args: argparse.Namespace) -> None:
+    """执行 init 子命令。"""
+    if _is_workspace(args):
+        from spec_cli.workspace import run_workspace
+
+        run_workspace(args)
+        return
+
+    target = Path(args.targets[0] if args.targets else os.getcwd()).resolve()
+    if not target.is_dir():
+        print(f"错误：目标不是目录或不存在: {target}", file=sys.stderr)
+        sys.exit(1)
+
+    # 检测是否已初始化
+    installed_version, is_update = _detect_install(target)
+
+    if is_update and not args.force:
+        print(f"检测到已安装版本: {installed_version or '未知（旧版本）'}")
+        print(f"当前框架版本: {_get_version()}")
+        print()
+        if installed_version == _get_version():
+            print("版本相同，仅更新框架文件（rules/skills/CLAUDE.md）。")
+        else:
+            print("版本不同，执行更新模式：")
+            print("  - 跳过 docs/ 目录（保留现有业务文档）")
+            print("  - 更新框架文件（rules/skills/CLAUDE.md/mcp.json）")
+            print("  - 更新版本标记")
+        print()
+        print("提示：使用 --force 可强制重新初始化（会覆盖 docs/）。")
+        print()
+    elif args.force:
+        print("强制模式：将覆盖所有文件（包括 docs/）。")
+        is_update = False  # 强制模式视为全新安装
+
+    report = _copy_templates(
+        target,
+        backend_dir=args.backend_dir,
+        frontend_dir=args.frontend_dir,
+        app_package=args.app_package,
+        docs_only=args.docs_only,
+        skip_skills=args.docs_only,
+        is_update=is_update,
+        jobs=args.jobs,
+    )
+
+    # 输出结果
+    print()
+    print(f"{'更新' if is_update else '初始化'}完成: {target}")
+    print(f"  版本: {_get_version()}")
+    _print_report(report)
+    print()
+    if is_update:
+        print("  已更新:")
+        print("  - .claude/rules/ 与 .claude/skills/（Claude Code）")
+        print("  - .cursor/rules/ 与 .cursor/skills/（Cursor）")
+        print("  - .cursor/mcp.json（MCP 服务器配置）")
+        print("  - CLAUDE.md")
+        print()
+        print("  已跳过（保留现有）:")
+        print("  - docs/spec/ 与 docs/spec_process/")
+    else:
+        print("  已安装:")
+        print("  - docs/spec/ 与 docs/spec_process/")
+        print("  - .claude/rules/、.claude/skills/ 与 CLAUDE.md（Claude Code）")
+        if not args.docs_only:
+            print("  - .cursor/rules/ 与 .cursor/skills/（Cursor）")
+            if (target / ".cursor" / "mcp.json").is_file():
+                print("  - .cursor/mcp.json（MCP 服务器配置）")
+        else:
+            print("  - （仅文档 + Claude 规则与技能，未写入 .cursor）")
+
+    if report["failed"]:
+        print()
+        print(f"错误：{len(report['failed'])} 个文件写入失败，详见上方 ! 标记。", file=sys.stderr)
+        sys.exit(1)
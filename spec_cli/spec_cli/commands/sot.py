@@ -0,0 +1,132 @@
+"""sot 子命令：查看结构化 Source of Truth，并把旧的追加式历史压缩为结构化格式。
+
+list / show 只读旁路索引与对应字节区间，不扫描整个领域文件（索引过期时自动重建一次）。
+"""
+
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+
+from spec_cli.sot import SotStore
+
+SPEC_SOT = Path("docs/spec/specs")
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """注册 sot 子命令参数。"""
+    parser.add_argument("--root", default=None, help="项目根目录，默认当前目录")
+    actions = parser.add_subparsers(dest="action", required=True)
+
+    list_p = actions.add_parser("list", help="列出领域；给出领域时列出其需求")
+    list_p.add_argument("domain", nargs="?", help="领域名")
+    list_p.add_argument("--json", action="store_true", help="以 JSON 输出")
+
+    show_p = actions.add_parser("show", help="输出单个需求小节")
+    show_p.add_argument("domain", help="领域名")
+    show_p.add_argument("req_id", metavar="id", help="需求 ID")
+
+    compact_p = actions.add_parser("compact", help="把追加式历史改写为按需求 ID 分节的结构化格式并重建索引")
+    compact_p.add_argument("domains", nargs="*", metavar="domain", help="领域名，默认全部")
+    compact_p.add_argument("--dry-run", action="store_true", help="只报告将要改写的文件")
+    compact_p.add_argument("--json", action="store_true", help="以 JSON 输出")
+
+
+def _list(store: SotStore, args: argparse.Namespace) -> None:
+    if args.domain is None:
+        rows = []
+        for domain in store.domains():
+            index = store.index(domain)
+            if index is None:
+                continue
+            rows.append({"domain": domain, "requirements": len(index.entries), "legacy": index.legacy})
+        if args.json:
+            print(json.dumps(rows, ensure_ascii=False, indent=2))
+            return
+        for row in rows:
+            hint = "  （旧格式，建议执行 spec-coding sot compact）" if row["legacy"] else ""
+            print(f"{row['domain']:<24} {row['requirements']:>4} 项需求{hint}")
+        return
+
+    index = store.index(args.domain)
+    if index is None:
+        print(f"错误：领域不存在: {args.domain}", file=sys.stderr)
+        sys.exit(1)
+    if args.json:
+        entries = [
+            {"id": e.id, "title": e.title, "updated": e.updated, "source": e.source} for e in index.entries
+        ]
+        print(json.dumps(entries, ensure_ascii=False, indent=2))
+        return
+    for e in index.entries:
+        title = "" if e.title == e.id else f"  {e.title}"
+        updated = f"  [{e.updated}{' ' + e.source if e.source else ''}]" if e.updated else ""
+        print(f"{e.id}{title}{updated}")
+
+
+def _show(store: SotStore, args: argparse.Namespace) -> None:
+    text = store.read(args.domain, args.req_id)
+    if text is None:
+        print(f"错误：未找到需求: {args.domain}/{args.req_id}", file=sys.stderr)
+        sys.exit(1)
+    print(text.rstrip("\n"))
+
+
+def _compact(store: SotStore, root: Path, args: argparse.Namespace) -> None:
+    domains = args.domains or store.domains()
+    results = []
+    failed = False
+    for domain in domains:
+        path = store.path(domain)
+        if not path.is_file():
+            results.append({"domain": domain, "error": "领域不存在"})
+            failed = True
+            continue
+        before = path.read_text(encoding="utf-8")
+        doc = store.load(domain)
+        after = doc.render()
+        changed = after != before
+        if changed and not args.dry_run:
+            store.save(domain, doc)
+        elif not args.dry_run:
+            store.index(domain)
+        results.append(
+            {
+                "domain": domain,
+                "path": path.relative_to(root).as_posix(),
+                "changed": changed,
+                "requirements": len(doc.sections),
+                "bytes_before": len(before.encode("utf-8")),
+                "bytes_after": len(after.encode("utf-8")),
+            }
+        )
+
+    if args.json:
+        print(json.dumps({"dry_run": args.dry_run, "domains": results}, ensure_ascii=False, indent=2))
+    else:
+        for r in results:
+            if "error" in r:
+                print(f"  ! {r['domain']}: {r['error']}", file=sys.stderr)
+            elif r["changed"]:
+                verb = "将改写" if args.dry_run else "已改写"
+                print(
+                    f"  {verb}: {r['path']}（{r['requirements']} 项需求，"
+                    f"{r['bytes_before']} -> {r['bytes_after']} 字节）"
+                )
+            else:
+                print(f"  无需改写: {r['path']}")
+    if failed:
+        sys.exit(1)
+
+
+def run(args: argparse.Namespace) -> None:
+    """执行 sot 子命令。"""
+    root = Path(args.root or os.getcwd()).resolve()
+    store = SotStore(root / SPEC_SOT)
+    if args.action == "list":
+        _list(store, args)
+    elif args.action == "show":
+        _show(store, args)
+    else:
+        _compact(store, root, args)
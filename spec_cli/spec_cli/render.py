@@ -0,0 +1,185 @@
+"""
+模板渲染引擎：占位符替换（安装）与反向占位符化（生成模板）共用同一套实现。
+
+- 所有规则编译为一个正则，每个文件只扫描一遍；
+- 按块流式读写，大文件不整体载入内存；
+- 含 NUL 或开头即非 UTF-8 的文件视为二进制，按字节原样复制，不解码。
+"""
+
+import codecs
+import hashlib
+import os
+import re
+import stat
+from collections.abc import Iterable, Iterator, Mapping
+from functools import lru_cache
+from pathlib import Path
+
+PLACEHOLDER_BACKEND = "{{BACKEND_DIR}}"
+PLACEHOLDER_FRONTEND = "{{FRONTEND_DIR}}"
+PLACEHOLDER_APP = "{{APP_PACKAGE}}"
+
+# 输入块可以是 bytes，也可以是内存映射上的 memoryview（零拷贝）
+Buffer = bytes | memoryview
+
+CHUNK_SIZE = 64 * 1024
+# 块边界处保留的字符数，须大于任一规则的最长匹配（含前瞻断言所需的字符）
+_CARRY = 64
+# 已消费部分保留的字符数，供后顾断言（\b、(?<=...)）使用
+_LOOKBEHIND = 16
+
+
+class Renderer:
+    """一组字面量替换规则编译后的单遍渲染器；无规则时为原样复制。
+
+    replacements：字面量 -> 替换文本；context：字面量 -> (前置断言, 后置断言) 正则，限定该字面量只在特定上下文中替换。
+    断言均为零宽，匹配到的文本恒为字面量本身，因此替换只需一次字典查找。
+    """
+
+    def __init__(
+        self,
+        replacements: Mapping[str, str],
+        context: Mapping[str, tuple[str, str]] | None = None,
+    ) -> None:
+        self._replacements = dict(replacements)
+        if not replacements:
+            self._pattern: re.Pattern[str] | None = None
+            return
+        context = context or {}
+        # 长字面量优先；整体前加首字符前瞻，re 只在可能的起始字符处尝试各分支
+        alternatives = []
+        for literal in sorted(replacements, key=len, reverse=True):
+            before, after = context.get(literal, ("", ""))
+            alternatives.append(f"{before}{re.escape(literal)}{after}")
+        first_chars = "".join(sorted({literal[0] for literal in replacements}))
+        self._pattern = re.compile(f"(?=[{re.escape(first_chars)}])(?:{'|'.join(alternatives)})")
+
+    def _replace(self, match: re.Match[str]) -> str:
+        return self._replacements[match[0]]
+
+    def render(self, text: str) -> str:
+        """渲染整段文本。"""
+        if self._pattern is None:
+            return text
+        return self._pattern.sub(self._replace, text)
+
+    def _render_prefix(self, buf: str, start: int, cut: int) -> tuple[str, int]:
+        """渲染 buf[start:cut]，返回 (输出, 已消费到的位置)；跨越 cut 的匹配整体纳入本段。"""
+        assert self._pattern is not None
+        parts: list[str] = []
+        pos = start
+        for match in self._pattern.finditer(buf, start):
+            if match.start() >= cut:
+                break
+            parts.append(buf[pos : match.start()])
+            parts.append(self._replace(match))
+            pos = match.end()
+        if pos < cut:
+            parts.append(buf[pos:cut])
+            pos = cut
+        return "".join(parts), pos
+
+    def iter_chunks(self, chunks: Iterable[Buffer]) -> Iterator[Buffer]:
+        """逐块产出渲染后的字节；二进制内容与无规则时原样产出输入块（不复制）。"""
+        it = iter(chunks)
+        head = next(it, b"")
+        if self._pattern is None or is_binary(bytes(head)):
+            if head:
+                yield head
+            yield from it
+            return
+
+        # 开头之后偶发的非法字节经 surrogateescape 原样往返，不影响其余内容的替换
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="surrogateescape")
+        buf = decoder.decode(head)
+        start = 0
+        for chunk in it:
+            buf += decoder.decode(chunk)
+            if len(buf) - start <= 2 * _CARRY:
+                continue
+            out, pos = self._render_prefix(buf, start, len(buf) - _CARRY)
+            yield out.encode("utf-8", "surrogateescape")
+            buf = buf[pos - _LOOKBEHIND :]
+            start = _LOOKBEHIND
+        buf += decoder.decode(b"", final=True)
+        out, _ = self._render_prefix(buf, start, len(buf))
+        if out:
+            yield out.encode("utf-8", "surrogateescape")
+
+    def iter_file(self, src: Path, chunk_size: int = CHUNK_SIZE) -> Iterator[Buffer]:
+        """按块产出文件 src 渲染后的字节。"""
+        return self.iter_chunks(read_chunks(src, chunk_size))
+
+    def digest(self, chunks: Iterable[Buffer]) -> tuple[str, int]:
+        """不写盘，返回渲染结果的 (sha256, 字节数)。"""
+        h = hashlib.sha256()
+        size = 0
+        for block in self.iter_chunks(chunks):
+            h.update(block)
+            size += len(block)
+        return h.hexdigest(), size
+
+    def write(self, chunks: Iterable[Buffer], dest: Path) -> tuple[str, int]:
+        """流式渲染写入 dest，返回写入内容的 (sha256, 字节数)。
+
+        先写入同目录临时文件再原子替换：中途出错或进程被终止时 dest 保持原内容，不会留下截断的文件。
+        dest 已存在时沿用其权限位。
+        """
+        h = hashlib.sha256()
+        size = 0
+        tmp = dest.with_name(f".{dest.name}.tmp")
+        try:
+            with tmp.open("wb") as out:
+                for block in self.iter_chunks(chunks):
+                    h.update(block)
+                    size += len(block)
+                    out.write(block)
+            try:
+                os.chmod(tmp, stat.S_IMODE(dest.stat().st_mode))
+            except FileNotFoundError:
+                pass
+            os.replace(tmp, dest)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+        return h.hexdigest(), size
+
+
+def read_chunks(src: Path, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """按块读取文件。"""
+    with src.open("rb") as f:
+        while chunk := f.read(chunk_size):
+            yield chunk
+
+
+def is_binary(head: bytes) -> bool:
+    """根据文件开头判断是否二进制：含 NUL，或不是合法 UTF-8（允许末尾多字节字符被截断）。"""
+    if b"\0" in head:
+        return True
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(head, final=False)
+    except UnicodeDecodeError:
+        return True
+    return False
+
+
+PASSTHROUGH = Renderer({})
+
+# 仓库内容 -> 模板：backend/frontend 转占位符；app 仅在作为包名（app/、app.）时替换，避免改到 application 等。
+# 紧跟 backend/frontend 之后的 app 在替换后前面是 "}"，同样视为词边界
+TO_PLACEHOLDERS = Renderer(
+    {"backend": PLACEHOLDER_BACKEND, "frontend": PLACEHOLDER_FRONTEND, "app": PLACEHOLDER_APP},
+    context={"app": (r"(?:\b|(?<=backend)|(?<=frontend))", r"(?=[/.])")},
+)
+
+
+@lru_cache(maxsize=32)
+def from_placeholders(backend_dir: str, frontend_dir: str, app_package: str) -> Renderer:
+    """模板 -> 目标项目：将占位符替换为实际目录与包名。"""
+    return Renderer(
+        {
+            PLACEHOLDER_BACKEND: backend_dir,
+            PLACEHOLDER_FRONTEND: frontend_dir,
+            PLACEHOLDER_APP: app_package,
+        }
+    )
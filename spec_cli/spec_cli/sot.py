@@ -0,0 +1,516 @@
+"""结构化 Source of Truth：按需求 ID 分节存储、原地合并 delta，并维护旁路偏移索引。
+
+docs/spec/specs/<领域>/spec.md 的结构：
+
+    # <领域>                          ← 前言，原样保留
+
+    ## REQ-001 用户登录
+    <!-- sot:req id="REQ-001" updated="2026-10-18" source="user_login" -->
+
+    正文……
+
+每个需求是一个二级标题开头的小节，紧随标题的注释记录需求 ID、最近更新日期与来源 Spec。
+归档时 Spec 中 ADDED / MODIFIED 的需求按 ID 原地替换或追加，REMOVED 的需求被删除，文件始终
+只描述当前状态。同目录的 .spec.index.json 记录每个小节的字节偏移与长度，以及 spec.md 的
+大小与 mtime：读取单个需求或列出需求时只读索引与对应字节区间，索引过期时重新扫描一次并重写。
+
+archive.sh 追加式写出的旧文件（`--- 归档于 <日期> ---` 分隔的历史）在读取时按时间顺序重放为
+结构化文档，`spec-coding sot compact` 将其改写为上述格式。
+"""
+
+import json
+import os
+import re
+import shutil
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+
+SPEC_FILE = "spec.md"
+INDEX_FILE = ".spec.index.json"
+INDEX_FORMAT = 1
+
+_FENCE = re.compile(r"^[ \t]{0,3}(`{3,}|~{3,})")
+_HEADING = re.compile(r"^(#{1,6})[ \t]+(.*?)(?:[ \t]+#+)?[ \t]*$")
+_META = re.compile(r"^<!--[ \t]*sot:req\b(.*?)-->$")
+_META_ATTR = re.compile(r'(\w+)="([^"]*)"')
+_LEGACY_SEPARATOR = re.compile(r"^--- 归档于 (\S+) ---$")
+_MARKER = re.compile(r"\b(ADDED|MODIFIED|REMOVED)\b", re.IGNORECASE)
+_REQ_ID = re.compile(r"^\[?([A-Za-z][A-Za-z0-9_]*-\d+(?:\.\d+)*)\]?[:：]?[ \t]*(.*)$")
+_REQUIREMENT_PREFIX = re.compile(r"^(?:Requirement|需求)[:：][ \t]*", re.IGNORECASE)
+_BULLET = re.compile(r"^[ \t]*[-*+][ \t]+(.+?)[ \t]*$")
+_CHECKBOX = re.compile(r"^\[[ xX]\]")
+_FRONT_MATTER = re.compile(r"^(status|domain):")
+
+
+@dataclass(slots=True)
+class _Line:
+    text: str
+    level: int | None  # 标题层级；非标题或位于代码块内为 None
+    title: str
+    offset: int  # 行首字节偏移（UTF-8）
+
+
+def _scan(text: str) -> list[_Line]:
+    """逐行扫描 Markdown，识别标题（跳过代码块）并记录字节偏移。"""
+    lines: list[_Line] = []
+    fence: str | None = None
+    offset = 0
+    for raw in text.splitlines(keepends=True):
+        stripped = raw.rstrip("\r\n")
+        level: int | None = None
+        title = ""
+        opening = _FENCE.match(stripped)
+        if fence is not None:
+            if opening and opening.group(1)[0] == fence[0] and len(opening.group(1)) >= len(fence):
+                fence = None
+        elif opening:
+            fence = opening.group(1)
+        else:
+            heading = _HEADING.match(stripped)
+            if heading:
+                level = len(heading.group(1))
+                title = heading.group(2)
+        lines.append(_Line(raw, level, title, offset))
+        offset += len(raw.encode("utf-8"))
+    return lines
+
+
+def _join(lines: list[_Line], shift: int = 0) -> str:
+    """拼回文本，标题层级整体平移 shift（限制在 1..6），首尾空行去掉。"""
+    parts: list[str] = []
+    for line in lines:
+        if shift and line.level is not None:
+            level = min(6, max(1, line.level + shift))
+            parts.append("#" * level + line.text.lstrip("#"))
+        else:
+            parts.append(line.text)
+    return "".join(parts).strip("\r\n")
+
+
+def split_heading(text: str) -> tuple[str, str]:
+    """从标题文本取 (需求 ID, 标题)：`REQ-001 登录`、`[REQ-001] 登录` 取编号，否则整段标题即 ID。"""
+    text = _REQUIREMENT_PREFIX.sub("", text.strip().strip("`"))
+    match = _REQ_ID.match(text)
+    if match:
+        return match.group(1), match.group(2).strip()
+    return text, text
+
+
+@dataclass(slots=True)
+class Section:
+    """一个需求小节；body 为标题与元数据注释之后的正文，标题层级已归一到三级起。"""
+
+    id: str
+    title: str
+    body: str = ""
+    updated: str | None = None
+    source: str | None = None
+    span: tuple[int, int] | None = field(default=None, compare=False)  # 在文件中的字节区间
+
+    def render(self) -> str:
+        heading = self.title if self.title == self.id else f"{self.id} {self.title}".rstrip()
+        attrs = [("id", self.id), ("updated", self.updated), ("source", self.source)]
+        meta = " ".join(f'{key}="{value.replace(chr(34), chr(39))}"' for key, value in attrs if value)
+        text = f"## {heading}\n<!-- sot:req {meta} -->\n"
+        return f"{text}\n{self.body}\n" if self.body else text
+
+
+@dataclass(slots=True)
+class Delta:
+    """一个 Spec 对 Source of Truth 的变更：按 ID 新增或替换的需求，以及删除的需求 ID。"""
+
+    upserts: list[Section] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class MergeResult:
+    added: list[str] = field(default_factory=list)
+    modified: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    missing: list[str] = field(default_factory=list)  # REMOVED 中当前不存在的 ID
+
+
+@dataclass(slots=True)
+class Document:
+    """一个领域的当前状态：前言与按 ID 索引、保持顺序的需求小节。"""
+
+    preamble: str = ""
+    sections: dict[str, Section] = field(default_factory=dict)
+
+    def apply(self, delta: Delta, updated: str | None = None, source: str | None = None) -> MergeResult:
+        """原地合并：已有 ID 在原位置替换，新 ID 追加到末尾，REMOVED 的 ID 删除。"""
+        result = MergeResult()
+        for section in delta.upserts:
+            merged = replace(
+                section,
+                updated=updated or section.updated,
+                source=source or section.source,
+                span=None,
+            )
+            (result.modified if section.id in self.sections else result.added).append(section.id)
+            self.sections[section.id] = merged
+        for req_id in delta.removed:
+            if self.sections.pop(req_id, None) is None:
+                result.missing.append(req_id)
+            else:
+                result.removed.append(req_id)
+        return result
+
+    def render(self) -> str:
+        parts: list[str] = []
+        preamble = self.preamble.strip("\r\n")
+        if preamble:
+            parts.append(preamble + "\n")
+        parts.extend(section.render() for section in self.sections.values())
+        return "\n".join(parts)
+
+
+def parse_document(text: str) -> Document:
+    """解析结构化文件：二级标题开始一个需求小节，ID 优先取元数据注释，其次取标题。"""
+    lines = _scan(text)
+    total = len(text.encode("utf-8"))
+    starts = [i for i, line in enumerate(lines) if line.level == 2]
+    first = starts[0] if starts else len(lines)
+    doc = Document(preamble="".join(line.text for line in lines[:first]))
+    for n, start in enumerate(starts):
+        end = starts[n + 1] if n + 1 < len(starts) else len(lines)
+        rest = lines[start + 1 : end]
+        meta: dict[str, str] = {}
+        j = 0
+        while j < len(rest) and not rest[j].text.strip():
+            j += 1
+        if j < len(rest):
+            match = _META.match(rest[j].text.strip())
+            if match:
+                meta = dict(_META_ATTR.findall(match.group(1)))
+                rest = rest[j + 1 :]
+        heading = lines[start].title
+        req_id, title = split_heading(heading)
+        if "id" in meta:
+            req_id = meta["id"]
+            title = heading.removeprefix(req_id).strip() if heading.startswith(req_id) else heading
+            title = title or req_id
+        elif req_id in doc.sections:
+            # 手写文件中的同名小节不互相覆盖
+            k = 2
+            while f"{req_id} ({k})" in doc.sections:
+                k += 1
+            req_id = f"{req_id} ({k})"
+        # 区间：从标题行到下一节之前，不含末尾空行
+        stop = lines[end].offset if end < len(lines) else total
+        k = end - 1
+        while k > start and not lines[k].text.strip():
+            stop = lines[k].offset
+            k -= 1
+        doc.sections[req_id] = Section(
+            id=req_id,
+            title=title,
+            body=_join(rest),
+            updated=meta.get("updated"),
+            source=meta.get("source"),
+            span=(lines[start].offset, stop),
+        )
+    return doc
+
+
+def parse_delta(text: str, name: str) -> Delta:
+    """从 Spec 原文提取 delta。
+
+    标题含 ADDED / MODIFIED / REMOVED 的小节为 delta 标记，其下一级子标题各是一个需求；
+    REMOVED 下也可用列表逐行给出 ID。没有任何标记时按「未标明视为 ADDED」处理：整篇 Spec
+    （去掉文首 status/domain 行与一级标题）作为一个以 Spec 名称为 ID 的需求。
+    """
+    lines = [line for line in _scan(text) if not (line.level is None and _FRONT_MATTER.match(line.text))]
+    h1 = next((line for line in lines if line.level == 1), None)
+    spec_title = h1.title if h1 is not None else name
+    markers = [i for i, line in enumerate(lines) if line.level is not None and _MARKER.search(line.title)]
+    delta = Delta()
+    if not markers:
+        body = _join([line for line in lines if line is not h1], shift=1)
+        delta.upserts.append(Section(id=name, title=spec_title, body=body))
+        return delta
+
+    loose: list[str] = []
+    for i in markers:
+        marker = lines[i]
+        kind = _MARKER.search(marker.title).group(1).upper()
+        end = i + 1
+        while end < len(lines) and not (lines[end].level is not None and lines[end].level <= marker.level):
+            if end in markers:
+                break
+            end += 1
+        segment = lines[i + 1 : end]
+        levels = [line.level for line in segment if line.level is not None]
+        req_level = min(levels) if levels else None
+        blocks = [k for k, line in enumerate(segment) if line.level is not None and line.level == req_level]
+        first = blocks[0] if blocks else len(segment)
+        if kind == "REMOVED":
+            for line in segment[:first]:
+                bullet = _BULLET.match(line.text.rstrip("\r\n"))
+                if bullet and not _CHECKBOX.match(bullet.group(1)):
+                    delta.removed.append(split_heading(bullet.group(1))[0])
+            delta.removed.extend(split_heading(segment[k].title)[0] for k in blocks)
+            continue
+        text_before = _join(segment[:first])
+        if text_before:
+            loose.append(text_before)
+        for n, k in enumerate(blocks):
+            stop = blocks[n + 1] if n + 1 < len(blocks) else len(segment)
+            req_id, title = split_heading(segment[k].title)
+            body = _join(segment[k + 1 : stop], shift=2 - segment[k].level)
+            delta.upserts.append(Section(id=req_id, title=title, body=body))
+    if loose:
+        delta.upserts.append(Section(id=name, title=spec_title, body="\n\n".join(loose)))
+    return delta
+
+
+def _legacy_chunks(text: str) -> list[tuple[str | None, str]]:
+    """按 archive.sh 的 `--- 归档于 <日期> ---` 分隔行切分为 (日期, 内容)，首段日期为 None。"""
+    chunks: list[tuple[str | None, list[str]]] = [(None, [])]
+    skip_rule = False
+    for line in _scan(text):
+        stripped = line.text.strip()
+        separator = _LEGACY_SEPARATOR.match(stripped) if line.level is None else None
+        if separator:
+            chunks.append((separator.group(1), []))
+            skip_rule = True
+            continue
+        if skip_rule:
+            # 分隔行之后的空行与一行 `---` 属于分隔格式
+            if not stripped:
+                continue
+            skip_rule = False
+            if stripped == "---":
+                continue
+        chunks[-1][1].append(line.text)
+    return [(day, "".join(lines)) for day, lines in chunks]
+
+
+def _is_spec_copy(text: str) -> bool:
+    """archive.sh 新建领域文件时原样复制 Spec，文首为 status: 行。"""
+    first = next((line for line in text.splitlines() if line.strip()), "")
+    return bool(_FRONT_MATTER.match(first))
+
+
+def _chunk_name(text: str, fallback: str) -> str:
+    h1 = next((line for line in _scan(text) if line.level == 1), None)
+    return h1.title if h1 is not None else fallback
+
+
+def is_legacy(text: str) -> bool:
+    """是否为 archive.sh 追加式写出的旧格式。"""
+    return len(_legacy_chunks(text)) > 1 or _is_spec_copy(text)
+
+
+def load_text(text: str, domain: str) -> Document:
+    """解析领域文件；旧格式按时间顺序把每段历史作为 delta 重放。"""
+    chunks = _legacy_chunks(text)
+    _, head = chunks[0]
+    if _is_spec_copy(head):
+        doc = Document(preamble=f"# {domain}\n")
+        doc.apply(parse_delta(head, _chunk_name(head, f"{domain}_1")))
+    else:
+        doc = parse_document(head)
+        if not doc.preamble.strip():
+            doc.preamble = f"# {domain}\n"
+    for n, (day, chunk) in enumerate(chunks[1:], start=2):
+        doc.apply(parse_delta(chunk, _chunk_name(chunk, f"{domain}_{n}")), updated=day)
+    return doc
+
+
+@dataclass(frozen=True, slots=True)
+class IndexEntry:
+    id: str
+    title: str
+    updated: str | None
+    source: str | None
+    offset: int
+    length: int
+
+
+@dataclass(frozen=True, slots=True)
+class Index:
+    """spec.md 的旁路索引；size / mtime_ns 与文件不一致时视为过期。"""
+
+    size: int
+    mtime_ns: int
+    legacy: bool
+    entries: tuple[IndexEntry, ...]
+
+    def find(self, req_id: str) -> IndexEntry | None:
+        return next((entry for entry in self.entries if entry.id == req_id), None)
+
+
+def _entries(doc: Document) -> tuple[IndexEntry, ...]:
+    return tuple(
+        IndexEntry(s.id, s.title, s.updated, s.source, s.span[0], s.span[1] - s.span[0])
+        for s in doc.sections.values()
+        if s.span is not None
+    )
+
+
+def _write_json(path: Path, data: dict[str, object]) -> None:
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_text(json.dumps(data, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _write_index(spec_path: Path, entries: tuple[IndexEntry, ...], legacy: bool, st: os.stat_result) -> Index:
+    index = Index(size=st.st_size, mtime_ns=st.st_mtime_ns, legacy=legacy, entries=entries)
+    data = {
+        "format": INDEX_FORMAT,
+        "size": index.size,
+        "mtime_ns": index.mtime_ns,
+        "legacy": legacy,
+        "sections": [
+            {
+                "id": e.id,
+                "title": e.title,
+                "updated": e.updated,
+                "source": e.source,
+                "offset": e.offset,
+                "length": e.length,
+            }
+            for e in entries
+        ],
+    }
+    try:
+        _write_json(spec_path.with_name(INDEX_FILE), data)
+    except OSError:
+        pass  # 只读目录：索引只在内存中使用
+    return index
+
+
+def _read_index(spec_path: Path, st: os.stat_result) -> Index | None:
+    try:
+        data = json.loads(spec_path.with_name(INDEX_FILE).read_text(encoding="utf-8"))
+    except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+        return None
+    if not isinstance(data, dict) or data.get("format") != INDEX_FORMAT:
+        return None
+    if data.get("size") != st.st_size or data.get("mtime_ns") != st.st_mtime_ns:
+        return None
+    try:
+        entries = tuple(
+            IndexEntry(e["id"], e["title"], e["updated"], e["source"], e["offset"], e["length"])
+            for e in data["sections"]
+        )
+    except (KeyError, TypeError):
+        return None
+    return Index(size=st.st_size, mtime_ns=st.st_mtime_ns, legacy=bool(data.get("legacy")), entries=entries)
+
+
+@dataclass(slots=True)
+class StagedWrite:
+    """已写入临时文件、尚未替换的领域文件；commit 原子替换并写索引，discard 丢弃。
+
+    commit(keep_backup=True) 先以硬链接保留原文件：多个领域文件须一并生效时，后续步骤失败可由
+    revert 撤回已替换的文件，全部成功后 drop_backup 删除备份。
+    """
+
+    target: Path
+    tmp: Path
+    entries: tuple[IndexEntry, ...]
+    backup: Path | None = None
+    committed: bool = False
+
+    def commit(self, keep_backup: bool = False) -> None:
+        if keep_backup and self.target.exists():
+            backup = self.target.with_name(f".{self.target.name}.bak")
+            backup.unlink(missing_ok=True)
+            try:
+                os.link(self.target, backup)
+            except OSError:
+                shutil.copy2(self.target, backup)  # 不支持硬链接的文件系统
+            self.backup = backup
+        os.replace(self.tmp, self.target)
+        self.committed = True
+        _write_index(self.target, self.entries, legacy=False, st=self.target.stat())
+
+    def discard(self) -> None:
+        self.tmp.unlink(missing_ok=True)
+
+    def revert(self) -> None:
+        """撤回：未替换时丢弃临时文件；已替换时恢复原文件（原本不存在则删除），并删除新写的索引。"""
+        if self.committed:
+            if self.backup is not None:
+                os.replace(self.backup, self.target)
+            else:
+                self.target.unlink(missing_ok=True)
+            self.target.with_name(INDEX_FILE).unlink(missing_ok=True)
+            self.committed = False
+        else:
+            self.discard()
+            self.drop_backup()
+        self.backup = None
+
+    def drop_backup(self) -> None:
+        if self.backup is not None:
+            self.backup.unlink(missing_ok=True)
+            self.backup = None
+
+
+class SotStore:
+    """docs/spec/specs 下按领域组织的结构化 Source of Truth。"""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+
+    def path(self, domain: str) -> Path:
+        return self.root / domain / SPEC_FILE
+
+    def domains(self) -> list[str]:
+        try:
+            entries = os.scandir(self.root)
+        except OSError:
+            return []
+        return sorted(e.name for e in entries if e.is_dir() and (Path(e.path) / SPEC_FILE).is_file())
+
+    def load(self, domain: str) -> Document:
+        """读取并解析整个领域文件（合并与压缩用）；文件不存在时返回只有标题的空文档。"""
+        try:
+            text = self.path(domain).read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return Document(preamble=f"# {domain}\n")
+        return load_text(text, domain)
+
+    def stage(self, domain: str, doc: Document) -> StagedWrite:
+        """渲染文档并写入同目录临时文件；小节偏移由渲染结果直接得出，无需再读盘。"""
+        target = self.path(domain)
+        text = doc.render()
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(f".{target.name}.tmp")
+        tmp.write_text(text, encoding="utf-8")
+        return StagedWrite(target=target, tmp=tmp, entries=_entries(parse_document(text)))
+
+    def save(self, domain: str, doc: Document) -> None:
+        staged = self.stage(domain, doc)
+        try:
+            staged.commit()
+        except BaseException:
+            staged.discard()
+            raise
+
+    def index(self, domain: str) -> Index | None:
+        """返回有效索引；过期或缺失时扫描一次文件并重写。领域不存在时返回 None。"""
+        path = self.path(domain)
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return None
+        index = _read_index(path, st)
+        if index is not None:
+            return index
+        text = path.read_text(encoding="utf-8")
+        return _write_index(path, _entries(parse_document(text)), is_legacy(text), st)
+
+    def read(self, domain: str, req_id: str) -> str | None:
+        """按索引偏移只读取一个需求小节。"""
+        index = self.index(domain)
+        entry = index.find(req_id) if index is not None else None
+        if entry is None:
+            return None
+        with open(self.path(domain), "rb") as f:
+            f.seek(entry.offset)
+            return f.read(entry.length).decode("utf-8")
@@ -0,0 +1,219 @@
+"""
+workspace 模式：一次 spec-coding init 处理多个目标仓库。
+
+模板只打开一次；每种 (backend_dir, frontend_dir, app_package) 组合在内存中只渲染一次，
+再由进程池把各目标的写入并行分发出去，最后输出每个仓库的版本变化与耗时汇总表。
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import NoReturn
+
+from spec_cli.bundle import MemoryTemplates, TemplateSource
+from spec_cli.cli import _get_version
+from spec_cli.commands.init import Combo, _detect_install, _install_templates, _open_templates
+from spec_cli.render import from_placeholders
+
+# 工作进程内的已渲染模板集，由 _init_worker 在进程启动时装入一次
+_RENDERED: dict[Combo, MemoryTemplates] = {}
+
+
+def _substitutes(name: str) -> bool:
+    """与 _install_templates 一致：docs/ 与 mcp.json 原样复制，其余框架文件替换占位符。"""
+    return not (name.startswith("docs/") or name == "cursor/mcp.json")
+
+
+def _template_names(templates: TemplateSource) -> list[str]:
+    names = [name for top in ("claude", "cursor", "docs") for name in templates.files(top)]
+    if templates.is_file("CLAUDE.md"):
+        names.append("CLAUDE.md")
+    return sorted(names)
+
+
+def render_sets(templates: TemplateSource, combos: list[Combo]) -> dict[Combo, dict[str, bytes]]:
+    """按组合渲染整套模板；原样复制的条目只读一次，各组合共享同一份内容。"""
+    names = _template_names(templates)
+    raw = {name: b"".join(templates.chunks(name)) for name in names if not _substitutes(name)}
+    rendered: dict[Combo, dict[str, bytes]] = {}
+    for combo in combos:
+        renderer = from_placeholders(*combo)
+        entries = dict(raw)
+        for name in names:
+            if _substitutes(name):
+                entries[name] = b"".join(renderer.iter_chunks(templates.chunks(name)))
+        rendered[combo] = entries
+    return rendered
+
+
+def load_targets(args: argparse.Namespace) -> list[tuple[Path, Combo]]:
+    """汇总命令行目标（含 glob 展开）与清单文件中的目标，按出现顺序去重。"""
+    default: Combo = (args.backend_dir, args.frontend_dir, args.app_package)
+    found: list[tuple[Path, Combo]] = []
+
+    for pattern in args.targets:
+        if any(ch in pattern for ch in "*?["):
+            found.extend((Path(p), default) for p in sorted(glob.glob(pattern)) if Path(p).is_dir())
+        else:
+            found.append((Path(pattern), default))
+
+    if args.targets_from:
+        manifest = Path(args.targets_from)
+        base = manifest.resolve().parent
+        try:
+            text = manifest.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError) as e:
+            _manifest_error(manifest, f"无法读取: {e}")
+        if manifest.suffix == ".json":
+            found.extend((base / target, combo) for target, combo in _json_targets(manifest, text, default))
+        else:
+            for line in text.splitlines():
+                line = line.strip()
+                if line and not line.startswith("#"):
+                    found.append((base / line, default))
+
+    seen: set[Path] = set()
+    targets: list[tuple[Path, Combo]] = []
+    for path, combo in found:
+        resolved = path.resolve()
+        if resolved not in seen:
+            seen.add(resolved)
+            targets.append((resolved, combo))
+    return targets
+
+
+def _manifest_error(manifest: Path, message: str) -> NoReturn:
+    print(f"错误：目标清单 {manifest} {message}", file=sys.stderr)
+    sys.exit(1)
+
+
+def _json_targets(manifest: Path, text: str, default: Combo) -> list[tuple[str, Combo]]:
+    """解析 JSON 清单；列表元素为目录字符串，或 {"target": ..., "backend_dir": ..., "frontend_dir": ..., "app_package": ...}。"""
+    try:
+        items = json.loads(text)
+    except json.JSONDecodeError as e:
+        _manifest_error(manifest, f"不是合法的 JSON: {e}")
+    if not isinstance(items, list):
+        _manifest_error(manifest, "应为 JSON 列表")
+    targets: list[tuple[str, Combo]] = []
+    for index, item in enumerate(items):
+        if isinstance(item, str) and item:
+            targets.append((item, default))
+            continue
+        if not isinstance(item, dict):
+            _manifest_error(manifest, f"第 {index} 项应为目录字符串或对象")
+        target = item.get("target")
+        if not isinstance(target, str) or not target:
+            _manifest_error(manifest, f'第 {index} 项缺少 "target"（目录字符串）')
+        combo = (
+            item.get("backend_dir", default[0]),
+            item.get("frontend_dir", default[1]),
+            item.get("app_package", default[2]),
+        )
+        if not all(isinstance(value, str) and value for value in combo):
+            _manifest_error(manifest, f"第 {index} 项的 backend_dir / frontend_dir / app_package 应为非空字符串")
+        targets.append((target, combo))
+    return targets
+
+
+def _init_worker(rendered: dict[Combo, dict[str, bytes]]) -> None:
+    global _RENDERED
+    _RENDERED = {combo: MemoryTemplates(entries) for combo, entries in rendered.items()}
+
+
+def _init_one(target: str, combo: Combo, docs_only: bool, force: bool, jobs: int) -> dict:
+    """在工作进程中初始化/更新单个目标，返回汇总行所需信息；异常只影响本目标。"""
+    start = time.perf_counter()
+    result: dict = {"target": target, "from": None, "mode": "", "report": None, "error": None}
+    path = Path(target)
+    try:
+        if not path.is_dir():
+            raise NotADirectoryError(f"目标不是目录或不存在: {target}")
+        installed_version, is_update = _detect_install(path)
+        if force:
+            is_update = False  # 强制模式视为全新安装
+        result["from"] = installed_version
+        result["mode"] = "更新" if is_update else "初始化"
+        result["report"] = _install_templates(
+            _RENDERED[combo],
+            path,
+            *combo,
+            docs_only=docs_only,
+            skip_skills=docs_only,
+            is_update=is_update,
+            jobs=jobs,
+            prerendered=True,
+        )
+    except Exception as e:
+        result["error"] = str(e)
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+
+def _display_width(text: str) -> int:
+    """终端显示宽度：中文等全角字符按 2 列计。"""
+    return sum(2 if unicodedata.east_asian_width(ch) in "WF" else 1 for ch in text)
+
+
+def _pad(text: str, width: int) -> str:
+    return text + " " * (width - _display_width(text))
+
+
+def _print_summary(results: list[dict], elapsed: float) -> None:
+    version = _get_version()
+    header = ("目标", "版本", "模式", "新增", "变更", "跳过", "删除", "失败", "耗时")
+    rows = []
+    for r in results:
+        report = r["report"] or {}
+        counts = [str(len(report.get(k, []))) for k in ("added", "changed", "skipped", "removed", "failed")]
+        transition = f"{r['from'] or '-'} → {version}" if r["error"] is None else "错误"
+        rows.append((r["target"], transition, r["mode"] or "-", *counts, f"{r['seconds'] * 1000:.0f}ms"))
+    widths = [max(_display_width(row[i]) for row in [header, *rows]) for i in range(len(header))]
+    for row in [header, tuple("-" * w for w in widths), *rows]:
+        print("  ".join(_pad(cell, widths[i]) for i, cell in enumerate(row)).rstrip())
+    failed = [r for r in results if r["error"] or (r["report"] and r["report"]["failed"])]
+    print()
+    print(f"共 {len(results)} 个目标，成功 {len(results) - len(failed)}，失败 {len(failed)}，总耗时 {elapsed:.2f}s")
+    for r in failed:
+        if r["error"]:
+            print(f"  ! {r['target']}: {r['error']}", file=sys.stderr)
+        for entry in (r["report"] or {}).get("failed", []):
+            print(f"  ! {r['target']}: {entry}", file=sys.stderr)
+
+
+def run_workspace(args: argparse.Namespace) -> None:
+    """workspace 模式入口（由 init 子命令调用）。"""
+    start = time.perf_counter()
+    targets = load_targets(args)
+    if not targets:
+        print("错误：未找到任何目标目录。", file=sys.stderr)
+        sys.exit(1)
+
+    combos = sorted({combo for _, combo in targets})
+    templates = _open_templates()
+    try:
+        rendered = render_sets(templates, combos)
+    finally:
+        templates.close()
+
+    workers = max(1, min(args.workers or os.cpu_count() or 1, len(targets)))
+    # 每个进程内的文件线程数默认取小值，避免进程数 × 线程数过多
+    jobs = args.jobs or 4
+    print(f"workspace 模式：{len(targets)} 个目标，{len(combos)} 种模板组合，{workers} 个进程")
+    print()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(rendered,)) as pool:
+        futures = [
+            pool.submit(_init_one, str(path), combo, args.docs_only, args.force, jobs)
+            for path, combo in targets
+        ]
+        results = [future.result() for future in futures]
+
+    _print_summary(results, time.perf_counter() - start)
+    if any(r["error"] or r["report"]["failed"] for r in results):
+        sys.exit(1)